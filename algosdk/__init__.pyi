@@ -45,6 +45,7 @@ __all__ = [
     "abi",
     "account",
     "algod",
+    "async_algod",
     "auction",
     "check_abi_transaction_type",
     "constants",
@@ -1,6 +1,12 @@
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from typing import Callable, Iterator, List, Optional
+import os
+import time
+
+from nacl.bindings import crypto_sign_seed_keypair
 from nacl.signing import SigningKey
 import base64
-from . import encoding, constants
+from . import encoding, constants, mnemonic
 
 
 def generate_account():
@@ -30,3 +36,222 @@ def address_from_private_key(private_key):
     pk = base64.b64decode(private_key)[constants.key_len_bytes :]
     address = encoding.encode_address(pk)
     return address
+
+
+# Base32 digit values; an address is the base32 encoding of its 36 bytes
+# (public key + checksum) without padding.
+_B32_VALUES = {c: i for i, c in enumerate("ABCDEFGHIJKLMNOPQRSTUVWXYZ234567")}
+_ADDRESS_BYTES = constants.key_len_bytes + constants.check_sum_len_bytes
+
+
+class VanityAccount:
+    """
+    An account whose address matched a vanity search.
+
+    Args:
+        private_key (str): private key of the account in base64
+        address (str): address of the account
+        mnemonic (str): mnemonic of the private key
+    """
+
+    def __init__(self, private_key: str, address: str, mnemonic: str) -> None:
+        self.private_key = private_key
+        self.address = address
+        self.mnemonic = mnemonic
+
+
+class VanitySearchStats:
+    """
+    Progress of a vanity search.
+
+    Args:
+        attempts (int): keypairs generated so far
+        matches (int): matching accounts found so far
+        elapsed (float): seconds since the search started
+        expected_attempts (float): expected keypairs per match
+
+    Attributes:
+        rate (float): keypairs generated per second
+        expected_seconds (float): expected seconds to the next match at the
+            current rate
+    """
+
+    def __init__(
+        self,
+        attempts: int,
+        matches: int,
+        elapsed: float,
+        expected_attempts: float,
+    ) -> None:
+        self.attempts = attempts
+        self.matches = matches
+        self.elapsed = elapsed
+        self.expected_attempts = expected_attempts
+        self.rate = attempts / elapsed if elapsed > 0 else 0.0
+        self.expected_seconds = (
+            expected_attempts / self.rate if self.rate else float("inf")
+        )
+
+
+def _check_vanity_pattern(pattern: str) -> None:
+    for c in pattern:
+        if c not in _B32_VALUES:
+            raise ValueError(
+                "{!r} is not a base32 address character".format(c)
+            )
+
+
+def vanity_expected_attempts(prefix: str = "", suffix: str = "") -> float:
+    """
+    Return the expected number of keypairs generated per address matching
+    the prefix and suffix.
+
+    Args:
+        prefix (str, optional): required start of the address
+        suffix (str, optional): required end of the address
+
+    Returns:
+        float: expected keypairs per match
+    """
+    _check_vanity_pattern(prefix + suffix)
+    if len(prefix) + len(suffix) > len(encoding.encode_address(bytes(32))):
+        raise ValueError("pattern is longer than an address")
+    attempts = 32.0 ** (len(prefix) + len(suffix))
+    if suffix:
+        # the last character only carries the final 3 bits of the checksum
+        if _B32_VALUES[suffix[-1]] % 4:
+            raise ValueError("no address ends with {!r}".format(suffix[-1]))
+        attempts /= 4
+    return attempts
+
+
+def _vanity_matcher(prefix: str, suffix: str):
+    """
+    Return a function matching a public key against the pattern, encoding
+    only the bytes the pattern covers instead of the whole address.
+    """
+    prefix_bytes = (5 * len(prefix) + 7) // 8
+    prefix_ascii = prefix.encode()
+    suffix_ascii = suffix.encode()
+    # base32 works in 5-byte blocks; the 36 address bytes end in a 1-byte
+    # partial block (2 characters), preceded by whole 8-character blocks
+    tail_blocks = max(0, (len(suffix) - 2 + 7) // 8)
+    tail_start = _ADDRESS_BYTES - 1 - 5 * tail_blocks
+    b32encode = base64.b32encode
+
+    def matches(public_key: bytes) -> bool:
+        if prefix and not b32encode(public_key[:prefix_bytes]).startswith(
+            prefix_ascii
+        ):
+            return False
+        if suffix:
+            tail = (public_key + encoding._checksum(public_key))[tail_start:]
+            if not b32encode(tail).rstrip(b"=").endswith(suffix_ascii):
+                return False
+        return True
+
+    return matches
+
+
+def _vanity_batch(prefix: str, suffix: str, batch_size: int) -> List[bytes]:
+    """Generate batch_size keypairs and return the seeds that match."""
+    matches = _vanity_matcher(prefix, suffix)
+    found = []
+    for _ in range(batch_size):
+        seed = os.urandom(constants.key_len_bytes)
+        public_key, _ = crypto_sign_seed_keypair(seed)
+        if matches(public_key):
+            found.append(seed)
+    return found
+
+
+def _vanity_account(seed: bytes) -> VanityAccount:
+    public_key, secret_key = crypto_sign_seed_keypair(seed)
+    private_key = base64.b64encode(secret_key).decode()
+    return VanityAccount(
+        private_key,
+        encoding.encode_address(public_key),
+        mnemonic.from_private_key(private_key),
+    )
+
+
+def generate_vanity_accounts(
+    prefix: str = "",
+    suffix: str = "",
+    count: Optional[int] = 1,
+    processes: Optional[int] = None,
+    batch_size: int = 10000,
+    progress: Optional[Callable[[VanitySearchStats], None]] = None,
+) -> Iterator[VanityAccount]:
+    """
+    Generate accounts whose addresses start with prefix and end with suffix,
+    yielding each match as soon as it is found.
+
+    Key generation runs in batches on a process pool. Each additional
+    character in the pattern makes a match about 32 times rarer; see
+    `vanity_expected_attempts`.
+
+    Args:
+        prefix (str, optional): required start of the address
+        suffix (str, optional): required end of the address
+        count (int, optional): number of accounts to find; None searches
+            until the caller stops iterating
+        processes (int, optional): number of worker processes; defaults to
+            the number of CPUs, and 1 searches in the calling process
+        batch_size (int, optional): keypairs generated per task
+        progress (function, optional): called with a VanitySearchStats after
+            every batch
+
+    Returns:
+        Iterator[VanityAccount]: the matching accounts
+    """
+    expected = vanity_expected_attempts(prefix, suffix)
+    if batch_size < 1:
+        raise ValueError("batch_size must be positive")
+    processes = processes or os.cpu_count() or 1
+    start = time.monotonic()
+    attempts = 0
+    found = 0
+
+    def report() -> None:
+        if progress:
+            elapsed = time.monotonic() - start
+            progress(VanitySearchStats(attempts, found, elapsed, expected))
+
+    if processes == 1:
+        while count is None or found < count:
+            seeds = _vanity_batch(prefix, suffix, batch_size)
+            attempts += batch_size
+            report()
+            for seed in seeds:
+                if count is not None and found == count:
+                    break
+                found += 1
+                yield _vanity_account(seed)
+        return
+
+    with ProcessPoolExecutor(processes) as executor:
+        pending = {
+            executor.submit(_vanity_batch, prefix, suffix, batch_size)
+            for _ in range(processes)
+        }
+        try:
+            while count is None or found < count:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    attempts += batch_size
+                    report()
+                    for seed in future.result():
+                        if count is not None and found == count:
+                            break
+                        found += 1
+                        yield _vanity_account(seed)
+                    if count is None or found < count:
+                        pending.add(
+                            executor.submit(
+                                _vanity_batch, prefix, suffix, batch_size
+                            )
+                        )
+        finally:
+            for future in pending:
+                future.cancel()
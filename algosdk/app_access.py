@@ -19,6 +19,7 @@ def translate_to_resource_references(
     boxes: Optional[List[Tuple[int, bytes]]] = None,
     holdings: Optional[List[Tuple[int, str]]] = None,
     locals: Optional[List[Tuple[int, str]]] = None,
+    existing: Optional[List["ResourceReference"]] = None,
 ) -> List["ResourceReference"]:
     """
     Convert accounts, apps, assets, boxes, holdings, locals into list of ResourceReference
@@ -34,8 +35,10 @@ def translate_to_resource_references(
             zero (empty) address means sender
         locals (list[int, str], optional): lists of tuples specifying the local states to be accessed during evaluation of the application;
             zero (empty) address means sender
+        existing (list[ResourceReference], optional): an access list to extend; its entries are
+            kept in place and reused by the new references
     """
-    access: List["ResourceReference"] = []
+    access: List["ResourceReference"] = list(existing or [])
 
     def ensure(target: "ResourceReference") -> int:
         for idx, a in enumerate(access):
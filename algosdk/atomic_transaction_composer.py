@@ -1,22 +1,41 @@
 from abc import ABC, abstractmethod
+import asyncio
 import base64
+from collections import OrderedDict
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Executor,
+    Future,
+    ThreadPoolExecutor,
+    wait,
+)
 import copy
 from enum import IntEnum
+import threading
+import time
 from typing import (
     Any,
+    Callable,
     Dict,
+    Iterable,
     List,
     Optional,
+    Set,
     Tuple,
     TypeVar,
     Union,
     cast,
 )
 
-from algosdk import abi, error, transaction
+from algosdk import abi, constants, error, transaction
 from algosdk.transaction import GenericSignedTransaction
 from algosdk.abi.address_type import AddressType
-from algosdk.v2client import algod, models
+from algosdk.app_access import (
+    ResourceReference,
+    translate_to_resource_references,
+)
+from algosdk.box_reference import BoxReference
+from algosdk.v2client import algod, async_algod, models
 
 
 # The first four bytes of an ABI method call return must have this hash
@@ -81,8 +100,16 @@ class AtomicTransactionComposerStatus(IntEnum):
 class TransactionSigner(ABC):
     """
     Represents an object which can sign transactions from an atomic transaction group.
+
+    Attributes:
+        signs_across_groups (bool): whether `sign_transactions` accepts the
+            transactions of several atomic groups in one txn_group, signing
+            each transaction on its own. Signers that check the group, such
+            as wallets, leave this False; see BatchAtomicTransactionComposer.
     """
 
+    signs_across_groups = False
+
     def __init__(self) -> None:
         pass
 
@@ -92,6 +119,18 @@ class TransactionSigner(ABC):
     ) -> List[GenericSignedTransaction]:
         pass
 
+    async def sign_transactions_async(
+        self, txn_group: List[transaction.Transaction], indexes: List[int]
+    ) -> List[GenericSignedTransaction]:
+        """
+        Asynchronous counterpart of `sign_transactions`. By default the
+        synchronous method runs in a worker thread; signers with a natively
+        asynchronous backend override this.
+        """
+        return await asyncio.to_thread(
+            self.sign_transactions, txn_group, indexes
+        )
+
 
 class AccountTransactionSigner(TransactionSigner):
     """
@@ -102,6 +141,8 @@ class AccountTransactionSigner(TransactionSigner):
         private_key (str): private key of signing account
     """
 
+    signs_across_groups = True
+
     def __init__(self, private_key: str) -> None:
         super().__init__()
         self.private_key = private_key
@@ -132,10 +173,15 @@ class LogicSigTransactionSigner(TransactionSigner):
     Represents a Transaction Signer for a LogicSig that can sign transactions from an
     atomic transaction group.
 
+    The signed transactions share the account's LogicSig, whose encoding and
+    address are cached, so a batch encodes the program only once.
+
     Args:
         lsig (LogicSigAccount): LogicSig account
     """
 
+    signs_across_groups = True
+
     def __init__(self, lsig: transaction.LogicSigAccount) -> None:
         super().__init__()
         self.lsig = lsig
@@ -171,6 +217,8 @@ class MultisigTransactionSigner(TransactionSigner):
         sks (str): private keys of multisig
     """
 
+    signs_across_groups = True
+
     def __init__(self, msig: transaction.Multisig, sks: List[str]) -> None:
         super().__init__()
         self.msig = msig
@@ -200,6 +248,8 @@ class MultisigTransactionSigner(TransactionSigner):
 
 
 class EmptySigner(TransactionSigner):
+    signs_across_groups = True
+
     def __init__(self) -> None:
         super().__init__()
 
@@ -260,6 +310,56 @@ class ABIResult:
         self.method = method
 
 
+class LazyABIResult(ABIResult):
+    """
+    An ABIResult whose raw_value, return_value and decode_error are decoded
+    from the transaction's logs when first read, for callers that read few
+    of a group's results.
+    """
+
+    def __init__(
+        self,
+        tx_id: str,
+        tx_info: dict,
+        method: abi.Method,
+        parse: Callable[[abi.Method, str, Dict[str, Any]], ABIResult],
+    ) -> None:
+        self.tx_id = tx_id
+        self.tx_info = tx_info
+        self.method = method
+        self._parse = parse
+        self._decoded: Optional[ABIResult] = None
+
+    def _decode(self) -> ABIResult:
+        if self._decoded is None:
+            self._decoded = self._parse(self.method, self.tx_id, self.tx_info)
+        return self._decoded
+
+    @property  # type: ignore[override]
+    def raw_value(self) -> bytes:
+        return self._decode().raw_value
+
+    @raw_value.setter
+    def raw_value(self, value: bytes) -> None:
+        self._decode().raw_value = value
+
+    @property  # type: ignore[override]
+    def return_value(self) -> Any:
+        return self._decode().return_value
+
+    @return_value.setter
+    def return_value(self, value: Any) -> None:
+        self._decode().return_value = value
+
+    @property  # type: ignore[override]
+    def decode_error(self) -> Optional[Exception]:
+        return self._decode().decode_error
+
+    @decode_error.setter
+    def decode_error(self, value: Optional[Exception]) -> None:
+        self._decode().decode_error = value
+
+
 class AtomicTransactionResponse:
     def __init__(
         self, confirmed_round: int, tx_ids: List[str], results: List[ABIResult]
@@ -370,6 +470,475 @@ class SimulateAtomicTransactionResponse:
         self.fees_paid = fees_paid
 
 
+class SimulationCache:
+    """
+    Remembers what simulating a group found, per shape of group, so groups
+    of the same shape skip the simulate round trip. Used by `plan_fees` and
+    `populate_resources`.
+
+    A group's shape is its network's genesis hash and, for each of its
+    transactions, its type and, for app calls, the app id, on-complete, programs, first app arg (the method
+    selector of an ABI call), the lengths of the other app args and the
+    number of references of each kind.
+
+    Args:
+        ttl (float, optional): seconds an entry stays valid; defaults to 60
+        maxsize (int, optional): the most entries kept, evicting the least
+            recently used; defaults to 1024
+    """
+
+    def __init__(self, ttl: float = 60.0, maxsize: int = 1024) -> None:
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[Tuple[Any, ...], Tuple[float, Any]]" = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+
+    def get(self, key: Tuple[Any, ...]) -> Optional[Any]:
+        """
+        Return the value cached for a shape, if it has not expired.
+
+        Args:
+            key (tuple): group shape
+
+        Returns:
+            the cached value, or None
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires, value = entry
+            if expires <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def put(self, key: Tuple[Any, ...], value: Any) -> None:
+        """
+        Cache a value for a shape.
+
+        Args:
+            key (tuple): group shape
+            value: value to cache
+        """
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._entries.clear()
+
+
+class _Resources:
+    """
+    References to add to an app call, in the terms of
+    translate_to_resource_references.
+    """
+
+    def __init__(
+        self,
+        accounts: Tuple[str, ...] = (),
+        apps: Tuple[int, ...] = (),
+        assets: Tuple[int, ...] = (),
+        boxes: Tuple[Tuple[int, bytes], ...] = (),
+        holdings: Tuple[Tuple[int, str], ...] = (),
+        locals: Tuple[Tuple[int, str], ...] = (),
+    ) -> None:
+        self.accounts = accounts
+        self.apps = apps
+        self.assets = assets
+        self.boxes = boxes
+        self.holdings = holdings
+        self.locals = locals
+
+    @staticmethod
+    def from_unnamed(unnamed: Dict[str, Any]) -> "_Resources":
+        """Read a simulate unnamed-resources-accessed object."""
+        boxes = tuple(
+            (b.get("app", 0), base64.b64decode(b.get("name", "")))
+            for b in unnamed.get("boxes", [])
+        )
+        # each extra reference is an empty box, adding to the I/O budget
+        boxes += ((0, b""),) * unnamed.get("extra-box-refs", 0)
+        return _Resources(
+            accounts=tuple(unnamed.get("accounts", [])),
+            apps=tuple(unnamed.get("apps", [])),
+            assets=tuple(unnamed.get("assets", [])),
+            boxes=boxes,
+            holdings=tuple(
+                (h["asset"], h["account"])
+                for h in unnamed.get("asset-holdings", [])
+            ),
+            locals=tuple(
+                (lo["app"], lo["account"])
+                for lo in unnamed.get("app-locals", [])
+            ),
+        )
+
+    def units(self) -> List["_Resources"]:
+        """
+        Split into single resources, those with the most constraints first.
+        """
+        return (
+            [_Resources(holdings=(h,)) for h in self.holdings]
+            + [_Resources(locals=(lo,)) for lo in self.locals]
+            + [_Resources(boxes=(b,)) for b in self.boxes]
+            + [_Resources(accounts=(a,)) for a in self.accounts]
+            + [_Resources(assets=(a,)) for a in self.assets]
+            + [_Resources(apps=(a,)) for a in self.apps]
+        )
+
+    def merged(self, other: "_Resources") -> "_Resources":
+        return _Resources(
+            self.accounts + other.accounts,
+            self.apps + other.apps,
+            self.assets + other.assets,
+            self.boxes + other.boxes,
+            self.holdings + other.holdings,
+            self.locals + other.locals,
+        )
+
+
+class MethodCallTemplate:
+    """
+    A smart contract method call prepared once and bound to new arguments
+    many times. The fields besides the arguments are validated, and the
+    selector, the codec of each argument and the packing of arguments past
+    the fifteenth into a tuple are resolved, when the template is made;
+    binding only checks and encodes the arguments and copies a prepared
+    transaction.
+
+    Add a call to a composer with AtomicTransactionComposer.add_template_call,
+    or build the transactions with `bind`. The arguments are the same as
+    add_method_call's, without method_args.
+
+    Args:
+        app_id (int): application id of app that the method is being invoked on
+        method (Method): ABI method object with initialized arguments and return types
+        sender (str): address of the sender
+        sp (SuggestedParams): suggested params from algod
+        signer (TransactionSigner): signer that will sign the transactions
+        on_complete (OnComplete, optional): intEnum representing what app should do on completion
+            and if blank, it will default to a NoOp call
+        local_schema (StateSchema, optional): restricts what can be stored by created application
+        global_schema (StateSchema, optional): restricts what can be stored by created application
+        approval_program (bytes, optional): the program to run on transaction approval
+        clear_program (bytes, optional): the program to run when state is being cleared
+        extra_pages (int, optional): additional program space for supporting larger programs
+        accounts (list[string], optional): list of additional accounts involved in call
+        foreign_apps (list[int], optional): list of other applications (identified by index) involved in call
+        foreign_assets (list[int], optional): list of assets involved in call
+        note (bytes, optional): arbitrary optional bytes
+        lease (byte[32], optional): specifies a lease
+        rekey_to (str, optional): additionally rekey the sender to this address
+        boxes (list[(int, bytes)], optional): list of tuples specifying app id and key for boxes the app may access
+    """
+
+    def __init__(
+        self,
+        app_id: int,
+        method: abi.Method,
+        sender: str,
+        sp: transaction.SuggestedParams,
+        signer: TransactionSigner,
+        on_complete: transaction.OnComplete = transaction.OnComplete.NoOpOC,
+        local_schema: Optional[transaction.StateSchema] = None,
+        global_schema: Optional[transaction.StateSchema] = None,
+        approval_program: Optional[bytes] = None,
+        clear_program: Optional[bytes] = None,
+        extra_pages: int = 0,
+        accounts: Optional[List[str]] = None,
+        foreign_apps: Optional[List[int]] = None,
+        foreign_assets: Optional[List[int]] = None,
+        note: Optional[bytes] = None,
+        lease: Optional[bytes] = None,
+        rekey_to: Optional[str] = None,
+        boxes: Optional[List[Tuple[int, bytes]]] = None,
+    ) -> None:
+        if app_id == 0:
+            if not approval_program or not clear_program:
+                raise error.AtomicTransactionComposerError(
+                    "One of the following required parameters for application creation is missing: approvalProgram, clearProgram"
+                )
+        elif on_complete == transaction.OnComplete.UpdateApplicationOC:
+            if not approval_program or not clear_program:
+                raise error.AtomicTransactionComposerError(
+                    "One of the following required parameters for OnApplicationComplete.UpdateApplicationOC is missing: approvalProgram, clearProgram"
+                )
+            if local_schema:
+                raise error.AtomicTransactionComposerError(
+                    "One of the following application creation parameters were set on an update call: numLocalInts, numLocalByteSlices"
+                )
+        elif (
+            approval_program
+            or clear_program
+            or local_schema
+            or global_schema
+            or extra_pages
+        ):
+            raise error.AtomicTransactionComposerError(
+                "One of the following application creation parameters were set on a non-creation call: approvalProgram, clearProgram, numGlobalInts, numGlobalByteSlices, numLocalInts, numLocalByteSlices, extraPages"
+            )
+        if not isinstance(method, abi.Method):
+            raise error.AtomicTransactionComposerError(
+                "invalid Method object was passed into AtomicTransactionComposer"
+            )
+
+        self.method = method
+        self.app_id = app_id
+        self.sender = sender
+        self.sp = sp
+        self.signer = signer
+        self._accounts = accounts[:] if accounts else []
+        self._foreign_apps = foreign_apps[:] if foreign_apps else []
+        self._foreign_assets = foreign_assets[:] if foreign_assets else []
+
+        # How each argument is bound: a transaction of this type, a
+        # reference added to a foreign array, or a value encoded by type
+        self._kinds: List[Union[str, abi.ABIReferenceType]] = []
+        value_types: List[abi.ABIType] = []
+        for arg in method.args:
+            if abi.is_abi_transaction_type(arg.type):
+                self._kinds.append(cast(str, arg.type))
+            elif abi.is_abi_reference_type(arg.type):
+                if arg.type not in (
+                    abi.ABIReferenceType.ACCOUNT,
+                    abi.ABIReferenceType.ASSET,
+                    abi.ABIReferenceType.APPLICATION,
+                ):
+                    # Shouldn't reach this line unless someone accidentally
+                    # adds another foreign array arg
+                    raise error.AtomicTransactionComposerError(
+                        "cannot recognize {} as a foreign array arg".format(
+                            arg.type
+                        )
+                    )
+                self._kinds.append(cast(abi.ABIReferenceType, arg.type))
+                value_types.append(abi.UintType(8))
+            else:
+                self._kinds.append(_VALUE_ARG)
+                value_types.append(cast(abi.ABIType, arg.type))
+
+        # Compact the arguments into a single tuple, if there are more than
+        # 15 arguments excluding the selector, into the last app arg slot.
+        limit = AtomicTransactionComposer.MAX_APP_ARG_LIMIT
+        self._packed: Optional[abi.TupleType] = None
+        if len(value_types) > limit - 1:
+            self._packed = abi.TupleType(value_types[limit - 2 :])
+            value_types = value_types[: limit - 2]
+        self._codecs = value_types
+        self._selector = method.get_selector()
+
+        # Boxes are translated against the fixed foreign apps once, unless
+        # they name an app that only an argument adds
+        self._boxes = cast(
+            List[Tuple[int, Union[bytes, bytearray, str, int]]],
+            boxes[:] if boxes else [],
+        )
+        self._box_refs: Optional[List[BoxReference]] = None
+        try:
+            self._box_refs = BoxReference.translate_box_references(
+                self._boxes, self._foreign_apps, app_id
+            )
+        except error.InvalidForeignIndexError:
+            pass
+
+        # The fee is set when binding, since it may depend on the size
+        flat_sp = copy.copy(sp)
+        flat_sp.flat_fee = True
+        self._txn = transaction.ApplicationCallTxn(
+            sender=sender,
+            sp=flat_sp,
+            index=app_id,
+            on_complete=on_complete,
+            local_schema=local_schema,
+            global_schema=global_schema,
+            approval_program=approval_program,
+            clear_program=clear_program,
+            note=note,
+            lease=lease,
+            rekey_to=rekey_to,
+            extra_pages=extra_pages,
+        )
+
+    def bind(
+        self,
+        method_args: Optional[List[Union[Any, TransactionWithSigner]]] = None,
+        sp: Optional[transaction.SuggestedParams] = None,
+        note: Optional[bytes] = None,
+        lease: Optional[bytes] = None,
+    ) -> List[TransactionWithSigner]:
+        """
+        Build the method call for new arguments.
+
+        Args:
+            method_args (list[ABIValue | TransactionWithSigner], optional):
+                list of arguments to be encoded or transactions that
+                immediately precede this method call
+            sp (SuggestedParams, optional): replaces the template's
+                suggested params
+            note (bytes, optional): replaces the template's note
+            lease (byte[32], optional): replaces the template's lease
+
+        Returns:
+            List[TransactionWithSigner]: the transaction arguments followed by
+                the method call
+        """
+        if not method_args:
+            method_args = []
+        if len(self._kinds) != len(method_args):
+            raise error.AtomicTransactionComposerError(
+                "number of method arguments do not match the method signature"
+            )
+
+        accounts = self._accounts[:]
+        foreign_apps = self._foreign_apps[:]
+        foreign_assets = self._foreign_assets[:]
+        values: List[Any] = []
+        txn_list: List[TransactionWithSigner] = []
+        for kind, arg in zip(self._kinds, method_args):
+            if kind is _VALUE_ARG:
+                values.append(arg)
+            elif kind == abi.ABIReferenceType.ACCOUNT:
+                account_arg = _ADDRESS_TYPE.decode(
+                    _ADDRESS_TYPE.encode(cast(Union[str, bytes], arg))
+                )
+                values.append(
+                    populate_foreign_array(account_arg, accounts, self.sender)
+                )
+            elif kind == abi.ABIReferenceType.ASSET:
+                values.append(
+                    populate_foreign_array(int(cast(int, arg)), foreign_assets)
+                )
+            elif kind == abi.ABIReferenceType.APPLICATION:
+                values.append(
+                    populate_foreign_array(
+                        int(cast(int, arg)), foreign_apps, self.app_id
+                    )
+                )
+            else:
+                if not isinstance(arg, TransactionWithSigner):
+                    raise error.AtomicTransactionComposerError(
+                        "expected TransactionWithSigner as method argument, "
+                        f"but received: {arg}"
+                    )
+                if not abi.check_abi_transaction_type(kind, arg.txn):
+                    raise error.AtomicTransactionComposerError(
+                        f"expected Transaction type {kind} as method argument, "
+                        f"but received: {arg.txn.type}"
+                    )
+                txn_list.append(arg)
+
+        app_args = [self._selector]
+        for codec, value in zip(self._codecs, values):
+            app_args.append(codec.encode(value))
+        if self._packed is not None:
+            app_args.append(self._packed.encode(values[len(self._codecs) :]))
+
+        txn = copy.copy(self._txn)
+        txn.app_args = app_args
+        txn.accounts = accounts if accounts else None
+        txn.foreign_apps = foreign_apps if foreign_apps else None
+        txn.foreign_assets = foreign_assets if foreign_assets else None
+        if self._box_refs is not None:
+            txn.boxes = self._box_refs[:]
+        else:
+            txn.boxes = BoxReference.translate_box_references(
+                self._boxes, foreign_apps, self.app_id
+            )
+        if note is not None:
+            txn.note = txn.as_note(note)
+        if lease is not None:
+            txn.lease = txn.as_lease(lease)
+        if sp is None:
+            sp = self.sp
+        else:
+            txn.first_valid_round = sp.first
+            txn.last_valid_round = sp.last
+            txn.genesis_id = sp.gen
+            txn.genesis_hash = sp.gh
+        txn.fee = sp.fee
+        if not sp.flat_fee:
+            mf = constants.min_txn_fee if sp.min_fee is None else sp.min_fee
+            txn.fee = max(txn.estimate_size() * sp.fee, mf)
+
+        txn_list.append(TransactionWithSigner(txn, self.signer))
+        return txn_list
+
+
+# MethodCallTemplate's kind of argument encoded by its ABI type
+_VALUE_ARG = "value"
+_ADDRESS_TYPE = AddressType()
+
+
+# How long signers waiting for a worker get to start once every running
+# signer has timed out; see _wait_for_signers.
+_SIGNER_START_GRACE = 0.05
+
+
+def _wait_for_signers(
+    futures: "List[Future[List[GenericSignedTransaction]]]",
+    starts: Dict[int, float],
+    timeout: Optional[float],
+) -> Set[int]:
+    """
+    Wait for signer futures, each allowed timeout seconds from its start in
+    `starts`. Return the positions of those that timed out, including ones
+    that could not start because every running signer had timed out.
+    """
+    if timeout is None:
+        wait(futures)
+        return set()
+    timed_out: Set[int] = set()
+    # when the running signers were first all found timed out, with others
+    # still waiting for a worker
+    stalled: Optional[float] = None
+    while True:
+        now = time.monotonic()
+        waiting = [
+            k
+            for k, f in enumerate(futures)
+            if not f.done() and k not in starts
+        ]
+        running = [
+            k for k, f in enumerate(futures) if not f.done() and k in starts
+        ]
+        for k in running:
+            if starts[k] + timeout <= now:
+                timed_out.add(k)
+        live = [k for k in running if k not in timed_out]
+        if not live and not waiting:
+            return timed_out
+        if live or not running:
+            stalled = None
+        elif stalled is None:
+            stalled = now
+        elif now - stalled >= _SIGNER_START_GRACE:
+            # every worker is held by a signer that timed out
+            return timed_out | set(waiting)
+        if waiting:
+            # poll, so that signers starting on a freed worker are timed
+            # from their start
+            poll: Optional[float] = _SIGNER_START_GRACE / 5
+        else:
+            poll = None
+        if live:
+            next_deadline = min(starts[k] for k in live) + timeout - now
+            poll = next_deadline if poll is None else min(poll, next_deadline)
+        wait(
+            [futures[k] for k in live + waiting],
+            poll,
+            return_when=FIRST_COMPLETED,
+        )
+
+
 class AtomicTransactionComposer:
     """
     Constructs an atomic transaction group which may contain a combination of
@@ -415,7 +984,7 @@ class AtomicTransactionComposer:
         The new composer's status will be BUILDING, so additional transactions
         may be added to it.
         """
-        cloned = AtomicTransactionComposer()
+        cloned = type(self)()
         cloned.method_dict = copy.deepcopy(self.method_dict)
         cloned.txn_list = copy.deepcopy(self.txn_list)
         for t in cloned.txn_list:
@@ -423,6 +992,74 @@ class AtomicTransactionComposer:
         cloned.status = AtomicTransactionComposerStatus.BUILDING
         return cloned
 
+    def clone_with_params(
+        self, sp: transaction.SuggestedParams, update_fees: bool = False
+    ) -> "AtomicTransactionComposer":
+        """
+        Creates a new composer with the same transactions under new
+        suggested params, for resubmitting a group, such as after its
+        validity window passed.
+
+        Unlike `clone`, nothing is deep copied: each transaction is copied
+        shallowly, sharing its encoded arguments and references, and the
+        methods and signers are shared. The validity rounds and genesis
+        fields are set from sp, and the fees too when update_fees is set.
+        The group id is then recomputed, and the new composer's status is
+        BUILT, or SIGNED sharing the existing signatures if this composer
+        was signed and no transaction changed. Since the group id covers
+        every transaction, any change means the whole group is signed
+        again.
+
+        Args:
+            sp (SuggestedParams): the new suggested params
+            update_fees (bool, optional): also set each fee from sp, as the
+                transaction constructors do; by default fees are kept
+
+        Returns:
+            AtomicTransactionComposer: the new composer
+        """
+        cloned = type(self)()
+        cloned.method_dict = dict(self.method_dict)
+        changed = self.status < AtomicTransactionComposerStatus.BUILT
+        for t in self.txn_list:
+            txn = copy.copy(t.txn)
+            txn.first_valid_round = sp.first
+            txn.last_valid_round = sp.last
+            txn.genesis_id = sp.gen
+            txn.genesis_hash = sp.gh
+            if update_fees:
+                txn.group = None
+                txn.fee = sp.fee
+                if not sp.flat_fee:
+                    mf = (
+                        constants.min_txn_fee
+                        if sp.min_fee is None
+                        else sp.min_fee
+                    )
+                    txn.fee = max(txn.estimate_size() * sp.fee, mf)
+            changed = changed or (
+                txn.first_valid_round != t.txn.first_valid_round
+                or txn.last_valid_round != t.txn.last_valid_round
+                or txn.genesis_id != t.txn.genesis_id
+                or txn.genesis_hash != t.txn.genesis_hash
+                or txn.fee != t.txn.fee
+            )
+            txn.group = t.txn.group
+            cloned.txn_list.append(TransactionWithSigner(txn, t.signer))
+
+        if not changed:
+            cloned.tx_ids = self.tx_ids[:]
+            cloned.status = AtomicTransactionComposerStatus.BUILT
+            if self.status >= AtomicTransactionComposerStatus.SIGNED:
+                cloned.signed_txns = self.signed_txns[:]
+                cloned.status = AtomicTransactionComposerStatus.SIGNED
+            return cloned
+
+        for t in cloned.txn_list:
+            t.txn.group = None
+        cloned.build_group()
+        return cloned
+
     def add_transaction(
         self, txn_and_signer: TransactionWithSigner
     ) -> "AtomicTransactionComposer":
@@ -532,151 +1169,370 @@ class AtomicTransactionComposer:
             raise error.AtomicTransactionComposerError(
                 "AtomicTransactionComposer cannot exceed MAX_GROUP_SIZE transactions"
             )
-        if app_id == 0:
-            if not approval_program or not clear_program:
-                raise error.AtomicTransactionComposerError(
-                    "One of the following required parameters for application creation is missing: approvalProgram, clearProgram"
-                )
-        elif on_complete == transaction.OnComplete.UpdateApplicationOC:
-            if not approval_program or not clear_program:
-                raise error.AtomicTransactionComposerError(
-                    "One of the following required parameters for OnApplicationComplete.UpdateApplicationOC is missing: approvalProgram, clearProgram"
-                )
-            if local_schema:
-                raise error.AtomicTransactionComposerError(
-                    "One of the following application creation parameters were set on an update call: numLocalInts, numLocalByteSlices"
-                )
-        elif (
-            approval_program
-            or clear_program
-            or local_schema
-            or global_schema
-            or extra_pages
-        ):
-            raise error.AtomicTransactionComposerError(
-                "One of the following application creation parameters were set on a non-creation call: approvalProgram, clearProgram, numGlobalInts, numGlobalByteSlices, numLocalInts, numLocalByteSlices, extraPages"
-            )
-        if not method_args:
-            method_args = []
-        if len(method.args) != len(method_args):
-            raise error.AtomicTransactionComposerError(
-                "number of method arguments do not match the method signature"
-            )
-        if not isinstance(method, abi.Method):
-            raise error.AtomicTransactionComposerError(
-                "invalid Method object was passed into AtomicTransactionComposer"
-            )
-
-        # Initialize foreign object maps
-        accounts = accounts[:] if accounts else []
-        foreign_apps = foreign_apps[:] if foreign_apps else []
-        foreign_assets = foreign_assets[:] if foreign_assets else []
-        boxes = boxes[:] if boxes else []
-
-        app_args = []
-        raw_values: List[Any] = []
-        raw_types = []
-        txn_list = []
-
-        # First app arg must be the selector of the method
-        app_args.append(method.get_selector())
-
-        # Iterate through the method arguments and either pack a transaction
-        # or encode a ABI value.
-        for i, arg in enumerate(method.args):
-            if abi.is_abi_transaction_type(arg.type):
-                if not isinstance(method_args[i], TransactionWithSigner):
-                    raise error.AtomicTransactionComposerError(
-                        "expected TransactionWithSigner as method argument, "
-                        f"but received: {method_args[i]}"
-                    )
-
-                if not abi.check_abi_transaction_type(
-                    arg.type, method_args[i].txn
-                ):
-                    raise error.AtomicTransactionComposerError(
-                        f"expected Transaction type {arg.type} as method argument, "
-                        f"but received: {method_args[i].txn.type}"
-                    )
-                txn_list.append(method_args[i])
-            else:
-                if abi.is_abi_reference_type(arg.type):
-                    current_type: Union[str, abi.ABIType] = abi.UintType(8)
-                    if arg.type == abi.ABIReferenceType.ACCOUNT:
-                        address_type = AddressType()
-                        account_arg = address_type.decode(
-                            address_type.encode(
-                                cast(Union[str, bytes], method_args[i])
-                            )
-                        )
-                        current_arg: Any = populate_foreign_array(
-                            account_arg, accounts, sender
-                        )
-                    elif arg.type == abi.ABIReferenceType.ASSET:
-                        asset_arg = int(cast(int, method_args[i]))
-                        current_arg = populate_foreign_array(
-                            asset_arg, foreign_assets
-                        )
-                    elif arg.type == abi.ABIReferenceType.APPLICATION:
-                        app_arg = int(cast(int, method_args[i]))
-                        current_arg = populate_foreign_array(
-                            app_arg, foreign_apps, app_id
-                        )
-                    else:
-                        # Shouldn't reach this line unless someone accidentally
-                        # adds another foreign array arg
-                        raise error.AtomicTransactionComposerError(
-                            "cannot recognize {} as a foreign array arg".format(
-                                arg.type
-                            )
-                        )
-                else:
-                    current_type = arg.type
-                    current_arg = method_args[i]
-
-                raw_types.append(current_type)
-                raw_values.append(current_arg)
-
-        # Compact the arguments into a single tuple, if there are more than
-        # 15 arguments excluding the selector, into the last app arg slot.
-        if len(raw_types) > self.MAX_APP_ARG_LIMIT - 1:
-            additional_types = raw_types[self.MAX_APP_ARG_LIMIT - 2 :]
-            additional_values = raw_values[self.MAX_APP_ARG_LIMIT - 2 :]
-            raw_types = raw_types[: self.MAX_APP_ARG_LIMIT - 2]
-            raw_values = raw_values[: self.MAX_APP_ARG_LIMIT - 2]
-            raw_types.append(abi.TupleType(additional_types))
-            raw_values.append(additional_values)
-
-        for i, arg_type in enumerate(raw_types):
-            app_args.append(arg_type.encode(raw_values[i]))
-
-        # Create a method call transaction
-        method_txn = transaction.ApplicationCallTxn(
-            sender=sender,
-            sp=sp,
-            index=app_id,
+        template = MethodCallTemplate(
+            app_id,
+            method,
+            sender,
+            sp,
+            signer,
             on_complete=on_complete,
             local_schema=local_schema,
             global_schema=global_schema,
             approval_program=approval_program,
             clear_program=clear_program,
-            app_args=app_args,
+            extra_pages=extra_pages,
             accounts=accounts,
             foreign_apps=foreign_apps,
             foreign_assets=foreign_assets,
             note=note,
             lease=lease,
             rekey_to=rekey_to,
-            extra_pages=extra_pages,
             boxes=boxes,
         )
-        txn_with_signer = TransactionWithSigner(method_txn, signer)
-        txn_list.append(txn_with_signer)
+        return self.add_template_call(template, method_args)
+
+    def add_template_call(
+        self,
+        template: "MethodCallTemplate",
+        method_args: Optional[List[Union[Any, TransactionWithSigner]]] = None,
+        sp: Optional[transaction.SuggestedParams] = None,
+        note: Optional[bytes] = None,
+        lease: Optional[bytes] = None,
+    ) -> "AtomicTransactionComposer":
+        """
+        Add a call of a MethodCallTemplate to this atomic group; the same as
+        add_method_call with the template's fields, but only the arguments
+        are encoded.
 
-        self.txn_list += txn_list
-        self.method_dict[len(self.txn_list) - 1] = method
+        Args:
+            template (MethodCallTemplate): the method call to add
+            method_args (list[ABIValue | TransactionWithSigner], optional):
+                list of arguments to be encoded or transactions that
+                immediately precede this method call
+            sp (SuggestedParams, optional): replaces the template's
+                suggested params
+            note (bytes, optional): replaces the template's note
+            lease (byte[32], optional): replaces the template's lease
+        """
+        if self.status != AtomicTransactionComposerStatus.BUILDING:
+            raise error.AtomicTransactionComposerError(
+                "AtomicTransactionComposer must be in BUILDING state for a transaction to be added"
+            )
+        if (
+            len(self.txn_list) + template.method.get_txn_calls()
+            > self.MAX_GROUP_SIZE
+        ):
+            raise error.AtomicTransactionComposerError(
+                "AtomicTransactionComposer cannot exceed MAX_GROUP_SIZE transactions"
+            )
+        self.txn_list += template.bind(
+            method_args, sp=sp, note=note, lease=lease
+        )
+        self.method_dict[len(self.txn_list) - 1] = template.method
         return self
 
+    def plan_fees(
+        self,
+        client: algod.AlgodClient,
+        min_fee: Optional[int] = None,
+        fee_index: int = 0,
+        max_fee: Optional[int] = None,
+        cache: Optional[SimulationCache] = None,
+    ) -> int:
+        """
+        Set the fee of one transaction so that the group pays the fee it
+        needs, as measured by simulating the group.
+
+        The group is simulated unsigned, from a clone, and the simulated
+        group_usage is converted to microAlgos with the minimum fee,
+        rounding up. The transaction at fee_index gets that fee less the
+        fees of the other transactions.
+
+        With a cache, the usage is remembered per group shape (see
+        SimulationCache), so planning a group of the same shape again within
+        the cache's TTL makes no request. Only pass one for methods whose
+        usage does not depend on argument values beyond their lengths. The
+        cache holds usage rather than fees, so a min_fee passed in applies
+        to cached usage; without one, a cached plan uses the minimum fee
+        fetched when it was made, until it expires.
+
+        The composer's status must be BUILDING.
+
+        Args:
+            client (AlgodClient): Algod V2 client
+            min_fee (int, optional): the minimum fee, as in
+                SuggestedParams.min_fee; when not given, it is fetched from
+                suggested_params along with a simulation, and a cached plan
+                uses the minimum fee it was made with
+            fee_index (int, optional): index of the transaction whose fee is
+                set; defaults to 0
+            max_fee (int, optional): the most the transaction may pay. It is
+                also the fee it carries while simulating, so inner
+                transactions can draw on it.
+            cache (SimulationCache, optional): usage cache; by default the
+                group is always simulated
+
+        Returns:
+            int: the fee set, in microAlgos
+        """
+        self._check_fee_plan(fee_index)
+        key = self._group_shape()
+        plan = cache.get(key) if cache is not None else None
+        if plan is None:
+            sim = self._unsigned_clone(fee_index, max_fee)
+            result = AtomicTransactionComposer.simulate(
+                sim, client, self._unsigned_request()
+            )
+            if min_fee is None:
+                min_fee = client.suggested_params().min_fee
+            plan = self._fee_plan(result, min_fee)
+            if cache is not None:
+                cache.put(key, plan)
+        return self._set_planned_fee(plan, min_fee, fee_index, max_fee)
+
+    def _check_fee_plan(self, fee_index: int) -> None:
+        if self.status != AtomicTransactionComposerStatus.BUILDING:
+            raise error.AtomicTransactionComposerError(
+                "AtomicTransactionComposerStatus must be BUILDING to plan fees"
+            )
+        if not 0 <= fee_index < len(self.txn_list):
+            raise error.AtomicTransactionComposerError(
+                "fee_index {} is not in the group".format(fee_index)
+            )
+
+    @classmethod
+    def _fee_plan(
+        cls,
+        result: SimulateAtomicTransactionResponse,
+        min_fee: Optional[int],
+    ) -> Tuple[int, int]:
+        """The group usage of a simulation and the minimum fee it used."""
+        cls._check_simulation(result)
+        if result.group_usage is None:
+            raise error.AtomicTransactionComposerError(
+                "simulate response has no group-usage; the node does not "
+                "report fee usage"
+            )
+        if min_fee is None:
+            min_fee = constants.min_txn_fee
+        return result.group_usage, min_fee
+
+    def _set_planned_fee(
+        self,
+        plan: Tuple[int, int],
+        min_fee: Optional[int],
+        fee_index: int,
+        max_fee: Optional[int],
+    ) -> int:
+        usage, planned_min_fee = plan
+        if min_fee is None:
+            min_fee = planned_min_fee
+        needed = -(-usage * min_fee // 1000000)
+        others = sum(
+            t.txn.fee for i, t in enumerate(self.txn_list) if i != fee_index
+        )
+        fee = max(needed - others, 0)
+        if max_fee is not None and fee > max_fee:
+            raise error.AtomicTransactionComposerError(
+                "group needs a fee of {} but max_fee is {}".format(
+                    fee, max_fee
+                )
+            )
+        self.txn_list[fee_index].txn.fee = fee
+        return fee
+
+    def _group_shape(self) -> Tuple[Any, ...]:
+        """The shape of the group, as described by SimulationCache."""
+        key: List[Any] = [
+            self.txn_list[0].txn.genesis_hash if self.txn_list else None
+        ]
+        for t in self.txn_list:
+            txn = t.txn
+            if not isinstance(txn, transaction.ApplicationCallTxn):
+                key.append((txn.type,))
+                continue
+            args = txn.app_args or []
+            key.append(
+                (
+                    txn.type,
+                    txn.index,
+                    txn.on_complete,
+                    txn.approval_program,
+                    txn.clear_program,
+                    bytes(args[0]) if args else None,
+                    tuple(len(arg) for arg in args[1:]),
+                    len(txn.accounts or []),
+                    len(txn.foreign_apps or []),
+                    len(txn.foreign_assets or []),
+                    len(txn.boxes or []),
+                    len(txn.resources or []),
+                )
+            )
+        return tuple(key)
+
+    def populate_resources(
+        self,
+        client: algod.AlgodClient,
+        cache: Optional[SimulationCache] = None,
+    ) -> "AtomicTransactionComposer":
+        """
+        Add the resources the group's app calls access to their reference
+        arrays, as reported by simulating the group with unnamed resources
+        allowed.
+
+        Resources reported for one app call are added to it; resources
+        shared by the group are added to the first app call with room for
+        them. App calls with an access list have them added to it through
+        translate_to_resource_references; other app calls have them added
+        after their existing accounts, apps, assets and boxes, so the
+        indexes of ABI reference arguments are kept.
+
+        With a cache, the resources found are remembered per group shape
+        (see SimulationCache) and added again to groups of the same shape
+        without simulating. Only pass one for methods that access the same
+        resources whatever their argument values.
+
+        The composer's status must be BUILDING.
+
+        Args:
+            client (AlgodClient): Algod V2 client
+            cache (SimulationCache, optional): resources cache; by default
+                the group is always simulated
+
+        Returns:
+            AtomicTransactionComposer: this composer
+        """
+        self._check_populate()
+        key = self._group_shape()
+        plan = cache.get(key) if cache is not None else None
+        if plan is None:
+            sim = self._unsigned_clone()
+            result = AtomicTransactionComposer.simulate(
+                sim, client, self._unsigned_request(unnamed=True)
+            )
+            plan = self._resource_plan(result)
+            if cache is not None:
+                cache.put(key, plan)
+        self._add_planned_resources(plan)
+        return self
+
+    def _check_populate(self) -> None:
+        if self.status != AtomicTransactionComposerStatus.BUILDING:
+            raise error.AtomicTransactionComposerError(
+                "AtomicTransactionComposerStatus must be BUILDING to "
+                "populate resources"
+            )
+
+    def _add_planned_resources(self, plan: List[Optional[_Resources]]) -> None:
+        for t, resources in zip(self.txn_list, plan):
+            if resources is not None:
+                self._add_resources(
+                    cast(transaction.ApplicationCallTxn, t.txn), resources
+                )
+
+    def _resource_plan(
+        self, result: SimulateAtomicTransactionResponse
+    ) -> List[Optional[_Resources]]:
+        """Assign the unnamed resources a simulation reports to app calls."""
+        self._check_simulation(result)
+        txn_group: Dict[str, Any] = result.simulate_response["txn-groups"][0]
+
+        plan: List[Optional[_Resources]] = [None] * len(self.txn_list)
+        for i, t in enumerate(self.txn_list):
+            if isinstance(t.txn, transaction.ApplicationCallTxn):
+                plan[i] = _Resources()
+        for i, txn_result in enumerate(txn_group["txn-results"]):
+            unnamed = txn_result.get("unnamed-resources-accessed")
+            if not unnamed:
+                continue
+            resources = plan[i]
+            if resources is None:
+                raise error.AtomicTransactionComposerError(
+                    "transaction {} accesses unnamed resources but is not an "
+                    "app call".format(i)
+                )
+            resources = resources.merged(_Resources.from_unnamed(unnamed))
+            if not self._resources_fit(i, resources):
+                raise error.AtomicTransactionComposerError(
+                    "app call {} accesses more resources than it can "
+                    "reference".format(i)
+                )
+            plan[i] = resources
+
+        shared = txn_group.get("unnamed-resources-accessed")
+        for unit in _Resources.from_unnamed(shared or {}).units():
+            for i, resources in enumerate(plan):
+                if resources is None:
+                    continue
+                merged = resources.merged(unit)
+                if self._resources_fit(i, merged):
+                    plan[i] = merged
+                    break
+            else:
+                raise error.AtomicTransactionComposerError(
+                    "no app call in the group has room for the resources the "
+                    "group shares"
+                )
+        return plan
+
+    def _unsigned_clone(
+        self, fee_index: int = 0, max_fee: Optional[int] = None
+    ) -> "AtomicTransactionComposer":
+        """
+        A clone of the group to simulate without signing it, with the fee
+        at fee_index raised to max_fee when given.
+        """
+        sim = self.clone()
+        empty = EmptySigner()
+        for t in sim.txn_list:
+            t.signer = empty
+        if max_fee is not None:
+            sim.txn_list[fee_index].txn.fee = max_fee
+        return sim
+
+    @staticmethod
+    def _unsigned_request(unnamed: bool = False) -> models.SimulateRequest:
+        return models.SimulateRequest(
+            txn_groups=[],
+            allow_empty_signatures=True,
+            allow_unnamed_resources=unnamed,
+        )
+
+    @staticmethod
+    def _check_simulation(result: SimulateAtomicTransactionResponse) -> None:
+        if result.failure_message:
+            raise error.AtomicTransactionComposerError(
+                "simulation failed at {}: {}".format(
+                    result.failed_at, result.failure_message
+                )
+            )
+
+    def _resources_fit(self, index: int, resources: _Resources) -> bool:
+        txn = cast(transaction.ApplicationCallTxn, self.txn_list[index].txn)
+        if txn.resources is not None:
+            return (
+                len(_access_list(txn, resources)) <= constants.APP_ACCESS_LIMIT
+            )
+        accounts, apps, assets, boxes = _reference_arrays(txn, resources)
+        return (
+            len(accounts) <= constants.APP_ACCOUNTS_LIMIT
+            and len(accounts) + len(apps) + len(assets) + len(boxes)
+            <= constants.APP_REFERENCES_LIMIT
+        )
+
+    @staticmethod
+    def _add_resources(
+        txn: transaction.ApplicationCallTxn, resources: _Resources
+    ) -> None:
+        if txn.resources is not None:
+            txn.resources = _access_list(txn, resources)
+            return
+        accounts, apps, assets, boxes = _reference_arrays(txn, resources)
+        txn.accounts = accounts or None
+        txn.foreign_apps = apps or None
+        txn.foreign_assets = assets or None
+        txn.boxes = boxes or None
+
     def build_group(self) -> List[TransactionWithSigner]:
         """
         Finalize the transaction group and returns the finalized transactions with signers.
@@ -705,13 +1561,35 @@ class AtomicTransactionComposer:
         self.status = AtomicTransactionComposerStatus.BUILT
         return self.txn_list
 
-    def gather_signatures(self) -> List[GenericSignedTransaction]:
+    def gather_signatures(
+        self,
+        executor: Optional[Executor] = None,
+        timeout: Optional[float] = None,
+    ) -> List[GenericSignedTransaction]:
         """
         Obtain signatures for each transaction in this group. If signatures have already been obtained,
         this method will return cached versions of the signatures.
         The composer's status will be at least SIGNED after executing this method.
         An error will be thrown if signing any of the transactions fails.
 
+        By default each signer signs in turn. With an executor, or a timeout,
+        the signers run concurrently: every signer is waited for, and if any
+        fail or exceed the timeout an AtomicTransactionComposerSigningError
+        listing all the failures is raised.
+
+        Each signer's timeout runs from when it starts, so with an executor
+        that has fewer workers than there are signers, a signer waiting for
+        a worker is not timed out while the others run. If every worker is
+        held by a signer that has timed out, the signers still waiting for a
+        worker fail too.
+
+        Args:
+            executor (Executor, optional): executor to run the signers on;
+                a temporary thread pool, with a worker for each signer, is
+                used if only a timeout is given
+            timeout (float, optional): seconds each signer may take, from
+                when it starts
+
         Returns:
             List[GenericSignedTransaction]: list of signed transactions
         """
@@ -719,22 +1597,128 @@ class AtomicTransactionComposer:
             # Return cached versions of the signatures
             return self.signed_txns
 
-        stxn_list: List[Optional[GenericSignedTransaction]] = [None] * len(
-            self.txn_list
+        signer_indexes = self._signer_indexes()
+        txns = [t.txn for t in self.txn_list]
+        results: List[List[GenericSignedTransaction]] = []
+        if executor is None and timeout is None:
+            for signer, indexes in signer_indexes.items():
+                results.append(signer.sign_transactions(txns, indexes))
+            return self._merge_signatures(signer_indexes, results)
+
+        # when each signer started, by its position
+        starts: Dict[int, float] = {}
+
+        def sign(
+            position: int, signer: TransactionSigner, indexes: List[int]
+        ) -> List[GenericSignedTransaction]:
+            starts[position] = time.monotonic()
+            return signer.sign_transactions(txns, indexes)
+
+        own_executor = executor is None
+        if executor is None:
+            executor = ThreadPoolExecutor(len(signer_indexes))
+        try:
+            futures = [
+                executor.submit(sign, position, signer, indexes)
+                for position, (signer, indexes) in enumerate(
+                    signer_indexes.items()
+                )
+            ]
+            timed_out = _wait_for_signers(futures, starts, timeout)
+        finally:
+            if own_executor:
+                # don't block on signers that timed out
+                executor.shutdown(wait=False)
+        errors: List[Tuple[List[int], Exception]] = []
+        for position, (future, indexes) in enumerate(
+            zip(futures, signer_indexes.values())
+        ):
+            if position in timed_out:
+                future.cancel()
+                errors.append(
+                    (
+                        indexes,
+                        TimeoutError(
+                            "signer did not finish within {}s".format(timeout)
+                            if position in starts
+                            else "signer did not start: every worker was "
+                            "held by a signer that timed out"
+                        ),
+                    )
+                )
+            elif future.exception() is not None:
+                errors.append((indexes, cast(Exception, future.exception())))
+            else:
+                results.append(future.result())
+        if errors:
+            raise error.AtomicTransactionComposerSigningError(errors)
+        return self._merge_signatures(signer_indexes, results)
+
+    async def gather_signatures_async(
+        self, timeout: Optional[float] = None
+    ) -> List[GenericSignedTransaction]:
+        """
+        Asynchronous counterpart of `gather_signatures`: the signers'
+        `sign_transactions_async` run concurrently. If any fail or exceed the
+        timeout, an AtomicTransactionComposerSigningError listing all the
+        failures is raised.
+
+        Args:
+            timeout (float, optional): seconds each signer may take
+
+        Returns:
+            List[GenericSignedTransaction]: list of signed transactions
+        """
+        if self.status >= AtomicTransactionComposerStatus.SIGNED:
+            return self.signed_txns
+
+        signer_indexes = self._signer_indexes()
+        txns = [t.txn for t in self.txn_list]
+        outcomes = await asyncio.gather(
+            *(
+                asyncio.wait_for(
+                    signer.sign_transactions_async(txns, indexes), timeout
+                )
+                for signer, indexes in signer_indexes.items()
+            ),
+            return_exceptions=True,
         )
-        signer_indexes: Dict[TransactionSigner, List[int]] = (
-            {}
-        )  # Map a signer to a list of indices to sign
+        errors: List[Tuple[List[int], Exception]] = []
+        results: List[List[GenericSignedTransaction]] = []
+        for outcome, indexes in zip(outcomes, signer_indexes.values()):
+            if isinstance(outcome, BaseException):
+                if not isinstance(outcome, Exception):
+                    raise outcome
+                errors.append((indexes, outcome))
+            else:
+                results.append(outcome)
+        if errors:
+            raise error.AtomicTransactionComposerSigningError(errors)
+        return self._merge_signatures(signer_indexes, results)
+
+    def _signer_indexes(self) -> Dict[TransactionSigner, List[int]]:
+        """Map each signer to the indexes of the transactions it signs."""
+        signer_indexes: Dict[TransactionSigner, List[int]] = {}
         txn_list = self.build_group()
         for i, txn_with_signer in enumerate(txn_list):
             if txn_with_signer.signer not in signer_indexes:
                 signer_indexes[txn_with_signer.signer] = []
             signer_indexes[txn_with_signer.signer].append(i)
+        return signer_indexes
 
-        # Sign then merge the signed transactions in order
-        txns = [t.txn for t in self.txn_list]
-        for signer, indexes in signer_indexes.items():
-            stxns = signer.sign_transactions(txns, indexes)
+    def _merge_signatures(
+        self,
+        signer_indexes: Dict[TransactionSigner, List[int]],
+        results: List[List[GenericSignedTransaction]],
+    ) -> List[GenericSignedTransaction]:
+        """
+        Merge each signer's signed transactions in group order and mark the
+        composer SIGNED.
+        """
+        stxn_list: List[Optional[GenericSignedTransaction]] = [None] * len(
+            self.txn_list
+        )
+        for indexes, stxns in zip(signer_indexes.values(), results):
             for i, stxn in enumerate(stxns):
                 index = indexes[i]
                 stxn_list[index] = stxn
@@ -764,17 +1748,18 @@ class AtomicTransactionComposer:
         Returns:
             List[str]: list of submitted transaction IDs
         """
-        if self.status <= AtomicTransactionComposerStatus.SUBMITTED:
-            self.gather_signatures()
-        else:
-            raise error.AtomicTransactionComposerError(
-                "AtomicTransactionComposerStatus must be submitted or lower to submit a group"
-            )
-
+        self._check_submittable()
+        self.gather_signatures()
         client.send_transactions(self.signed_txns)
         self.status = AtomicTransactionComposerStatus.SUBMITTED
         return self.tx_ids
 
+    def _check_submittable(self) -> None:
+        if self.status > AtomicTransactionComposerStatus.SUBMITTED:
+            raise error.AtomicTransactionComposerError(
+                "AtomicTransactionComposerStatus must be submitted or lower to submit a group"
+            )
+
     def simulate(
         self,
         client: algod.AlgodClient,
@@ -803,11 +1788,30 @@ class AtomicTransactionComposer:
                 the same transactions as a fixed point number in millionths of
                 the minimum fee, so 2100000 means 2.1 minimum fees. Multiply it
                 by SuggestedParams.min_fee and divide by 1000000, rounding up,
-                for the fee in microAlgos that the group needs. fees_paid
+                for the fee in microAlgos that the group needs, or let
+                plan_fees set it. fees_paid
                 carries the same total as group_fees_paid split per top-level
                 transaction, in tx_ids order.
         """
+        simulation_result = cast(
+            Dict[str, Any],
+            client.simulate_transactions(self._simulate_request(request)),
+        )
+        return self._simulate_response(simulation_result)
 
+    def _simulate_request(
+        self, request: Optional[models.SimulateRequest]
+    ) -> models.SimulateRequest:
+        """Sign the group and build the simulate request for it."""
+        txn_group = self._simulate_group()
+        current_simulation_request = (
+            request if request else models.SimulateRequest(txn_groups=list())
+        )
+        current_simulation_request.txn_groups = [txn_group]
+        return current_simulation_request
+
+    def _simulate_group(self) -> models.SimulateRequestTransactionGroup:
+        """Sign the group and wrap it for a simulate request."""
         if self.status <= AtomicTransactionComposerStatus.SUBMITTED:
             self.gather_signatures()
         else:
@@ -815,22 +1819,19 @@ class AtomicTransactionComposer:
                 "AtomicTransactionComposerStatus must be submitted or "
                 "lower to simulate a group"
             )
+        return models.SimulateRequestTransactionGroup(txns=self.signed_txns)
 
-        current_simulation_request = (
-            request if request else models.SimulateRequest(txn_groups=list())
-        )
-        current_simulation_request.txn_groups = [
-            models.SimulateRequestTransactionGroup(txns=self.signed_txns)
+    def _simulate_response(
+        self, simulation_result: Dict[str, Any], group_index: int = 0
+    ) -> SimulateAtomicTransactionResponse:
+        """
+        Parse the result of this group, at `group_index` among the groups
+        of a simulate response.
+        """
+        txn_group: Dict[str, Any] = simulation_result["txn-groups"][
+            group_index
         ]
 
-        simulation_result = cast(
-            Dict[str, Any],
-            client.simulate_transactions(current_simulation_request),
-        )
-
-        # Only take the first group in the simulate response
-        txn_group: Dict[str, Any] = simulation_result["txn-groups"][0]
-
         # Parse out abi results
         txn_results = [t["txn-result"] for t in txn_group["txn-results"]]
         method_results: List[ABIResult] = []
@@ -892,7 +1893,11 @@ class AtomicTransactionComposer:
         )
 
     def execute(
-        self, client: algod.AlgodClient, wait_rounds: int
+        self,
+        client: algod.AlgodClient,
+        wait_rounds: int,
+        executor: Optional[Executor] = None,
+        lazy: bool = False,
     ) -> AtomicTransactionResponse:
         """
         Send the transaction group to the network and wait until it's committed
@@ -907,6 +1912,11 @@ class AtomicTransactionComposer:
         Args:
             client (AlgodClient): Algod V2 client
             wait_rounds (int): maximum number of rounds to wait for transaction confirmation
+            executor (Executor, optional): fetches the method call results;
+                by default they are fetched concurrently on a temporary
+                thread pool when there are several
+            lazy (bool, optional): decode each ABI return value when it is
+                first read, rather than up front
 
         Returns:
             AtomicTransactionResponse: Object with confirmed round for this transaction,
@@ -928,10 +1938,58 @@ class AtomicTransactionComposer:
         )
         self.status = AtomicTransactionComposerStatus.COMMITTED
 
-        confirmed_round = resp["confirmed-round"]
-        method_results: List[ABIResult] = []
+        tx_infos = self._method_tx_infos(client, resp, executor)
+        return self._execute_response(resp["confirmed-round"], tx_infos, lazy)
 
-        for method_index, method in self.method_dict.items():
+    def _method_tx_infos(
+        self,
+        client: algod.AlgodClient,
+        confirmed: Optional[Dict[str, Any]] = None,
+        executor: Optional[Executor] = None,
+    ) -> List[Union[Dict[str, Any], Exception]]:
+        """
+        Fetch the pending transaction info of each method call, in method
+        order, or the error fetching it. The info of the group's first
+        transaction is taken from `confirmed` when given, and the rest are
+        fetched concurrently when there are several.
+        """
+        tx_ids = [self.tx_ids[i] for i in self.method_dict]
+
+        def fetch(tx_id: str) -> Union[Dict[str, Any], Exception]:
+            if confirmed is not None and tx_id == self.tx_ids[0]:
+                return confirmed
+            try:
+                return cast(
+                    Dict[str, Any], client.pending_transaction_info(tx_id)
+                )
+            except Exception as e:
+                return e
+
+        if executor is not None:
+            return list(executor.map(fetch, tx_ids))
+        fetched = len(tx_ids) - (
+            confirmed is not None and self.tx_ids[0] in tx_ids
+        )
+        if fetched < 2:
+            return [fetch(tx_id) for tx_id in tx_ids]
+        with ThreadPoolExecutor(fetched) as pool:
+            return list(pool.map(fetch, tx_ids))
+
+    def _execute_response(
+        self,
+        confirmed_round: int,
+        tx_infos: List[Union[Dict[str, Any], Exception]],
+        lazy: bool = False,
+    ) -> AtomicTransactionResponse:
+        """
+        Build the execute response from the pending transaction info of each
+        method call, in method order, or the error fetching it. With lazy,
+        results are LazyABIResults.
+        """
+        method_results: List[ABIResult] = []
+        for (method_index, method), tx_info in zip(
+            self.method_dict.items(), tx_infos
+        ):
             tx_id = self.tx_ids[method_index]
             result: ABIResult = ABIResult(
                 tx_id=tx_id,
@@ -941,15 +1999,17 @@ class AtomicTransactionComposer:
                 tx_info={},
                 method=method,
             )
-            try:
-                tx_info = cast(
-                    Dict[str, Any], client.pending_transaction_info(tx_id)
-                )
-                result = self.parse_result(
-                    method, self.tx_ids[method_index], tx_info
+            if isinstance(tx_info, Exception):
+                result.decode_error = tx_info
+            elif lazy:
+                result = LazyABIResult(
+                    tx_id, tx_info, method, self.parse_result
                 )
-            except Exception as e:
-                result.decode_error = e
+            else:
+                try:
+                    result = self.parse_result(method, tx_id, tx_info)
+                except Exception as e:
+                    result.decode_error = e
             method_results.append(result)
 
         return AtomicTransactionResponse(
@@ -1004,3 +2064,925 @@ class AtomicTransactionComposer:
             tx_info=txn,
             method=method,
         )
+
+
+def _access_list(
+    txn: transaction.ApplicationCallTxn, resources: _Resources
+) -> List[ResourceReference]:
+    """An app call's access list, extended with resources."""
+    return translate_to_resource_references(
+        txn.index,
+        accounts=list(resources.accounts),
+        foreign_assets=list(resources.assets),
+        foreign_apps=list(resources.apps),
+        boxes=list(resources.boxes),
+        holdings=list(resources.holdings),
+        locals=list(resources.locals),
+        existing=txn.resources,
+    )
+
+
+def _reference_arrays(
+    txn: transaction.ApplicationCallTxn, resources: _Resources
+) -> Tuple[List[str], List[int], List[int], List[BoxReference]]:
+    """
+    An app call's accounts, foreign apps, foreign assets and boxes, with
+    resources appended. Holdings and locals need their account and their
+    asset or app referenced; the sender and the called app always are.
+    """
+    accounts = list(txn.accounts or [])
+    apps = list(txn.foreign_apps or [])
+    assets = list(txn.foreign_assets or [])
+    boxes = list(txn.boxes or [])
+
+    def add_account(address: str) -> None:
+        if address != txn.sender and address not in accounts:
+            accounts.append(address)
+
+    def add_app(app_id: int) -> None:
+        if app_id and app_id != txn.index and app_id not in apps:
+            apps.append(app_id)
+
+    def add_asset(asset_id: int) -> None:
+        if asset_id not in assets:
+            assets.append(asset_id)
+
+    for address in resources.accounts:
+        add_account(address)
+    for app_id in resources.apps:
+        add_app(app_id)
+    for asset_id in resources.assets:
+        add_asset(asset_id)
+    for asset_id, address in resources.holdings:
+        add_account(address)
+        add_asset(asset_id)
+    for app_id, address in resources.locals:
+        add_account(address)
+        add_app(app_id)
+    for app_id, name in resources.boxes:
+        add_app(app_id)
+        boxes.append(
+            BoxReference.translate_box_reference(
+                (app_id, name), apps, txn.index
+            )
+        )
+    return accounts, apps, assets, boxes
+
+
+def simulate_groups(
+    client: algod.AlgodClient,
+    composers: List[AtomicTransactionComposer],
+    request: Optional[models.SimulateRequest] = None,
+    chunk_size: Optional[int] = None,
+    executor: Optional[Executor] = None,
+) -> List[SimulateAtomicTransactionResponse]:
+    """
+    Simulate many transaction groups, sending several groups in each
+    `simulate_transactions` request rather than one request per composer.
+
+    Groups in the same request are evaluated in order against the same
+    ledger state, as if in one block, so one group's effects or failure can
+    show in the results of the groups after it. Pass a chunk_size of 1 where
+    groups must be simulated in isolation.
+
+    Args:
+        client (AlgodClient): Algod V2 client
+        composers (List[AtomicTransactionComposer]): composers to simulate,
+            each with status SUBMITTED or lower; they are signed as by
+            `simulate`
+        request (models.SimulateRequest, optional): simulation options for
+            every request; its transaction groups are not used, and it is
+            not modified
+        chunk_size (int, optional): the most groups to send in one request;
+            by default all of them are sent together
+        executor (Executor, optional): sends the requests of different
+            chunks concurrently; by default they are sent one at a time
+
+    Returns:
+        List[SimulateAtomicTransactionResponse]: the result of each composer,
+            in order, as its `simulate` would return. Each response's
+            simulate_response is the whole response of its request.
+    """
+    if chunk_size is not None and chunk_size < 1:
+        raise error.AtomicTransactionComposerError(
+            "chunk_size must be at least 1"
+        )
+    txn_groups = [atc._simulate_group() for atc in composers]
+    size = chunk_size or max(len(composers), 1)
+    chunks = [
+        range(start, min(start + size, len(composers)))
+        for start in range(0, len(composers), size)
+    ]
+
+    def simulate_chunk(chunk: range) -> Dict[str, Any]:
+        chunk_request = (
+            copy.copy(request)
+            if request
+            else models.SimulateRequest(txn_groups=list())
+        )
+        chunk_request.txn_groups = [txn_groups[i] for i in chunk]
+        return cast(
+            Dict[str, Any], client.simulate_transactions(chunk_request)
+        )
+
+    if executor is None:
+        results = [simulate_chunk(chunk) for chunk in chunks]
+    else:
+        results = list(executor.map(simulate_chunk, chunks))
+
+    responses = []
+    for chunk, result in zip(chunks, results):
+        for group_index, i in enumerate(chunk):
+            responses.append(
+                composers[i]._simulate_response(result, group_index)
+            )
+    return responses
+
+
+class AsyncAtomicTransactionComposer(AtomicTransactionComposer):
+    """
+    An AtomicTransactionComposer whose network operations are coroutines,
+    for use with an AsyncAlgodClient. Groups are built exactly as with
+    AtomicTransactionComposer; `submit`, `simulate` and `execute` are
+    awaitable and sign through `gather_signatures_async`, so signers with an
+    asynchronous backend are awaited concurrently.
+    """
+
+    async def submit(  # type: ignore[override]
+        self, client: async_algod.AsyncAlgodClient
+    ) -> List[str]:
+        """
+        Send the transaction group to the network, but don't wait for it to be
+        committed to a block; see `AtomicTransactionComposer.submit`.
+
+        Args:
+            client (AsyncAlgodClient): async Algod V2 client
+
+        Returns:
+            List[str]: list of submitted transaction IDs
+        """
+        self._check_submittable()
+        await self.gather_signatures_async()
+        await client.send_transactions(self.signed_txns)
+        self.status = AtomicTransactionComposerStatus.SUBMITTED
+        return self.tx_ids
+
+    async def simulate(  # type: ignore[override]
+        self,
+        client: async_algod.AsyncAlgodClient,
+        request: Optional[models.SimulateRequest] = None,
+    ) -> SimulateAtomicTransactionResponse:
+        """
+        Send the transaction group to the `simulate` endpoint and wait for
+        results; see `AtomicTransactionComposer.simulate`.
+
+        Args:
+            client (AsyncAlgodClient): async Algod V2 client
+            request (models.SimulateRequest): SimulateRequest with options in
+                simulation
+
+        Returns:
+            SimulateAtomicTransactionResponse: simulation results for this
+                transaction group
+        """
+        if self.status <= AtomicTransactionComposerStatus.SUBMITTED:
+            await self.gather_signatures_async()
+        simulation_result = cast(
+            Dict[str, Any],
+            await client.simulate_transactions(
+                self._simulate_request(request)
+            ),
+        )
+        return self._simulate_response(simulation_result)
+
+    async def plan_fees(  # type: ignore[override]
+        self,
+        client: async_algod.AsyncAlgodClient,
+        min_fee: Optional[int] = None,
+        fee_index: int = 0,
+        max_fee: Optional[int] = None,
+        cache: Optional[SimulationCache] = None,
+    ) -> int:
+        """
+        Set the fee of one transaction so that the group pays the fee it
+        needs, as measured by simulating the group; see
+        `AtomicTransactionComposer.plan_fees`.
+
+        Args:
+            client (AsyncAlgodClient): async Algod V2 client
+            min_fee (int, optional): the minimum fee, as in
+                SuggestedParams.min_fee
+            fee_index (int, optional): index of the transaction whose fee is
+                set; defaults to 0
+            max_fee (int, optional): the most the transaction may pay
+            cache (SimulationCache, optional): usage cache; by default the
+                group is always simulated
+
+        Returns:
+            int: the fee set, in microAlgos
+        """
+        self._check_fee_plan(fee_index)
+        key = self._group_shape()
+        plan = cache.get(key) if cache is not None else None
+        if plan is None:
+            sim = self._unsigned_clone(fee_index, max_fee)
+            result = await AsyncAtomicTransactionComposer.simulate(
+                cast(AsyncAtomicTransactionComposer, sim),
+                client,
+                self._unsigned_request(),
+            )
+            if min_fee is None:
+                min_fee = (await client.suggested_params()).min_fee
+            plan = self._fee_plan(result, min_fee)
+            if cache is not None:
+                cache.put(key, plan)
+        return self._set_planned_fee(plan, min_fee, fee_index, max_fee)
+
+    async def populate_resources(  # type: ignore[override]
+        self,
+        client: async_algod.AsyncAlgodClient,
+        cache: Optional[SimulationCache] = None,
+    ) -> "AsyncAtomicTransactionComposer":
+        """
+        Add the resources the group's app calls access to their reference
+        arrays, as reported by simulating the group; see
+        `AtomicTransactionComposer.populate_resources`.
+
+        Args:
+            client (AsyncAlgodClient): async Algod V2 client
+            cache (SimulationCache, optional): resources cache; by default
+                the group is always simulated
+
+        Returns:
+            AsyncAtomicTransactionComposer: this composer
+        """
+        self._check_populate()
+        key = self._group_shape()
+        plan = cache.get(key) if cache is not None else None
+        if plan is None:
+            sim = self._unsigned_clone()
+            result = await AsyncAtomicTransactionComposer.simulate(
+                cast(AsyncAtomicTransactionComposer, sim),
+                client,
+                self._unsigned_request(unnamed=True),
+            )
+            plan = self._resource_plan(result)
+            if cache is not None:
+                cache.put(key, plan)
+        self._add_planned_resources(plan)
+        return self
+
+    async def execute(  # type: ignore[override]
+        self,
+        client: async_algod.AsyncAlgodClient,
+        wait_rounds: int,
+        lazy: bool = False,
+    ) -> AtomicTransactionResponse:
+        """
+        Send the transaction group to the network and wait until it's
+        committed to a block; see `AtomicTransactionComposer.execute`. The
+        method call results are fetched concurrently.
+
+        Args:
+            client (AsyncAlgodClient): async Algod V2 client
+            wait_rounds (int): maximum number of rounds to wait for
+                transaction confirmation
+            lazy (bool, optional): decode each ABI return value when it is
+                first read, rather than up front
+
+        Returns:
+            AtomicTransactionResponse: Object with confirmed round for this
+                transaction, a list of txIDs of the submitted transactions,
+                and an array of results for each method call transaction in
+                this group.
+        """
+        if self.status > AtomicTransactionComposerStatus.SUBMITTED:
+            raise error.AtomicTransactionComposerError(
+                "AtomicTransactionComposerStatus must be submitted or lower to execute a group"
+            )
+
+        await self.submit(client)
+
+        resp = await async_algod.wait_for_confirmation(
+            client, self.tx_ids[0], wait_rounds
+        )
+        self.status = AtomicTransactionComposerStatus.COMMITTED
+
+        async def fetch(tx_id: str) -> Any:
+            if tx_id == self.tx_ids[0]:
+                return resp
+            return await client.pending_transaction_info(tx_id)
+
+        tx_infos = await asyncio.gather(
+            *(fetch(self.tx_ids[i]) for i in self.method_dict),
+            return_exceptions=True,
+        )
+        return self._execute_response(
+            resp["confirmed-round"],
+            cast(List[Union[Dict[str, Any], Exception]], tx_infos),
+            lazy,
+        )
+
+
+class _PendingGroup:
+    def __init__(
+        self,
+        composer: Optional[AtomicTransactionComposer],
+        stxns: List[GenericSignedTransaction],
+    ) -> None:
+        self.composer = composer
+        self.tx_ids = [stxn.get_txid() for stxn in stxns]
+        # the group cannot be confirmed after any of its transactions expire
+        self.last_valid = min(
+            stxn.transaction.last_valid_round for stxn in stxns
+        )
+        self.future: "Future[AtomicTransactionResponse]" = Future()
+
+
+class PipelinedSubmitter:
+    """
+    Submits a stream of transaction groups with a bounded number of groups in
+    flight, and confirms all of them from a single block watcher.
+
+    Waiting on each group with `execute` runs one confirmation loop per group,
+    each polling algod on its own. Instead, the watcher here follows the chain
+    one round at a time and resolves every outstanding group found in that
+    round's `get_block_txids`, so the number of requests per round does not
+    grow with the number of groups in flight. The watcher runs in a daemon
+    thread while any group is in flight.
+
+    Submitting blocks while `max_in_flight` groups await confirmation. Each
+    submission returns a future resolving to an AtomicTransactionResponse:
+    for composers it carries the method call results, as from `execute`, and
+    for signed groups its results are empty. A group that is not seen within
+    `wait_rounds` rounds of its submission, or by the last valid round of
+    its transactions, fails with ConfirmationTimeoutError. Method call
+    results are fetched on a separate thread pool, so fetching them does not
+    hold up the watcher.
+
+    Errors reading the chain are retried, waiting `RETRY_DELAY` seconds at
+    first and twice as long after each further failure, up to
+    `MAX_RETRY_DELAY`. Submitted groups may still be confirmed meanwhile, so
+    no group fails until a round past its last valid round has been read.
+
+    Args:
+        client (AlgodClient): Algod V2 client
+        max_in_flight (int, optional): maximum number of groups submitted but
+            not yet confirmed; defaults to 64
+        wait_rounds (int, optional): number of rounds to wait for each group;
+            defaults to 1000
+    """
+
+    RETRY_DELAY = 0.1
+    MAX_RETRY_DELAY = 5.0
+
+    def __init__(
+        self,
+        client: algod.AlgodClient,
+        max_in_flight: int = 64,
+        wait_rounds: int = 1000,
+    ) -> None:
+        if max_in_flight < 1:
+            raise error.AtomicTransactionComposerError(
+                "max_in_flight must be at least 1"
+            )
+        self.client = client
+        self.max_in_flight = max_in_flight
+        self.wait_rounds = wait_rounds
+        self._window = threading.Semaphore(max_in_flight)
+        self._lock = threading.Lock()
+        # first txid of each in flight group -> group
+        self._pending: Dict[str, _PendingGroup] = {}
+        self._watcher: Optional[threading.Thread] = None
+        self._next_round = 0
+        self._resolver = ThreadPoolExecutor(
+            thread_name_prefix="PipelinedSubmitter"
+        )
+        # resolutions of confirmed groups not yet finished
+        self._resolving: "Set[Future[None]]" = set()
+
+    def submit(
+        self,
+        group: Union[
+            AtomicTransactionComposer, List[GenericSignedTransaction]
+        ],
+    ) -> "Future[AtomicTransactionResponse]":
+        """
+        Sign and send a group, waiting first for room in the window. A group
+        already in flight is not sent again; its future is returned.
+
+        Args:
+            group (AtomicTransactionComposer or List[GenericSignedTransaction]):
+                a composer, which is signed with `gather_signatures` and
+                updated to SUBMITTED and then COMMITTED, or an already
+                signed group
+
+        Returns:
+            Future[AtomicTransactionResponse]: resolves once the group is
+                confirmed, or fails if it cannot be confirmed
+        """
+        self._window.acquire()
+        try:
+            if isinstance(group, AtomicTransactionComposer):
+                composer: Optional[AtomicTransactionComposer] = group
+                group._check_submittable()
+                stxns = group.gather_signatures()
+            else:
+                composer = None
+                stxns = group
+            pending = _PendingGroup(composer, stxns)
+            # register before sending, so the watcher cannot pass the
+            # confirming round before it knows about the group
+            registered = self._register(pending)
+        except Exception:
+            self._window.release()
+            raise
+        if registered is not pending:
+            self._window.release()
+            return registered.future
+
+        try:
+            self.client.send_transactions(stxns)
+        except Exception:
+            with self._lock:
+                if self._pending.get(pending.tx_ids[0]) is pending:
+                    del self._pending[pending.tx_ids[0]]
+            self._window.release()
+            if composer is not None:
+                composer.status = AtomicTransactionComposerStatus.SIGNED
+            raise
+        return pending.future
+
+    def submit_all(
+        self,
+        groups: Iterable[
+            Union[AtomicTransactionComposer, List[GenericSignedTransaction]]
+        ],
+    ) -> "List[Future[AtomicTransactionResponse]]":
+        """
+        Submit each group of an iterable in turn. Groups are consumed lazily,
+        so a generator is only advanced as the window allows, and a group
+        that cannot be sent gets a failed future rather than ending the
+        stream.
+
+        Args:
+            groups (Iterable): composers or signed groups
+
+        Returns:
+            List[Future[AtomicTransactionResponse]]: one future per group, in
+                order
+        """
+        futures: "List[Future[AtomicTransactionResponse]]" = []
+        for group in groups:
+            try:
+                futures.append(self.submit(group))
+            except Exception as e:
+                failed: "Future[AtomicTransactionResponse]" = Future()
+                failed.set_exception(e)
+                futures.append(failed)
+        return futures
+
+    def wait(self, timeout: Optional[float] = None) -> None:
+        """
+        Wait until no groups are in flight and the results of every
+        confirmed group are in.
+
+        Args:
+            timeout (float, optional): seconds to wait
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._lock:
+            watcher = self._watcher
+        if watcher is not None:
+            watcher.join(timeout)
+        with self._lock:
+            resolving = list(self._resolving)
+        if resolving:
+            wait(
+                resolving,
+                (
+                    None
+                    if deadline is None
+                    else max(deadline - time.monotonic(), 0)
+                ),
+            )
+
+    def __enter__(self) -> "PipelinedSubmitter":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.wait()
+
+    def _register(self, pending: _PendingGroup) -> _PendingGroup:
+        """Register a group, or return the same group already in flight."""
+        with self._lock:
+            existing = self._pending.get(pending.tx_ids[0])
+            if existing is not None:
+                return existing
+            if self._watcher is None:
+                # a group sent from now on is confirmed in this round or later
+                status = cast(Dict[str, Any], self.client.status())
+                self._next_round = status["last-round"] + 1
+                self._watcher = threading.Thread(
+                    target=self._watch,
+                    name="PipelinedSubmitter",
+                    daemon=True,
+                )
+                self._watcher.start()
+            pending.last_valid = min(
+                pending.last_valid, self._next_round + self.wait_rounds - 1
+            )
+            self._pending[pending.tx_ids[0]] = pending
+            if pending.composer is not None:
+                pending.composer.status = (
+                    AtomicTransactionComposerStatus.SUBMITTED
+                )
+            return pending
+
+    def _watch(self) -> None:
+        last_round = self._next_round - 1
+        delay = 0.0
+        while True:
+            with self._lock:
+                if not self._pending:
+                    self._watcher = None
+                    return
+                rnd = self._next_round
+            try:
+                while last_round < rnd:
+                    status = cast(
+                        Dict[str, Any],
+                        self.client.status_after_block(last_round),
+                    )
+                    last_round = status["last-round"]
+                block = cast(Dict[str, Any], self.client.get_block_txids(rnd))
+            except Exception:
+                # the groups are on the network and may still be confirmed,
+                # so keep following the chain once it can be read again
+                delay = min(
+                    delay * 2 or self.RETRY_DELAY, self.MAX_RETRY_DELAY
+                )
+                time.sleep(delay)
+                continue
+            delay = 0.0
+
+            with self._lock:
+                confirmed = [
+                    self._pending.pop(txid)
+                    for txid in block.get("blockTxids") or []
+                    if txid in self._pending
+                ]
+                expired = [
+                    self._pending.pop(txid)
+                    for txid, pending in list(self._pending.items())
+                    if pending.last_valid <= rnd
+                ]
+                self._next_round = rnd + 1
+
+            for pending in expired:
+                self._window.release()
+                pending.future.set_exception(
+                    error.ConfirmationTimeoutError(
+                        "Wait for transaction id {} timed out".format(
+                            pending.tx_ids[0]
+                        )
+                    )
+                )
+            for pending in confirmed:
+                self._window.release()
+                if pending.composer is None:
+                    pending.future.set_result(
+                        AtomicTransactionResponse(
+                            confirmed_round=rnd,
+                            tx_ids=pending.tx_ids,
+                            results=[],
+                        )
+                    )
+                    continue
+                pending.composer.status = (
+                    AtomicTransactionComposerStatus.COMMITTED
+                )
+                with self._lock:
+                    resolution = self._resolver.submit(
+                        self._resolve, pending, rnd
+                    )
+                    self._resolving.add(resolution)
+                resolution.add_done_callback(self._resolved)
+
+    def _resolve(self, pending: _PendingGroup, confirmed_round: int) -> None:
+        composer = cast(AtomicTransactionComposer, pending.composer)
+        try:
+            # blocks list transaction ids only, so results are still fetched
+            tx_infos = composer._method_tx_infos(self.client)
+            response = composer._execute_response(confirmed_round, tx_infos)
+        except Exception as e:
+            pending.future.set_exception(e)
+        else:
+            pending.future.set_result(response)
+
+    def _resolved(self, resolution: "Future[None]") -> None:
+        with self._lock:
+            self._resolving.discard(resolution)
+
+
+class BatchAtomicTransactionComposer:
+    """
+    Composes any number of transactions and method calls into as many atomic
+    groups as needed, each an AtomicTransactionComposer.
+
+    Transactions join the current group in the order they are added. A new
+    group starts when the next transaction, or method call together with its
+    transaction arguments, would take the current group past group_size, or
+    when `new_group` is called; a method call is never separated from its
+    transaction arguments.
+
+    `gather_signatures` asks signers that set signs_across_groups once for
+    all of their transactions across every group, rather than once per
+    group, so they are given the transactions of several groups in one
+    list; other signers are asked once per group. `execute` submits the
+    groups through a PipelinedSubmitter and reports the outcome of each;
+    `get_statuses` gives the status of each group.
+
+    Args:
+        group_size (int, optional): the most transactions in a group;
+            defaults to AtomicTransactionComposer.MAX_GROUP_SIZE
+    """
+
+    def __init__(
+        self, group_size: int = AtomicTransactionComposer.MAX_GROUP_SIZE
+    ) -> None:
+        if not 1 <= group_size <= AtomicTransactionComposer.MAX_GROUP_SIZE:
+            raise error.AtomicTransactionComposerError(
+                "group_size must be between 1 and {}".format(
+                    AtomicTransactionComposer.MAX_GROUP_SIZE
+                )
+            )
+        self.group_size = group_size
+        self._groups: List[AtomicTransactionComposer] = [
+            AtomicTransactionComposer()
+        ]
+
+    @property
+    def groups(self) -> List[AtomicTransactionComposer]:
+        """The composer of each group, in order."""
+        return [atc for atc in self._groups if atc.get_tx_count()]
+
+    def get_tx_count(self) -> int:
+        """
+        Returns the number of transactions in all groups.
+        """
+        return sum(atc.get_tx_count() for atc in self._groups)
+
+    def get_statuses(self) -> List[AtomicTransactionComposerStatus]:
+        """
+        Returns the status of each group, in order.
+        """
+        return [atc.get_status() for atc in self.groups]
+
+    def new_group(self) -> "BatchAtomicTransactionComposer":
+        """
+        Start a new group for the transactions added next.
+        """
+        if self._groups[-1].get_tx_count():
+            self._groups.append(AtomicTransactionComposer())
+        return self
+
+    def _group_for(self, count: int) -> AtomicTransactionComposer:
+        """The group to add count transactions to."""
+        if count > self.group_size:
+            raise error.AtomicTransactionComposerError(
+                "{} transactions cannot fit in a group of {}".format(
+                    count, self.group_size
+                )
+            )
+        current = self._groups[-1]
+        if current.get_status() != AtomicTransactionComposerStatus.BUILDING:
+            raise error.AtomicTransactionComposerError(
+                "BatchAtomicTransactionComposer must be building for a "
+                "transaction to be added"
+            )
+        if current.get_tx_count() + count > self.group_size:
+            current = AtomicTransactionComposer()
+            self._groups.append(current)
+        return current
+
+    def add_transaction(
+        self, txn_and_signer: TransactionWithSigner
+    ) -> "BatchAtomicTransactionComposer":
+        """
+        Adds a transaction to the current group, or a new group if the
+        current one is full; see AtomicTransactionComposer.add_transaction.
+
+        Args:
+            txn_and_signer (TransactionWithSigner)
+        """
+        self._group_for(1).add_transaction(txn_and_signer)
+        return self
+
+    def add_method_call(
+        self,
+        app_id: int,
+        method: abi.Method,
+        sender: str,
+        sp: transaction.SuggestedParams,
+        signer: TransactionSigner,
+        method_args: Optional[List[Union[Any, TransactionWithSigner]]] = None,
+        **kwargs: Any,
+    ) -> "BatchAtomicTransactionComposer":
+        """
+        Adds a method call and its transaction arguments to the current
+        group, or a new group if they do not fit; the arguments are those of
+        AtomicTransactionComposer.add_method_call.
+        """
+        self._group_for(method.get_txn_calls()).add_method_call(
+            app_id, method, sender, sp, signer, method_args, **kwargs
+        )
+        return self
+
+    def add_template_call(
+        self,
+        template: MethodCallTemplate,
+        method_args: Optional[List[Union[Any, TransactionWithSigner]]] = None,
+        sp: Optional[transaction.SuggestedParams] = None,
+        note: Optional[bytes] = None,
+        lease: Optional[bytes] = None,
+    ) -> "BatchAtomicTransactionComposer":
+        """
+        Adds a call of a MethodCallTemplate and its transaction arguments to
+        the current group, or a new group if they do not fit; the arguments
+        are those of AtomicTransactionComposer.add_template_call.
+        """
+        self._group_for(template.method.get_txn_calls()).add_template_call(
+            template, method_args, sp=sp, note=note, lease=lease
+        )
+        return self
+
+    def build_groups(self) -> List[AtomicTransactionComposer]:
+        """
+        Finalize every group, assigning the group ids.
+
+        Returns:
+            List[AtomicTransactionComposer]: the composer of each group
+        """
+        groups = self.groups
+        for atc in groups:
+            atc.build_group()
+        return groups
+
+    def gather_signatures(
+        self, executor: Optional[Executor] = None
+    ) -> List[List[GenericSignedTransaction]]:
+        """
+        Sign every group. Each signer is called once per group, with that
+        group as its txn_group, except signers with signs_across_groups set,
+        which are called once with all the transactions they sign across
+        the groups. Groups signed before are not signed again.
+
+        Args:
+            executor (Executor, optional): runs the signers concurrently; if
+                any fail an AtomicTransactionComposerSigningError listing
+                the failures, by index across all groups, is raised
+
+        Returns:
+            List[List[GenericSignedTransaction]]: the signed transactions of
+                each group
+        """
+        groups = self.build_groups()
+        unsigned = [
+            atc
+            for atc in groups
+            if atc.get_status() < AtomicTransactionComposerStatus.SIGNED
+        ]
+        # each call is a signer, its txn_group and indexes, and the group
+        # and index in it of each transaction it signs
+        calls: List[
+            Tuple[
+                TransactionSigner,
+                List[transaction.Transaction],
+                List[int],
+                List[Tuple[int, int]],
+            ]
+        ] = []
+        shared: Dict[TransactionSigner, int] = {}
+        offsets: List[int] = []
+        offset = 0
+        for g, atc in enumerate(unsigned):
+            offsets.append(offset)
+            offset += atc.get_tx_count()
+            txns = [t.txn for t in atc.txn_list]
+            for signer, indexes in atc._signer_indexes().items():
+                targets = [(g, i) for i in indexes]
+                if not signer.signs_across_groups:
+                    calls.append((signer, txns, indexes, targets))
+                    continue
+                if signer not in shared:
+                    shared[signer] = len(calls)
+                    calls.append((signer, [], [], []))
+                _, call_txns, call_indexes, call_targets = calls[
+                    shared[signer]
+                ]
+                call_indexes.extend(len(call_txns) + i for i in indexes)
+                call_txns.extend(txns)
+                call_targets.extend(targets)
+
+        results: List[List[GenericSignedTransaction]] = []
+        if executor is None:
+            for signer, txns, indexes, _ in calls:
+                results.append(signer.sign_transactions(txns, indexes))
+        else:
+            futures = [
+                executor.submit(signer.sign_transactions, txns, indexes)
+                for signer, txns, indexes, _ in calls
+            ]
+            errors: List[Tuple[List[int], Exception]] = []
+            for future, (_, _, _, targets) in zip(futures, calls):
+                e = future.exception()
+                if e is not None:
+                    errors.append(
+                        (
+                            [offsets[g] + i for g, i in targets],
+                            cast(Exception, e),
+                        )
+                    )
+                else:
+                    results.append(future.result())
+            if errors:
+                raise error.AtomicTransactionComposerSigningError(errors)
+
+        signed: List[List[Optional[GenericSignedTransaction]]] = [
+            [None] * atc.get_tx_count() for atc in unsigned
+        ]
+        for (_, _, _, targets), stxns in zip(calls, results):
+            for (g, i), stxn in zip(targets, stxns):
+                signed[g][i] = stxn
+        for atc, group_signed in zip(unsigned, signed):
+            local_indexes = atc._signer_indexes()
+            atc._merge_signatures(
+                local_indexes,
+                [
+                    [
+                        cast(GenericSignedTransaction, group_signed[i])
+                        for i in indexes
+                    ]
+                    for indexes in local_indexes.values()
+                ],
+            )
+        return [atc.signed_txns for atc in groups]
+
+    def submit(
+        self,
+        client: algod.AlgodClient,
+        max_in_flight: int = 64,
+        wait_rounds: int = 1000,
+    ) -> "List[Future[AtomicTransactionResponse]]":
+        """
+        Sign every group and submit them through a PipelinedSubmitter.
+
+        Args:
+            client (AlgodClient): Algod V2 client
+            max_in_flight (int, optional): maximum number of groups submitted
+                but not yet confirmed; defaults to 64
+            wait_rounds (int, optional): number of rounds to wait for each
+                group; defaults to 1000
+
+        Returns:
+            List[Future[AtomicTransactionResponse]]: one future per group, in
+                order, which fails if the group cannot be sent or confirmed
+        """
+        self.gather_signatures()
+        submitter = PipelinedSubmitter(client, max_in_flight, wait_rounds)
+        return submitter.submit_all(
+            atc
+            for atc in self.groups
+            if atc.get_status() <= AtomicTransactionComposerStatus.SUBMITTED
+        )
+
+    def execute(
+        self,
+        client: algod.AlgodClient,
+        max_in_flight: int = 64,
+        wait_rounds: int = 1000,
+    ) -> List[Union[AtomicTransactionResponse, Exception]]:
+        """
+        Sign and submit every group not yet committed, and wait for them.
+        A group that fails does not stop the others; its status stays below
+        COMMITTED, so executing again retries it.
+
+        Args:
+            client (AlgodClient): Algod V2 client
+            max_in_flight (int, optional): maximum number of groups submitted
+                but not yet confirmed; defaults to 64
+            wait_rounds (int, optional): number of rounds to wait for each
+                group; defaults to 1000
+
+        Returns:
+            List[AtomicTransactionResponse or Exception]: for each group
+                executed, in order, its response or the error that stopped it
+        """
+        outcomes: List[Union[AtomicTransactionResponse, Exception]] = []
+        for future in self.submit(client, max_in_flight, wait_rounds):
+            try:
+                outcomes.append(future.result())
+            except Exception as e:
+                outcomes.append(e)
+        return outcomes
@@ -1,6 +1,9 @@
 import base64
+from concurrent.futures import Executor
+from typing import Iterable, List, Optional, Tuple
 from . import encoding, constants
-from nacl.signing import SigningKey
+from nacl.exceptions import BadSignatureError
+from nacl.signing import SigningKey, VerifyKey
 
 
 class Bid:
@@ -55,15 +58,23 @@ class Bid:
         Returns:
             SignedBid: signed bid with the signature
         """
-        temp = encoding.msgpack_encode(self)
-        to_sign = constants.bid_prefix + base64.b64decode(temp)
         private_key = base64.b64decode(private_key)
         signing_key = SigningKey(private_key[: constants.key_len_bytes])
-        signed = signing_key.sign(to_sign)
+        signed = signing_key.sign(self.bytes_to_sign())
         sig = signed.signature
         signed = SignedBid(self, base64.b64encode(sig).decode())
         return signed
 
+    def bytes_to_sign(self):
+        """
+        Return the bytes that are signed for this bid: the "aB" prefix
+        followed by the canonical msgpack encoding of the bid.
+
+        Returns:
+            bytes: the message that gets signed
+        """
+        return constants.bid_prefix + encoding._canonical_msgpack(self)
+
     @staticmethod
     def undictify(d):
         return Bid(
@@ -118,6 +129,22 @@ class SignedBid:
             Bid.undictify(d["bid"]), base64.b64encode(d["sig"]).decode()
         )
 
+    def verify(self):
+        """
+        Verify that the bid was signed by its bidder.
+
+        Returns:
+            bool: whether the signature is valid
+        """
+        return _verify_bid_chunk([self._verify_args()])[0]
+
+    def _verify_args(self):
+        return (
+            encoding.decode_address(self.bid.bidder),
+            self.bid.bytes_to_sign(),
+            base64.b64decode(self.signature),
+        )
+
     def __eq__(self, other):
         if not isinstance(other, SignedBid):
             return False
@@ -157,3 +184,97 @@ class NoteField:
             self.signed_bid == other.signed_bid
             and self.note_field_type == other.note_field_type
         )
+
+
+def sign_bids(
+    bids: Iterable[Bid],
+    private_key: str,
+    executor: Optional[Executor] = None,
+    chunk_size: int = 256,
+) -> List[SignedBid]:
+    """
+    Sign many bids with one private key.
+
+    The key is decoded once and each bid is encoded straight to the bytes
+    that get signed. Given an executor (a thread or process pool), the bids
+    are signed in chunks of chunk_size across its workers.
+
+    Args:
+        bids (Bid[]): bids to sign
+        private_key (str): private_key of the bidder
+        executor (Executor, optional): executor to sign chunks on
+        chunk_size (int, optional): bids per task when using an executor
+
+    Returns:
+        SignedBid[]: signed bids, in the order given
+    """
+    bids = list(bids)
+    seed = base64.b64decode(private_key)[: constants.key_len_bytes]
+    preimages = [bid.bytes_to_sign() for bid in bids]
+    sigs: List[bytes] = []
+    if executor is None:
+        sigs = _sign_bid_chunk(seed, preimages)
+    else:
+        chunks = _chunks(preimages, chunk_size)
+        for chunk_sigs in executor.map(
+            _sign_bid_chunk, [seed] * len(chunks), chunks
+        ):
+            sigs.extend(chunk_sigs)
+    return [
+        SignedBid(bid, base64.b64encode(sig).decode())
+        for bid, sig in zip(bids, sigs)
+    ]
+
+
+def verify_bids(
+    signed_bids: Iterable[SignedBid],
+    executor: Optional[Executor] = None,
+    chunk_size: int = 256,
+) -> List[bool]:
+    """
+    Verify that many bids were signed by their bidders.
+
+    Given an executor (a thread or process pool), the bids are verified in
+    chunks of chunk_size across its workers.
+
+    Args:
+        signed_bids (SignedBid[]): signed bids to verify
+        executor (Executor, optional): executor to verify chunks on
+        chunk_size (int, optional): bids per task when using an executor
+
+    Returns:
+        bool[]: whether each signature is valid, in the order given
+    """
+    items = [sb._verify_args() for sb in signed_bids]
+    if executor is None:
+        return _verify_bid_chunk(items)
+    results: List[bool] = []
+    for chunk_results in executor.map(
+        _verify_bid_chunk, _chunks(items, chunk_size)
+    ):
+        results.extend(chunk_results)
+    return results
+
+
+def _chunks(items, chunk_size):
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be positive")
+    return [
+        items[i : i + chunk_size] for i in range(0, len(items), chunk_size)
+    ]
+
+
+def _sign_bid_chunk(seed: bytes, preimages: List[bytes]) -> List[bytes]:
+    signing_key = SigningKey(seed)
+    return [signing_key.sign(p).signature for p in preimages]
+
+
+def _verify_bid_chunk(items: List[Tuple[bytes, bytes, bytes]]) -> List[bool]:
+    results = []
+    for public_key, preimage, sig in items:
+        try:
+            VerifyKey(public_key).verify(preimage, sig)
+            results.append(True)
+        except (BadSignatureError, ValueError):
+            results.append(False)
+    return results
@@ -105,6 +105,13 @@ enforced by algod; do not use this value to pre-validate transactions."""
 
 APP_PAGE_MAX_SIZE = 2048
 """int: max size of a page for an application in bytes"""
+APP_ACCOUNTS_LIMIT = 4
+"""int: maximum number of accounts in an application call's accounts array"""
+APP_REFERENCES_LIMIT = 8
+"""int: maximum number of accounts, foreign apps, foreign assets and boxes
+an application call references in total"""
+APP_ACCESS_LIMIT = 16
+"""int: maximum number of entries in an application call's access list"""
 
 # post-quantum (Falcon) related
 PQ_ADDRESS_PREFIX = b"PQA"
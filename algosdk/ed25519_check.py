@@ -2,10 +2,15 @@
 Ed25519 curve-point check used for post-quantum address derivation.
 """
 
+from typing import Iterable, List
+
 from algosdk import constants
 
 _ED25519_P = 2**255 - 19
 _ED25519_D = (-121665 * pow(121666, _ED25519_P - 2, _ED25519_P)) % _ED25519_P
+# Euler's criterion exponent: a^((p-1)/2) is 1 for nonzero squares mod p.
+_EULER_EXP = (_ED25519_P - 1) // 2
+_Y_MASK = (1 << 255) - 1
 
 
 def is_ed25519_point(public_key: bytes) -> bool:
@@ -28,13 +33,34 @@ def is_ed25519_point(public_key: bytes) -> bool:
     """
     if len(public_key) != constants.key_len_bytes:
         return False
+    return _has_x(public_key)
+
+
+def are_ed25519_points(values: Iterable[bytes]) -> List[bool]:
+    """
+    Apply `is_ed25519_point` to many values, in order.
+
+    Args:
+        values (Iterable[bytes]): 32-byte values to test
+
+    Returns:
+        List[bool]: whether each value decodes to an ed25519 point
+    """
+    key_len = constants.key_len_bytes
+    return [len(v) == key_len and _has_x(v) for v in values]
+
+
+def _has_x(public_key: bytes) -> bool:
     p = _ED25519_P
     # The low 255 bits are y; the top bit encodes the sign of x, which does
     # not affect whether a point exists.
-    y = (int.from_bytes(public_key, "little") & ((1 << 255) - 1)) % p
-    u = (y * y - 1) % p
-    v = (_ED25519_D * y * y + 1) % p
-    # A point exists iff x^2 = u / v has a solution, i.e. u / v is a square.
-    x = (u * pow(v, 3, p) * pow(u * pow(v, 7, p) % p, (p - 5) // 8, p)) % p
-    vxx = (v * x * x) % p
-    return vxx == u % p or vxx == (-u) % p
+    y = (int.from_bytes(public_key, "little") & _Y_MASK) % p
+    yy = y * y
+    u = (yy - 1) % p
+    v = (_ED25519_D * yy + 1) % p
+    # A point exists iff x^2 = u / v has a solution, i.e. u / v is a square
+    # (or 0). -1/d is not a square, so v is never 0, and u / v is a square
+    # exactly when u * v = (u / v) * v^2 is. Euler's criterion decides that
+    # with a single exponentiation and no inversion: the result is 0 or 1
+    # for squares and p - 1 otherwise.
+    return pow(u * v % p, _EULER_EXP, p) <= 1
@@ -1,4 +1,6 @@
 import base64
+import functools
+import threading
 from collections import OrderedDict
 from typing import Tuple, Union
 
@@ -8,6 +10,16 @@ from Cryptodome.Hash import SHA512
 from algosdk import auction, constants, error, transaction
 from algosdk.ed25519_check import is_ed25519_point
 
+# Maximum number of post-quantum keys whose derived address is cached.
+PQ_ADDRESS_CACHE_SIZE = 1024
+
+# (scheme, SHA-512/256 of the public key) -> (address, canonical salt), least
+# recently used first.
+_pq_address_cache: "OrderedDict[Tuple[bytes, bytes], Tuple[str, int]]" = (
+    OrderedDict()
+)
+_pq_address_cache_lock = threading.Lock()
+
 
 def msgpack_encode(obj):
     """
@@ -30,11 +42,72 @@ def msgpack_encode(obj):
         the most recent version of msgpack rather than the older msgpack
         version that had no "bin" family).
     """
+    return base64.b64encode(_canonical_msgpack(obj)).decode()
+
+
+def _canonical_msgpack(obj):
+    """
+    Encode the object using canonical msgpack, without the base64 wrapping
+    that msgpack_encode adds.
+
+    Args:
+        obj (Transaction, SignedTransaction, MultisigTransaction, Multisig,\
+            Bid, or SignedBid): object to be encoded
+
+    Returns:
+        bytes: canonical msgpack encoding of the object
+    """
+    if isinstance(
+        obj,
+        (
+            transaction.SignedTransaction,
+            transaction.PQSignedTransaction,
+            transaction.MultisigTransaction,
+            transaction.LogicSigTransaction,
+        ),
+    ):
+        # Signed envelopes have a fixed layout, so they write it directly
+        # around the transaction's encoding (and a LogicSig's cached one).
+        return obj._encode()
     d = obj
     if not isinstance(obj, dict):
         d = obj.dictify()
     od = _sort_dict(d)
-    return base64.b64encode(msgpack.packb(od, use_bin_type=True)).decode()
+    return msgpack.packb(od, use_bin_type=True)
+
+
+def _encode_map(fields):
+    """
+    Assemble a canonical msgpack map from values that are already encoded.
+
+    Packing a map writes its header followed by each key and value in turn,
+    so splicing in pre-encoded values gives the same bytes as encoding the
+    whole map at once.
+
+    Args:
+        fields (list[(str, bytes)]): each key with the canonical msgpack
+            encoding of its value, in lexicographic key order and without
+            zero values
+
+    Returns:
+        bytes: canonical msgpack encoding of the map
+    """
+    n = len(fields)
+    if n < 16:
+        header = bytes([0x80 | n])
+    else:
+        header = b"\xde" + n.to_bytes(2, "big")
+    parts = [header]
+    for k, v in fields:
+        parts.append(_packed_key(k))
+        parts.append(v)
+    return b"".join(parts)
+
+
+@functools.lru_cache(maxsize=None)
+def _packed_key(key):
+    """Return the msgpack encoding of a map key; keys are a small fixed set."""
+    return msgpack.packb(key, use_bin_type=True)
 
 
 def _sort_dict(d):
@@ -56,12 +129,15 @@ def _sort_dict(d):
     return od
 
 
-def msgpack_decode(enc):
+def msgpack_decode(enc, trusted=False):
     """
     Decode a msgpack encoded object from a string.
 
     Args:
         enc (str): string to be decoded
+        trusted (bool, optional): skip the heuristic program check on decoded
+            LogicSigs. Only set this for input from a trusted source, such as
+            blocks confirmed by your own node.
 
     Returns:
         Transaction, SignedTransaction, Multisig, Bid, or SignedBid:\
@@ -73,13 +149,13 @@ def msgpack_decode(enc):
     if "type" in decoded:
         return transaction.Transaction.undictify(decoded)
     if "l" in decoded:
-        return transaction.LogicSig.undictify(decoded)
+        return transaction.LogicSig.undictify(decoded, trusted)
     if "msig" in decoded:
         return transaction.MultisigTransaction.undictify(decoded)
     if "lsig" in decoded:
         if "txn" in decoded:
-            return transaction.LogicSigTransaction.undictify(decoded)
-        return transaction.LogicSigAccount.undictify(decoded)
+            return transaction.LogicSigTransaction.undictify(decoded, trusted)
+        return transaction.LogicSigAccount.undictify(decoded, trusted)
     if "sch" in decoded:
         # A standalone PQSig also carries a "sig" key, so this check must
         # come before the SignedTransaction dispatch.
@@ -223,9 +299,37 @@ def address_from_pq_key(scheme: bytes, public_key: bytes) -> Tuple[str, int]:
 
     Returns:
         Tuple[str, int]: the derived address and its canonical salt
+
+    Note:
+        The salt search hashes the public key once per candidate salt, so
+        results are cached by scheme and public key hash; deriving the address
+        of a recently seen key costs a single hash.
     """
     if len(scheme) != constants.pq_scheme_len:
         raise error.PQSchemeLengthError(len(scheme))
+    key = (bytes(scheme), checksum(public_key))
+    with _pq_address_cache_lock:
+        cached = _pq_address_cache.get(key)
+        if cached is not None:
+            _pq_address_cache.move_to_end(key)
+            return cached
+    derived = _derive_pq_address(scheme, public_key)
+    _store_pq_address(key, derived)
+    return derived
+
+
+def _store_pq_address(
+    key: Tuple[bytes, bytes], derived: Tuple[str, int]
+) -> None:
+    with _pq_address_cache_lock:
+        _pq_address_cache[key] = derived
+        _pq_address_cache.move_to_end(key)
+        while len(_pq_address_cache) > PQ_ADDRESS_CACHE_SIZE:
+            _pq_address_cache.popitem(last=False)
+
+
+def _derive_pq_address(scheme: bytes, public_key: bytes) -> Tuple[str, int]:
+    """Uncached implementation of `address_from_pq_key`."""
     for salt in range(256):
         candidate = checksum(
             constants.pq_address_prefix + scheme + bytes([salt]) + public_key
@@ -256,6 +360,10 @@ def address_from_pq_sig(pqsig: "transaction.PQSig") -> str:
 
     Raises:
         InvalidPQSaltError: if the salt is not the canonical one
+
+    Note:
+        When the public key has been seen recently, validating the salt is a
+        single cache lookup.
     """
     address, salt = address_from_pq_key(pqsig.scheme, pqsig.public_key)
     if salt != pqsig.salt:
@@ -225,6 +225,28 @@ class AtomicTransactionComposerError(Exception):
         super().__init__(msg)
 
 
+class AtomicTransactionComposerSigningError(AtomicTransactionComposerError):
+    """
+    Raised when signers run concurrently and one or more of them fail.
+
+    Attributes:
+        errors (list[(list[int], Exception)]): the transaction indexes each
+            failed signer was asked to sign, with its error
+    """
+
+    def __init__(self, errors):
+        super().__init__(
+            "{} of the group's signers failed: {}".format(
+                len(errors),
+                "; ".join(
+                    "indexes {}: {!r}".format(indexes, e)
+                    for indexes, e in errors
+                ),
+            )
+        )
+        self.errors = errors
+
+
 class InvalidForeignIndexError(Exception):
     def __init__(self, msg):
         super().__init__(msg)
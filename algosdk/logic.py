@@ -1,7 +1,9 @@
 import base64
+import functools
 import json
 import os
 import warnings
+from typing import Iterable, List
 
 from . import constants
 from . import error
@@ -14,12 +16,32 @@ def address(program):
     """
     Return the address of the program.
 
+    Addresses of recently used programs are memoized.
+
     Args:
         program (bytes): compiled program
 
     Returns:
         str: program address
     """
+    return _program_address(bytes(program))
+
+
+def program_addresses(programs: Iterable[bytes]) -> List[str]:
+    """
+    Return the addresses of many programs, in order.
+
+    Args:
+        programs (Iterable[bytes]): compiled programs
+
+    Returns:
+        List[str]: the address of each program
+    """
+    return [_program_address(bytes(p)) for p in programs]
+
+
+@functools.lru_cache(maxsize=1024)
+def _program_address(program: bytes) -> str:
     to_sign = constants.logic_prefix + program
     checksum = encoding.checksum(to_sign)
     return encoding.encode_address(checksum)
@@ -69,6 +91,8 @@ def get_application_address(appID: int) -> str:
     """
     Return the escrow address of an application.
 
+    Addresses of recently used applications are memoized.
+
     Args:
         appID (int): The ID of the application.
 
@@ -80,7 +104,24 @@ def get_application_address(appID: int) -> str:
     ), "(Expected an int for appID but got [{}] which has type [{}])".format(
         appID, type(appID)
     )
+    return _application_address(appID)
+
+
+def get_application_addresses(appIDs: Iterable[int]) -> List[str]:
+    """
+    Return the escrow addresses of many applications, in order.
+
+    Args:
+        appIDs (Iterable[int]): The IDs of the applications.
+
+    Returns:
+        List[str]: The escrow address of each application.
+    """
+    return [get_application_address(appID) for appID in appIDs]
+
 
+@functools.lru_cache(maxsize=1024)
+def _application_address(appID: int) -> str:
     to_sign = constants.APPID_PREFIX + appID.to_bytes(8, "big")
     checksum = encoding.checksum(to_sign)
     return encoding.encode_address(checksum)
@@ -1,5 +1,7 @@
 from nacl import signing
+from nacl.bindings import crypto_sign_seed_keypair
 import base64
+from typing import Iterable, List, Union
 from . import wordlist
 from . import error
 from . import constants
@@ -19,6 +21,22 @@ for i, word in enumerate(wordlist.word_list_raw().split("\n")):
         word_to_index[word[:length]] = i
     word_to_index[word] = i  # in case word is less than four letters long
 
+# Precomputed tables for the integer packing in _key_to_indexes and
+# _indexes_to_key: the words as a tuple indexed by their 11-bit value, and
+# the bit offset of each of the key words.
+_words = tuple(index_to_word[i] for i in range(len(index_to_word)))
+_key_word_count = constants.mnemonic_len - 1
+_key_word_shifts = tuple(11 * i for i in range(_key_word_count))
+_key_word_bytes = (11 * _key_word_count + 7) // 8
+
+# Errors the bulk conversions report per item; any other error is raised.
+_conversion_errors = (
+    ValueError,
+    error.WrongChecksumError,
+    error.WrongKeyBytesLengthError,
+    error.WrongMnemonicLengthError,
+)
+
 
 def from_master_derivation_key(key):
     """
@@ -102,6 +120,89 @@ def to_pq_seed(mnemonic, scheme):
     )
 
 
+def from_private_keys(keys: Iterable[str]) -> List[Union[str, Exception]]:
+    """
+    Return the mnemonics for many private keys.
+
+    Conversion errors are reported per key: the entry for a key that cannot
+    be converted is the exception `from_private_key` would have raised.
+    Other errors, such as a key that is not a string, are raised.
+
+    Args:
+        keys (Iterable[str]): private keys in base64
+
+    Returns:
+        list[str | Exception]: mnemonic or error for each key, in order
+    """
+    results: List[Union[str, Exception]] = []
+    for key in keys:
+        try:
+            results.append(from_private_key(key))
+        except _conversion_errors as e:
+            results.append(e)
+    return results
+
+
+def to_private_keys(mnemonics: Iterable[str]) -> List[Union[str, Exception]]:
+    """
+    Return the private keys for many mnemonics.
+
+    Conversion errors are reported per mnemonic: the entry for a mnemonic
+    that cannot be converted is the exception `to_private_key` would have
+    raised. Other errors, such as a mnemonic that is not a string, are
+    raised.
+
+    Args:
+        mnemonics (Iterable[str]): mnemonics of the private keys
+
+    Returns:
+        list[str | Exception]: private key in base64 or error for each
+            mnemonic, in order
+    """
+    results: List[Union[str, Exception]] = []
+    for m in mnemonics:
+        try:
+            _, secret_key = crypto_sign_seed_keypair(_to_key(m))
+        except _conversion_errors as e:
+            results.append(e)
+        else:
+            results.append(base64.b64encode(secret_key).decode())
+    return results
+
+
+def to_pq_seeds(
+    mnemonics: Iterable[str], scheme: bytes
+) -> List[Union[bytes, Exception]]:
+    """
+    Derive post-quantum key seeds from many 25-word mnemonics.
+
+    Conversion errors are reported per mnemonic: the entry for a mnemonic
+    that cannot be decoded is the exception `to_pq_seed` would have raised.
+    Other errors, such as a mnemonic that is not a string, are raised.
+
+    Args:
+        mnemonics (Iterable[str]): 25-word mnemonics
+        scheme (bytes): 2-byte scheme identifier (e.g. b"f1" for Falcon-1024)
+
+    Returns:
+        list[bytes | Exception]: 32-byte seed or error for each mnemonic, in
+            order
+
+    Raises:
+        PQSchemeLengthError: if scheme is not exactly 2 bytes
+    """
+    if len(scheme) != constants.pq_scheme_len:
+        raise error.PQSchemeLengthError(len(scheme))
+    prefix = constants.pq_seed_prefix + scheme
+    results: List[Union[bytes, Exception]] = []
+    for m in mnemonics:
+        try:
+            results.append(encoding.checksum(prefix + _to_key(m)))
+        except _conversion_errors as e:
+            results.append(e)
+    return results
+
+
 def _from_key(key):
     """
     Return the mnemonic for the key.
@@ -114,10 +215,9 @@ def _from_key(key):
     """
     if not len(key) == constants.key_len_bytes:
         raise error.WrongKeyBytesLengthError
-    chkword = index_to_word[_checksum(key)]
-    nums = _to_11_bit(key)
-    words = _apply_words(nums)
-    return " ".join(words) + " " + chkword
+    words = [_words[n] for n in _key_to_indexes(key)]
+    words.append(_words[_checksum(key)])
+    return " ".join(words)
 
 
 def _to_key(mnemonic):
@@ -138,7 +238,7 @@ def _to_key(mnemonic):
         mnemonic = _from_words(mnemonic[:-1])
     except KeyError:  # We used to return ValueError, so keep it
         raise ValueError(mnemonic)
-    m_bytes = _to_bytes(mnemonic)
+    m_bytes = _indexes_to_key(mnemonic)
     if not m_bytes[-1 : len(m_bytes)] == b"\x00":
         raise error.WrongChecksumError
     chksum = _checksum(m_bytes[: constants.key_len_bytes])
@@ -148,93 +248,59 @@ def _to_key(mnemonic):
         raise error.WrongChecksumError
 
 
-def _checksum(data):
+def _key_to_indexes(key):
     """
-    Compute the mnemonic checksum.
+    Split a key into the 11-bit word indexes of its mnemonic, least
+    significant bits first.
 
     Args:
-        data (bytes): data to compute checksum of
+        key (bytes): 32-byte key
 
     Returns:
-        int: checksum
+        int[]: list of 11-bit numbers
     """
-    chksum = encoding.checksum(data)
-    temp = chksum[0:2]
-    nums = _to_11_bit(temp)
-    return nums[0]
+    packed = int.from_bytes(key, "little")
+    return [(packed >> shift) & 2047 for shift in _key_word_shifts]
 
 
-def _apply_words(nums):
+def _indexes_to_key(nums):
     """
-    Get the corresponding words for a list of 11-bit numbers.
+    Pack the 11-bit word indexes of a mnemonic's key words into bytes.
 
     Args:
         nums (int[]): list of 11-bit numbers
 
     Returns:
-        str[]: list of words
+        bytes: packed bytes, including the final padding byte
     """
-    return [index_to_word[n] for n in nums]
+    packed = 0
+    for n, shift in zip(nums, _key_word_shifts):
+        packed |= n << shift
+    return packed.to_bytes(_key_word_bytes, "little")
 
 
-def _from_words(words):
+def _checksum(data):
     """
-    Get the corresponding 11-bit numbers for a list of words.
+    Compute the mnemonic checksum.
 
     Args:
-        words (str[]): list of words
+        data (bytes): data to compute checksum of
 
     Returns:
-        int[]: list of 11-bit numbers
+        int: checksum
     """
-    return [word_to_index[w] for w in words]
+    chksum = encoding.checksum(data)
+    return int.from_bytes(chksum[0:2], "little") & 2047
 
 
-def _to_11_bit(data):
+def _from_words(words):
     """
-    Convert a bytearray to an list of 11-bit numbers.
+    Get the corresponding 11-bit numbers for a list of words.
 
     Args:
-        data (bytes): bytearray to convert to 11-bit numbers
+        words (str[]): list of words
 
     Returns:
         int[]: list of 11-bit numbers
     """
-    buffer = 0
-    num_of_bits = 0
-    output = []
-    for i in range(len(data)):
-        buffer |= data[i] << num_of_bits
-        num_of_bits += 8
-        if num_of_bits >= 11:
-            output.append(buffer & 2047)
-            buffer = buffer >> 11
-            num_of_bits -= 11
-    if num_of_bits != 0:
-        output.append(buffer & 2047)
-    return output
-
-
-def _to_bytes(nums):
-    """
-    Convert a list of 11-bit numbers to a bytearray.
-
-    Args:
-        nums (int[]): list of 11-bit numbers
-
-    Returns:
-        bytes: bytearray
-    """
-    buffer = 0
-    num_of_bits = 0
-    output = []
-    for i in range(len(nums)):
-        buffer |= nums[i] << num_of_bits
-        num_of_bits += 11
-        while num_of_bits >= 8:
-            output.append(buffer & 255)
-            buffer = buffer >> 8
-            num_of_bits -= 8
-    if num_of_bits != 0:
-        output.append(buffer & 255)
-    return bytes(output)
+    return [word_to_index[w] for w in words]
@@ -16,28 +16,71 @@ ed25519 callback signers.
 
 For signing a single transaction, pair any of these with
 `algosdk.atomic_transaction_composer.sign_transaction_with_signer`.
+
+Besides the synchronous `RawSigner` callback, the ed25519 and post-quantum
+signers accept an asynchronous callback (`AsyncRawSigner`) and batch callbacks
+that sign a whole list of preimages in one call (`BatchRawSigner`,
+`AsyncBatchRawSigner`), so a remote backend can sign a group in a single round
+trip. `sign_transactions_async` is the asynchronous counterpart of
+`sign_transactions`. A `ChunkedRawSigner` receives each preimage as a stream
+of chunks; transactions are streamed straight from their encoding (see
+`Transaction.preimage_chunks`) without building the prefixed message.
 """
 
+from abc import ABC, abstractmethod
+import asyncio
 import base64
-from typing import Callable, List, Optional
+from concurrent.futures import Executor, as_completed
+import json
+import os
+import threading
+from typing import (
+    Awaitable,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+)
 
 from algosdk import constants, encoding, error, transaction
 from algosdk.constants import PQScheme
+from algosdk.mnemonic import to_pq_seed
 from algosdk.atomic_transaction_composer import TransactionSigner
 from algosdk.transaction import GenericSignedTransaction
 
 __all__ = [
     "RawSigner",
+    "AsyncRawSigner",
+    "BatchRawSigner",
+    "AsyncBatchRawSigner",
+    "ChunkedRawSigner",
     "Ed25519AlgorandSigner",
     "Ed25519MultisigAlgorandSigner",
     "PQAlgorandSigner",
     "Falcon1024AlgorandSigner",
+    "PQKeyCache",
 ]
 
 # A low-level signing callback: signs the exact preimage bytes and returns the
 # raw signature.
 RawSigner = Callable[[bytes], bytes]
 
+# The asynchronous form of RawSigner, e.g. `async def sign(data) -> bytes`.
+AsyncRawSigner = Callable[[bytes], Awaitable[bytes]]
+
+# Signs a list of preimages in one call and returns their raw signatures in
+# the same order.
+BatchRawSigner = Callable[[List[bytes]], List[bytes]]
+
+# The asynchronous form of BatchRawSigner.
+AsyncBatchRawSigner = Callable[[List[bytes]], Awaitable[List[bytes]]]
+
+# Signs a preimage streamed as consecutive chunks, e.g. to a hardware device
+# with a limited input buffer, and returns the raw signature.
+ChunkedRawSigner = Callable[[Iterator[memoryview]], bytes]
+
 
 def _subsig_index(multisig: "transaction.Multisig", public_key: bytes) -> int:
     for i, subsig in enumerate(multisig.subsigs):
@@ -46,28 +89,113 @@ def _subsig_index(multisig: "transaction.Multisig", public_key: bytes) -> int:
     raise error.InvalidSecretKeyError
 
 
-class Ed25519AlgorandSigner(TransactionSigner):
+class _CallbackSigner(TransactionSigner, ABC):
     """
-    A TransactionSigner backed by a single low-level ed25519 signing callback
-    (a public key plus a function that signs exact bytes) instead of a raw
-    secret key. Besides signing transactions it can also sign messages ("MX"),
-    program data, and delegate logic signatures.
-
-    Args:
-        public_key (bytes): the 32-byte ed25519 public key
-        signer (RawSigner): callback that signs exact preimage bytes and
-            returns the raw 64-byte signature
+    Base for signers backed by low-level signing callbacks.
+
+    At least one callback must be given. Synchronous signing prefers
+    `batch_signer`, then `signer`, then `chunked_signer` (fed chunks of at
+    most `chunk_size` bytes); asynchronous signing prefers
+    `async_batch_signer`, then `async_signer` (signing preimages
+    concurrently). Either side falls back to the other's callbacks:
+    synchronous signing with only asynchronous callbacks runs them with
+    `asyncio.run`, so it cannot be used from inside a running event loop, and
+    asynchronous signing with only synchronous callbacks runs them in a worker
+    thread.
     """
 
     def __init__(
         self,
-        public_key: bytes,
-        signer: RawSigner,
+        signer: Optional[RawSigner] = None,
+        batch_signer: Optional[BatchRawSigner] = None,
+        async_signer: Optional[AsyncRawSigner] = None,
+        async_batch_signer: Optional[AsyncBatchRawSigner] = None,
+        chunked_signer: Optional[ChunkedRawSigner] = None,
+        chunk_size: Optional[int] = None,
     ) -> None:
         super().__init__()
-        self.public_key = public_key
+        if not (
+            signer
+            or batch_signer
+            or async_signer
+            or async_batch_signer
+            or chunked_signer
+        ):
+            raise ValueError("at least one signing callback is required")
+        if chunk_size is not None and chunk_size < 1:
+            raise ValueError("chunk_size must be positive")
         self.signer = signer
-        self.address = encoding.encode_address(public_key)
+        self.batch_signer = batch_signer
+        self.async_signer = async_signer
+        self.async_batch_signer = async_batch_signer
+        self.chunked_signer = chunked_signer
+        self.chunk_size = chunk_size
+
+    def _chunks(self, data: bytes) -> Iterator[memoryview]:
+        view = memoryview(data)
+        step = self.chunk_size or len(view)
+        for start in range(0, len(view), step):
+            yield view[start : start + step]
+
+    def _sign(self, data: bytes) -> bytes:
+        """Sign a single preimage."""
+        if self.signer:
+            return self.signer(data)
+        return self._sign_preimages([data])[0]
+
+    def _sign_preimages(self, preimages: List[bytes]) -> List[bytes]:
+        """Sign preimages, returning their signatures in the same order."""
+        if self.batch_signer:
+            sigs = self.batch_signer(preimages)
+        elif self.signer:
+            sigs = [self.signer(p) for p in preimages]
+        elif self.chunked_signer:
+            chunked_signer = self.chunked_signer
+            sigs = [chunked_signer(self._chunks(p)) for p in preimages]
+        else:
+            sigs = asyncio.run(self._sign_preimages_async(preimages))
+        if len(sigs) != len(preimages):
+            raise ValueError(
+                "batch signer returned {} signatures for {} preimages".format(
+                    len(sigs), len(preimages)
+                )
+            )
+        return list(sigs)
+
+    async def _sign_preimages_async(
+        self, preimages: List[bytes]
+    ) -> List[bytes]:
+        """Asynchronous counterpart of `_sign_preimages`."""
+        if self.async_batch_signer:
+            sigs = await self.async_batch_signer(preimages)
+        elif self.async_signer:
+            async_signer = self.async_signer
+            sigs = await asyncio.gather(*(async_signer(p) for p in preimages))
+        else:
+            return await asyncio.to_thread(self._sign_preimages, preimages)
+        if len(sigs) != len(preimages):
+            raise ValueError(
+                "batch signer returned {} signatures for {} preimages".format(
+                    len(sigs), len(preimages)
+                )
+            )
+        return list(sigs)
+
+    def _sign_txns(self, txns: List[transaction.Transaction]) -> List[bytes]:
+        """Sign transactions, streaming them to a chunked-only backend."""
+        chunked_signer = self.chunked_signer
+        if chunked_signer and not (self.batch_signer or self.signer):
+            return [
+                chunked_signer(txn.preimage_chunks(self.chunk_size))
+                for txn in txns
+            ]
+        return self._sign_preimages([txn.bytes_to_sign() for txn in txns])
+
+    @abstractmethod
+    def _signed_transaction(
+        self, txn: transaction.Transaction, sig: bytes
+    ) -> GenericSignedTransaction:
+        """Wrap a transaction and its raw signature."""
 
     def sign_transactions(
         self, txn_group: List[transaction.Transaction], indexes: List[int]
@@ -84,20 +212,88 @@ class Ed25519AlgorandSigner(TransactionSigner):
             indexes (list[int]): array of indexes in the atomic transaction
                 group that should be signed
         """
-        stxns: List[GenericSignedTransaction] = []
-        for i in indexes:
-            txn = txn_group[i]
-            sig = self.signer(txn.bytes_to_sign())
-            # This signer's own address is the authorizer; attach it as the
-            # auth address whenever the transaction is sent by a different
-            # (rekeyed) account.
-            auth = None if txn.sender == self.address else self.address
-            stxns.append(
-                transaction.SignedTransaction(
-                    txn, base64.b64encode(sig).decode(), auth
-                )
+        txns = [txn_group[i] for i in indexes]
+        sigs = self._sign_txns(txns)
+        return [self._signed_transaction(t, s) for t, s in zip(txns, sigs)]
+
+    async def sign_transactions_async(
+        self, txn_group: List[transaction.Transaction], indexes: List[int]
+    ) -> List[GenericSignedTransaction]:
+        """
+        Asynchronous counterpart of `sign_transactions`.
+
+        Args:
+            txn_group (list[Transaction]): atomic group of transactions
+            indexes (list[int]): array of indexes in the atomic transaction
+                group that should be signed
+        """
+        txns = [txn_group[i] for i in indexes]
+        if self.async_batch_signer or self.async_signer:
+            sigs = await self._sign_preimages_async(
+                [txn.bytes_to_sign() for txn in txns]
             )
-        return stxns
+        else:
+            sigs = await asyncio.to_thread(self._sign_txns, txns)
+        return [self._signed_transaction(t, s) for t, s in zip(txns, sigs)]
+
+
+class Ed25519AlgorandSigner(_CallbackSigner):
+    """
+    A TransactionSigner backed by a low-level ed25519 signing callback
+    (a public key plus a function that signs exact bytes) instead of a raw
+    secret key. Besides signing transactions it can also sign messages ("MX"),
+    program data, and delegate logic signatures.
+
+    Args:
+        public_key (bytes): the 32-byte ed25519 public key
+        signer (RawSigner, optional): callback that signs exact preimage bytes
+            and returns the raw 64-byte signature
+        batch_signer (BatchRawSigner, optional): callback that signs a list of
+            preimages in one call
+        async_signer (AsyncRawSigner, optional): asynchronous callback that
+            signs one preimage
+        async_batch_signer (AsyncBatchRawSigner, optional): asynchronous
+            callback that signs a list of preimages in one call
+        chunked_signer (ChunkedRawSigner, optional): callback that signs a
+            preimage streamed in chunks
+        chunk_size (int, optional): maximum chunk size for chunked_signer;
+            by default each preimage is streamed whole
+
+    At least one callback is required.
+    """
+
+    def __init__(
+        self,
+        public_key: bytes,
+        signer: Optional[RawSigner] = None,
+        *,
+        batch_signer: Optional[BatchRawSigner] = None,
+        async_signer: Optional[AsyncRawSigner] = None,
+        async_batch_signer: Optional[AsyncBatchRawSigner] = None,
+        chunked_signer: Optional[ChunkedRawSigner] = None,
+        chunk_size: Optional[int] = None,
+    ) -> None:
+        super().__init__(
+            signer,
+            batch_signer,
+            async_signer,
+            async_batch_signer,
+            chunked_signer,
+            chunk_size,
+        )
+        self.public_key = public_key
+        self.address = encoding.encode_address(public_key)
+
+    def _signed_transaction(
+        self, txn: transaction.Transaction, sig: bytes
+    ) -> GenericSignedTransaction:
+        # This signer's own address is the authorizer; attach it as the auth
+        # address whenever the transaction is sent by a different (rekeyed)
+        # account.
+        auth = None if txn.sender == self.address else self.address
+        return transaction.SignedTransaction(
+            txn, base64.b64encode(sig).decode(), auth
+        )
 
     def sign_bytes(self, data: bytes) -> str:
         """
@@ -105,7 +301,7 @@ class Ed25519AlgorandSigner(TransactionSigner):
         base64 signature this returns verifies with util.verify_bytes.
         """
         return base64.b64encode(
-            self.signer(constants.bytes_prefix + data)
+            self._sign(constants.bytes_prefix + data)
         ).decode()
 
     def sign_program_data(
@@ -116,7 +312,7 @@ class Ed25519AlgorandSigner(TransactionSigner):
         "ProgData" + lsig program address + data.
         """
         program_addr = encoding.decode_address(lsig.address())
-        return self.signer(constants.logic_data_prefix + program_addr + data)
+        return self._sign(constants.logic_data_prefix + program_addr + data)
 
     def sign_logicsig(
         self,
@@ -143,7 +339,7 @@ class Ed25519AlgorandSigner(TransactionSigner):
             raise error.LogicSigOverspecifiedSignature
         if multisig is None:
             to_sign = constants.logic_prefix + lsig_account.lsig.logic
-            sig = self.signer(to_sign)
+            sig = self._sign(to_sign)
             lsig_account.lsig.sig = base64.b64encode(sig).decode()
             lsig_account.sigkey = self.public_key
         else:
@@ -153,7 +349,7 @@ class Ed25519AlgorandSigner(TransactionSigner):
                 + multisig.address_bytes()
                 + lsig_account.lsig.logic
             )
-            multisig.subsigs[index].signature = self.signer(to_sign)
+            multisig.subsigs[index].signature = self._sign(to_sign)
             lsig_account.lsig.lmsig = multisig
 
     def append_to_logicsig_multisig(
@@ -186,7 +382,7 @@ class Ed25519AlgorandSigner(TransactionSigner):
             + lmsig.address_bytes()
             + lsig_account.lsig.logic
         )
-        lmsig.subsigs[index].signature = self.signer(to_sign)
+        lmsig.subsigs[index].signature = self._sign(to_sign)
 
     def append_to_multisig_transaction(
         self, mtxn: "transaction.MultisigTransaction"
@@ -211,7 +407,7 @@ class Ed25519AlgorandSigner(TransactionSigner):
         # (MultisigTransaction.sign validates before signing).
         mtxn.multisig.validate()
         index = _subsig_index(mtxn.multisig, self.public_key)
-        mtxn.multisig.subsigs[index].signature = self.signer(
+        mtxn.multisig.subsigs[index].signature = self._sign(
             mtxn.transaction.bytes_to_sign()
         )
 
@@ -221,21 +417,69 @@ class Ed25519MultisigAlgorandSigner(TransactionSigner):
     Multisig TransactionSigner that fills each member's subsig using an
     Ed25519AlgorandSigner callback instead of a raw secret key.
 
+    Each transaction's preimage is computed once, and each member signs all
+    the requested transactions as one batch. Members sign one after another
+    unless an executor is given, in which case their callbacks run
+    concurrently on it.
+
     Args:
         msig (Multisig): the multisig account
         signers (List[Ed25519AlgorandSigner]): the members to sign with;
             each must be a public key present in the multisig. Only each
-            member's public key and signing callback are used.
+            member's public key and signing callbacks are used.
+        executor (Executor, optional): executor to run member callbacks on
+            concurrently; it is not shut down by the signer
+        stop_at_threshold (bool, optional): if True, stop collecting member
+            signatures once the multisig threshold is reached; members that
+            have not finished by then are cancelled or ignored. A member
+            that fails is then skipped as long as the others can still
+            reach the threshold; otherwise the first failure is raised.
     """
 
     def __init__(
         self,
         msig: "transaction.Multisig",
         signers: List[Ed25519AlgorandSigner],
+        *,
+        executor: Optional[Executor] = None,
+        stop_at_threshold: bool = False,
     ) -> None:
         super().__init__()
         self.msig = msig
         self.signers = signers
+        self.executor = executor
+        self.stop_at_threshold = stop_at_threshold
+
+    def _prepare(
+        self, txn_group: List[transaction.Transaction], indexes: List[int]
+    ) -> Tuple[
+        List[bytes],
+        List[transaction.MultisigTransaction],
+        List[Tuple[Ed25519AlgorandSigner, int]],
+    ]:
+        # Fail fast on a malformed multisig, matching the secret-key path
+        # (MultisigTransaction.sign validates before signing), and resolve
+        # every member before signing, so an unknown member fails without
+        # calling any backend.
+        self.msig.validate()
+        members = [
+            (member, _subsig_index(self.msig, member.public_key))
+            for member in self.signers
+        ]
+        txns = [txn_group[i] for i in indexes]
+        preimages = [txn.bytes_to_sign() for txn in txns]
+        mtxns = [
+            transaction.MultisigTransaction(
+                txn, self.msig.get_multisig_account()
+            )
+            for txn in txns
+        ]
+        return preimages, mtxns, members
+
+    def _needed(self, members: List[Tuple[Ed25519AlgorandSigner, int]]) -> int:
+        if self.stop_at_threshold:
+            return min(self.msig.threshold, len(members))
+        return len(members)
 
     def sign_transactions(
         self, txn_group: List[transaction.Transaction], indexes: List[int]
@@ -252,25 +496,97 @@ class Ed25519MultisigAlgorandSigner(TransactionSigner):
             indexes (list[int]): array of indexes in the atomic transaction
                 group that should be signed
         """
-        # Fail fast on a malformed multisig, matching the secret-key path
-        # (MultisigTransaction.sign validates before signing).
-        self.msig.validate()
-        stxns: List[GenericSignedTransaction] = []
-        for i in indexes:
-            txn = txn_group[i]
-            mtxn = transaction.MultisigTransaction(
-                txn, self.msig.get_multisig_account()
-            )
-            for member in self.signers:
-                index = _subsig_index(mtxn.multisig, member.public_key)
-                mtxn.multisig.subsigs[index].signature = member.signer(
-                    txn.bytes_to_sign()
-                )
-            stxns.append(mtxn)
-        return stxns
-
+        preimages, mtxns, members = self._prepare(txn_group, indexes)
+        needed = self._needed(members)
+        collected: List[Tuple[int, List[bytes]]] = []
+        failures: List[BaseException] = []
+        if self.executor is None:
+            for member, index in members:
+                try:
+                    collected.append(
+                        (index, member._sign_preimages(preimages))
+                    )
+                except Exception as e:
+                    failures.append(e)
+                    if len(members) - len(failures) < needed:
+                        raise failures[0]
+                if len(collected) == needed:
+                    break
+        else:
+            futures = {
+                self.executor.submit(member._sign_preimages, preimages): index
+                for member, index in members
+            }
+            try:
+                for future in as_completed(futures):
+                    failure = future.exception()
+                    if failure is not None:
+                        failures.append(failure)
+                        if len(futures) - len(failures) < needed:
+                            raise failures[0]
+                        continue
+                    collected.append((futures[future], future.result()))
+                    if len(collected) == needed:
+                        break
+            finally:
+                for future in futures:
+                    future.cancel()
+        for index, sigs in collected:
+            for mtxn, sig in zip(mtxns, sigs):
+                mtxn.multisig.subsigs[index].signature = sig
+        return list(mtxns)
+
+    async def sign_transactions_async(
+        self, txn_group: List[transaction.Transaction], indexes: List[int]
+    ) -> List[GenericSignedTransaction]:
+        """
+        Asynchronous counterpart of `sign_transactions`. The members sign
+        concurrently.
 
-class PQAlgorandSigner(TransactionSigner):
+        Args:
+            txn_group (list[Transaction]): atomic group of transactions
+            indexes (list[int]): array of indexes in the atomic transaction
+                group that should be signed
+        """
+        preimages, mtxns, members = self._prepare(txn_group, indexes)
+        needed = self._needed(members)
+        pending = {
+            asyncio.ensure_future(
+                member._sign_preimages_async(preimages)
+            ): index
+            for member, index in members
+        }
+        indexes_of = dict(pending)
+        collected: List[Tuple[int, List[bytes]]] = []
+        failures: List[BaseException] = []
+        try:
+            while len(collected) < needed:
+                done, _ = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    del pending[task]
+                    # every finished member's outcome is retrieved, even
+                    # past the threshold
+                    failure = task.exception()
+                    if failure is not None:
+                        failures.append(failure)
+                    elif len(collected) < needed:
+                        collected.append((indexes_of[task], task.result()))
+                if len(collected) + len(pending) < needed:
+                    raise failures[0]
+        finally:
+            for task in pending:
+                task.cancel()
+            # wait for the cancelled members, so none outlives the call
+            await asyncio.gather(*pending, return_exceptions=True)
+        for index, sigs in collected:
+            for mtxn, sig in zip(mtxns, sigs):
+                mtxn.multisig.subsigs[index].signature = sig
+        return list(mtxns)
+
+
+class PQAlgorandSigner(_CallbackSigner):
     """
     A TransactionSigner backed by a post-quantum signing callback (a public key
     plus a function that signs exact bytes) instead of a raw secret key,
@@ -286,53 +602,56 @@ class PQAlgorandSigner(TransactionSigner):
     Args:
         public_key (bytes): the scheme's public key
         signer (RawSigner): callback that signs exact preimage bytes and
-            returns the raw post-quantum signature
+            returns the raw post-quantum signature; may be None when another
+            callback is given
         scheme (bytes): 2-byte scheme identifier (e.g. b"f1" for Falcon-1024)
+        batch_signer (BatchRawSigner, optional): callback that signs a list of
+            preimages in one call
+        async_signer (AsyncRawSigner, optional): asynchronous callback that
+            signs one preimage
+        async_batch_signer (AsyncBatchRawSigner, optional): asynchronous
+            callback that signs a list of preimages in one call
+        chunked_signer (ChunkedRawSigner, optional): callback that signs a
+            preimage streamed in chunks
+        chunk_size (int, optional): maximum chunk size for chunked_signer;
+            by default each preimage is streamed whole
     """
 
     def __init__(
         self,
         public_key: bytes,
-        signer: RawSigner,
+        signer: Optional[RawSigner],
         scheme: PQScheme,
+        *,
+        batch_signer: Optional[BatchRawSigner] = None,
+        async_signer: Optional[AsyncRawSigner] = None,
+        async_batch_signer: Optional[AsyncBatchRawSigner] = None,
+        chunked_signer: Optional[ChunkedRawSigner] = None,
+        chunk_size: Optional[int] = None,
     ) -> None:
-        super().__init__()
+        super().__init__(
+            signer,
+            batch_signer,
+            async_signer,
+            async_batch_signer,
+            chunked_signer,
+            chunk_size,
+        )
         self.public_key = public_key
-        self.signer = signer
         self.scheme = scheme
         self.address, self.salt = encoding.address_from_pq_key(
             scheme, public_key
         )
 
-    def sign_transactions(
-        self, txn_group: List[transaction.Transaction], indexes: List[int]
-    ) -> List[GenericSignedTransaction]:
-        """
-        Sign transactions in a transaction group given the indexes.
-
-        Returns an array of signed transactions. The length of the array will
-        be the same as the length of indexes, and each index i in the array
-        corresponds to the signed transaction from txn_group[indexes[i]].
-
-        Args:
-            txn_group (list[Transaction]): atomic group of transactions
-            indexes (list[int]): array of indexes in the atomic transaction
-                group that should be signed
-        """
-        stxns: List[GenericSignedTransaction] = []
-        for i in indexes:
-            txn = txn_group[i]
-            sig = self.signer(txn.bytes_to_sign())
-            pqsig = transaction.PQSig(
-                self.scheme, self.salt, self.public_key, sig
-            )
-            # The post-quantum address is the authorizer; attach it as the auth
-            # address whenever the transaction is sent by a different (rekeyed)
-            # account.
-            auth = None if txn.sender == self.address else self.address
-            stxn = transaction.PQSignedTransaction(txn, pqsig, auth)
-            stxns.append(stxn)
-        return stxns
+    def _signed_transaction(
+        self, txn: transaction.Transaction, sig: bytes
+    ) -> GenericSignedTransaction:
+        pqsig = transaction.PQSig(self.scheme, self.salt, self.public_key, sig)
+        # The post-quantum address is the authorizer; attach it as the auth
+        # address whenever the transaction is sent by a different (rekeyed)
+        # account.
+        auth = None if txn.sender == self.address else self.address
+        return transaction.PQSignedTransaction(txn, pqsig, auth)
 
     def sign_logicsig(
         self,
@@ -359,7 +678,7 @@ class PQAlgorandSigner(TransactionSigner):
             raise error.LogicSigOverspecifiedSignature
         address_bytes = encoding.decode_address(self.address)
         to_sign = constants.pq_program_prefix + address_bytes + lsig.logic
-        sig = self.signer(to_sign)
+        sig = self._sign(to_sign)
         lsig.pqsig = transaction.PQSig(
             self.scheme, self.salt, self.public_key, sig
         )
@@ -374,13 +693,252 @@ class Falcon1024AlgorandSigner(PQAlgorandSigner):
 
     Args:
         public_key (bytes): the Falcon-1024 public key
-        signer (RawSigner): callback that signs exact preimage bytes and
-            returns the raw Falcon-1024 signature
+        signer (RawSigner, optional): callback that signs exact preimage bytes
+            and returns the raw Falcon-1024 signature
+        batch_signer (BatchRawSigner, optional): callback that signs a list of
+            preimages in one call
+        async_signer (AsyncRawSigner, optional): asynchronous callback that
+            signs one preimage
+        async_batch_signer (AsyncBatchRawSigner, optional): asynchronous
+            callback that signs a list of preimages in one call
+        chunked_signer (ChunkedRawSigner, optional): callback that signs a
+            preimage streamed in chunks
+        chunk_size (int, optional): maximum chunk size for chunked_signer;
+            by default each preimage is streamed whole
+
+    At least one callback is required.
     """
 
     def __init__(
         self,
         public_key: bytes,
-        signer: RawSigner,
+        signer: Optional[RawSigner] = None,
+        *,
+        batch_signer: Optional[BatchRawSigner] = None,
+        async_signer: Optional[AsyncRawSigner] = None,
+        async_batch_signer: Optional[AsyncBatchRawSigner] = None,
+        chunked_signer: Optional[ChunkedRawSigner] = None,
+        chunk_size: Optional[int] = None,
     ) -> None:
-        super().__init__(public_key, signer, constants.falcon_1024_scheme)
+        super().__init__(
+            public_key,
+            signer,
+            constants.falcon_1024_scheme,
+            batch_signer=batch_signer,
+            async_signer=async_signer,
+            async_batch_signer=async_batch_signer,
+            chunked_signer=chunked_signer,
+            chunk_size=chunk_size,
+        )
+
+    @classmethod
+    def from_key_cache(
+        cls,
+        cache: "PQKeyCache",
+        mnemonic: str,
+        signer: Optional[RawSigner] = None,
+        *,
+        derive_public_key: Optional[Callable[[bytes], bytes]] = None,
+        batch_signer: Optional[BatchRawSigner] = None,
+        async_signer: Optional[AsyncRawSigner] = None,
+        async_batch_signer: Optional[AsyncBatchRawSigner] = None,
+        chunked_signer: Optional[ChunkedRawSigner] = None,
+        chunk_size: Optional[int] = None,
+    ) -> "Falcon1024AlgorandSigner":
+        """
+        Create a signer for the Falcon-1024 key of a mnemonic, taking its
+        public key, address and salt from a PQKeyCache.
+
+        Args:
+            cache (PQKeyCache): the key cache
+            mnemonic (str): 25-word mnemonic the key is derived from
+            signer (RawSigner, optional): callback that signs exact preimage
+                bytes and returns the raw Falcon-1024 signature
+            derive_public_key (function, optional): returns the public key
+                for a post-quantum seed (see `mnemonic.to_pq_seed`); called
+                only when the mnemonic is not cached yet
+            batch_signer (BatchRawSigner, optional): callback that signs a
+                list of preimages in one call
+            async_signer (AsyncRawSigner, optional): asynchronous callback
+                that signs one preimage
+            async_batch_signer (AsyncBatchRawSigner, optional): asynchronous
+                callback that signs a list of preimages in one call
+            chunked_signer (ChunkedRawSigner, optional): callback that signs
+                a preimage streamed in chunks
+            chunk_size (int, optional): maximum chunk size for chunked_signer
+
+        Raises:
+            KeyError: if the mnemonic is not cached and no derive_public_key
+                is given
+        """
+        scheme = constants.falcon_1024_scheme
+        if derive_public_key is None:
+            entry = cache.get(mnemonic, scheme)
+            if entry is None:
+                raise KeyError("mnemonic is not in the key cache")
+            public_key = entry[0]
+        else:
+            public_key = cache.get_or_derive(
+                mnemonic, scheme, derive_public_key
+            )[0]
+        return cls(
+            public_key,
+            signer,
+            batch_signer=batch_signer,
+            async_signer=async_signer,
+            async_batch_signer=async_batch_signer,
+            chunked_signer=chunked_signer,
+            chunk_size=chunk_size,
+        )
+
+
+class PQKeyCache:
+    """
+    A persistent cache of post-quantum keys derived from mnemonics.
+
+    Maps a (mnemonic fingerprint, scheme) pair to the derived public key,
+    address and canonical salt, and saves it to a local file, so a restarted
+    service does not have to expand keys again. The fingerprint is a hash of
+    the post-quantum seed and does not reveal the mnemonic, but the file
+    does link it to the account; keep it private.
+
+    The file holds a JSON header line followed by one JSON line per entry,
+    and new entries are appended to it. An entry cut short by a crash while
+    it was appended is dropped on loading.
+
+    Loading the file checks each entry's address and salt against its
+    public key with `encoding.address_from_pq_key`, which also caches them,
+    so signers for cached keys are created without deriving their addresses
+    again. The public keys themselves are trusted.
+
+    Args:
+        path (str): the cache file; it is created on the first new entry
+
+    Raises:
+        ValueError: if the file has an unsupported version, or an entry's
+            address or salt does not match its public key
+    """
+
+    _version = 2
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._lock = threading.Lock()
+        # fingerprint -> (scheme, public key, address, salt)
+        self._entries: Dict[str, Tuple[bytes, bytes, str, int]] = {}
+        if os.path.exists(path):
+            self._load()
+
+    def _load(self) -> None:
+        with open(self.path, "rb") as f:
+            data = f.read()
+        end = data.rfind(b"\n") + 1
+        lines = data[:end].splitlines()
+        if lines:
+            version = json.loads(lines[0]).get("version")
+            if version != self._version:
+                raise ValueError(
+                    "unsupported key cache version {}".format(version)
+                )
+        for line in lines[1:]:
+            entry = json.loads(line)
+            scheme = base64.b64decode(entry["scheme"])
+            public_key = base64.b64decode(entry["pk"])
+            if encoding.address_from_pq_key(scheme, public_key) != (
+                entry["address"],
+                entry["salt"],
+            ):
+                raise ValueError(
+                    "key cache entry {} does not match its public "
+                    "key".format(entry["fingerprint"])
+                )
+            self._entries[entry["fingerprint"]] = (
+                scheme,
+                public_key,
+                entry["address"],
+                entry["salt"],
+            )
+        if end < len(data):
+            # drop an entry cut short while it was appended
+            with open(self.path, "r+b") as f:
+                f.truncate(end)
+
+    @staticmethod
+    def fingerprint(mnemonic: str, scheme: PQScheme) -> str:
+        """
+        Return the cache key of a mnemonic's post-quantum key.
+
+        Args:
+            mnemonic (str): 25-word mnemonic
+            scheme (bytes): 2-byte scheme identifier
+
+        Returns:
+            str: SHA-512/256 of the post-quantum seed, in hex
+        """
+        return encoding.checksum(to_pq_seed(mnemonic, scheme)).hex()
+
+    def get(
+        self, mnemonic: str, scheme: PQScheme
+    ) -> Optional[Tuple[bytes, str, int]]:
+        """
+        Look up a mnemonic's post-quantum key.
+
+        Args:
+            mnemonic (str): 25-word mnemonic
+            scheme (bytes): 2-byte scheme identifier
+
+        Returns:
+            (bytes, str, int) or None: public key, address and salt, or None
+                if the key is not cached
+        """
+        with self._lock:
+            entry = self._entries.get(self.fingerprint(mnemonic, scheme))
+        return entry[1:] if entry else None
+
+    def get_or_derive(
+        self,
+        mnemonic: str,
+        scheme: PQScheme,
+        derive_public_key: Callable[[bytes], bytes],
+    ) -> Tuple[bytes, str, int]:
+        """
+        Look up a mnemonic's post-quantum key, deriving and saving it if it is
+        not cached.
+
+        Args:
+            mnemonic (str): 25-word mnemonic
+            scheme (bytes): 2-byte scheme identifier
+            derive_public_key (function): returns the public key for the
+                post-quantum seed (see `mnemonic.to_pq_seed`)
+
+        Returns:
+            (bytes, str, int): public key, address and salt
+        """
+        seed = to_pq_seed(mnemonic, scheme)
+        name = encoding.checksum(seed).hex()
+        with self._lock:
+            entry = self._entries.get(name)
+        if entry is None:
+            public_key = derive_public_key(seed)
+            address, salt = encoding.address_from_pq_key(scheme, public_key)
+            entry = (bytes(scheme), public_key, address, salt)
+            with self._lock:
+                if name not in self._entries:
+                    self._entries[name] = entry
+                    self._append(name, entry)
+        return entry[1:]
+
+    def _append(self, name: str, entry: Tuple[bytes, bytes, str, int]) -> None:
+        scheme, public_key, address, salt = entry
+        line = {
+            "fingerprint": name,
+            "scheme": base64.b64encode(scheme).decode(),
+            "pk": base64.b64encode(public_key).decode(),
+            "address": address,
+            "salt": salt,
+        }
+        with open(self.path, "ab") as f:
+            if f.tell() == 0:
+                f.write(json.dumps({"version": self._version}).encode())
+                f.write(b"\n")
+            f.write(json.dumps(line).encode() + b"\n")
@@ -1,8 +1,10 @@
 import base64
 import binascii
+import functools
 import msgpack
+import threading
 from enum import IntEnum
-from typing import cast, List, Optional, Tuple, Union
+from typing import cast, Iterator, List, Optional, Tuple, Union
 from typing_extensions import deprecated  # type: ignore[attr-defined]
 from collections import OrderedDict
 
@@ -121,9 +123,7 @@ class Transaction:
         Returns:
             str: transaction ID
         """
-        txn = encoding.msgpack_encode(self)
-        to_sign = constants.txid_prefix + base64.b64decode(txn)
-        txid = encoding.checksum(to_sign)
+        txid = encoding.checksum(self.bytes_to_sign())
         txid = base64.b32encode(txid).decode()
         return encoding._undo_padding(txid)
 
@@ -189,8 +189,41 @@ class Transaction:
         Returns:
             bytes: the message that gets signed
         """
-        txn = encoding.msgpack_encode(self)
-        return constants.txid_prefix + base64.b64decode(txn)
+        return constants.txid_prefix + encoding._canonical_msgpack(self)
+
+    def preimage_chunks(
+        self, chunk_size: Optional[int] = None
+    ) -> Iterator[memoryview]:
+        """
+        Iterate over the bytes that are signed for this transaction (see
+        `bytes_to_sign`) as read-only views, without building the prefixed
+        message: the "TX" prefix first, then the canonical encoding in slices
+        of at most chunk_size bytes.
+
+        Args:
+            chunk_size (int, optional): maximum size of each slice of the
+                encoding; by default the encoding is yielded whole
+
+        Returns:
+            Iterator[memoryview]: the message that gets signed, in order
+
+        Raises:
+            ValueError: if chunk_size is not positive
+        """
+        # checked here rather than in the generator, so a bad chunk_size
+        # fails at the call
+        if chunk_size is not None and chunk_size < 1:
+            raise ValueError("chunk_size must be positive")
+        return self._preimage_chunks(chunk_size)
+
+    def _preimage_chunks(
+        self, chunk_size: Optional[int]
+    ) -> Iterator[memoryview]:
+        encoded = memoryview(encoding._canonical_msgpack(self))
+        yield memoryview(constants.txid_prefix)
+        step = chunk_size or len(encoded)
+        for start in range(0, len(encoded), step):
+            yield encoded[start : start + step]
 
     @deprecated(
         "Use sign_transaction_with_signer(txn,"
@@ -1680,7 +1713,7 @@ class ApplicationCallTxn(Transaction):
         self.accounts: Optional[List[str]] = None
         self.foreign_apps: Optional[List[int]] = None
         self.foreign_assets: Optional[List[int]] = None
-        self.boxes: Optional[List[Tuple[int, bytes]]] = None
+        self.boxes: Optional[List[BoxReference]] = None
         self.resources: Optional[List[ResourceReference]] = None
 
         if resources and (
@@ -2258,6 +2291,46 @@ class ApplicationNoOpTxn(ApplicationCallTxn):
         )
 
 
+# Maximum number of distinct post-quantum public keys kept for interning.
+PQ_PUBLIC_KEY_INTERN_SIZE = 256
+
+# Interned post-quantum public keys, least recently used first.
+_pq_public_keys: "OrderedDict[bytes, bytes]" = OrderedDict()
+_pq_public_keys_lock = threading.Lock()
+
+
+def intern_pq_public_key(public_key: bytes) -> bytes:
+    """
+    Return a shared instance of a post-quantum public key.
+
+    A post-quantum public key is large (1793 bytes for Falcon-1024), and one
+    account's key is repeated in every signature it makes. Decoded PQSigs
+    intern their key, so signatures by the same account share one copy. The
+    table is bounded and keeps the most recently used keys.
+
+    Args:
+        public_key (bytes): the public key
+
+    Returns:
+        bytes: an equal key, shared with other PQSigs carrying it
+    """
+    public_key = bytes(public_key)
+    with _pq_public_keys_lock:
+        interned = _pq_public_keys.get(public_key)
+        if interned is not None:
+            _pq_public_keys.move_to_end(public_key)
+            return interned
+        _pq_public_keys[public_key] = public_key
+        while len(_pq_public_keys) > PQ_PUBLIC_KEY_INTERN_SIZE:
+            _pq_public_keys.popitem(last=False)
+        return public_key
+
+
+def _pack_address(address: str) -> bytes:
+    """Return the msgpack encoding of an address's 32 bytes."""
+    return msgpack.packb(encoding.decode_address(address), use_bin_type=True)
+
+
 class PQSig:
     """
     Represents a post-quantum signature attached to a transaction or a
@@ -2302,10 +2375,14 @@ class PQSig:
         return PQSig(
             d["sch"],
             d["slt"] if "slt" in d else 0,
-            d["pk"],
+            intern_pq_public_key(d["pk"]),
             d["sig"],
         )
 
+    def _cache_key(self):
+        """Fields that determine the encoding, for validating caches."""
+        return (self.scheme, self.salt, self.public_key, self.signature)
+
     def __eq__(self, other):
         if not isinstance(other, PQSig):
             return False
@@ -2357,6 +2434,30 @@ class SignedTransaction:
             od["sgnr"] = encoding.decode_address(self.authorizing_address)
         return od
 
+    def _encode(self):
+        """
+        Return the canonical msgpack encoding of this signed transaction,
+        writing the envelope fields directly around the transaction's own
+        encoding instead of building and sorting nested dicts.
+
+        Returns:
+            bytes: canonical msgpack encoding, identical to encoding `dictify`
+        """
+        fields = []
+        if self.authorizing_address:
+            fields.append(("sgnr", _pack_address(self.authorizing_address)))
+        if self.signature:
+            fields.append(
+                (
+                    "sig",
+                    msgpack.packb(
+                        base64.b64decode(self.signature), use_bin_type=True
+                    ),
+                )
+            )
+        fields.append(("txn", encoding._canonical_msgpack(self.transaction)))
+        return encoding._encode_map(fields)
+
     @staticmethod
     def undictify(d):
         sig = None
@@ -2422,6 +2523,21 @@ class PQSignedTransaction:
         od["txn"] = self.transaction.dictify()
         return od
 
+    def _encode(self):
+        """
+        Return the canonical msgpack encoding of this signed transaction,
+        writing the envelope fields directly around the transaction's own
+        encoding instead of building and sorting nested dicts.
+
+        Returns:
+            bytes: canonical msgpack encoding, identical to encoding `dictify`
+        """
+        fields = [("pqsig", encoding._canonical_msgpack(self.pqsig))]
+        if self.authorizing_address:
+            fields.append(("sgnr", _pack_address(self.authorizing_address)))
+        fields.append(("txn", encoding._canonical_msgpack(self.transaction)))
+        return encoding._encode_map(fields)
+
     @staticmethod
     def undictify(d):
         auth = None
@@ -2545,6 +2661,23 @@ class MultisigTransaction:
         od["txn"] = self.transaction.dictify()
         return od
 
+    def _encode(self):
+        """
+        Return the canonical msgpack encoding of this multisig transaction,
+        writing the envelope fields directly around the transaction's own
+        encoding instead of building and sorting nested dicts.
+
+        Returns:
+            bytes: canonical msgpack encoding, identical to encoding `dictify`
+        """
+        fields = []
+        if self.multisig:
+            fields.append(("msig", encoding._canonical_msgpack(self.multisig)))
+        if self.auth_addr:
+            fields.append(("sgnr", _pack_address(self.auth_addr)))
+        fields.append(("txn", encoding._canonical_msgpack(self.transaction)))
+        return encoding._encode_map(fields)
+
     @staticmethod
     def undictify(d):
         msig = None
@@ -2721,6 +2854,14 @@ class Multisig:
         msig.subsigs = subsigs
         return msig
 
+    def _cache_key(self):
+        """Fields that determine the encoding, for validating caches."""
+        return (
+            self.version,
+            self.threshold,
+            tuple((s.public_key, s.signature) for s in self.subsigs),
+        )
+
     def get_multisig_account(self):
         """Return a Multisig object without signatures."""
         msig = Multisig(self.version, self.threshold, self.get_public_keys())
@@ -2784,6 +2925,41 @@ class MultisigSubsig:
         )
 
 
+@functools.lru_cache(maxsize=1024)
+def _program_sanity_problem(program: bytes) -> Optional[str]:
+    """
+    Return why a non-empty program looks like something other than TEAL
+    bytecode, or None if it looks fine. Cached by LogicSig._sanity_check_program.
+    """
+
+    def is_ascii_printable(program_bytes):
+        return all(
+            map(
+                lambda x: x == ord("\n") or (ord(" ") <= x <= ord("~")),
+                program_bytes,
+            )
+        )
+
+    if not is_ascii_printable(program):
+        return None
+
+    try:
+        encoding.decode_address(program.decode("utf-8"))
+        return "requesting program bytes, get Algorand address"
+    except error.WrongChecksumError:
+        pass
+    except error.WrongKeyLengthError:
+        pass
+
+    try:
+        base64.b64decode(program.decode("utf-8"))
+        return "program should not be b64 encoded"
+    except binascii.Error:
+        pass
+
+    return "program bytes are all ASCII printable characters, not looking like Teal byte code"
+
+
 class LogicSig:
     """
     Represents a logic signature
@@ -2803,12 +2979,33 @@ class LogicSig:
 
     def __init__(self, program, args=None):
         self._sanity_check_program(program)
+        self._init_fields(program, args)
+
+    def _init_fields(self, program, args):
         self.logic = program
         self.args = args
         self.sig = None
         self.msig = None
         self.lmsig = None
         self.pqsig = None
+        # (cache key, canonical msgpack encoding) of the last encode
+        self._encoded_cache: Optional[Tuple[tuple, bytes]] = None
+
+    @staticmethod
+    def _trusted(program, args=None):
+        """
+        Create a LogicSig without the heuristic program check.
+
+        Only for programs from a trusted source, such as blocks confirmed by
+        your own node, which the network has already accepted.
+
+        Args:
+            program (bytes): compiled program
+            args (list[bytes], optional): program args
+        """
+        lsig = LogicSig.__new__(LogicSig)
+        lsig._init_fields(program, args)
+        return lsig
 
     @staticmethod
     def _sanity_check_program(program):
@@ -2816,41 +3013,18 @@ class LogicSig:
         Performs heuristic program validation:
         check if passed in bytes are Algorand address, or they are B64 encoded, rather than Teal bytes
 
+        The verdict is cached per program, so checking the same program again
+        is only a lookup.
+
         Args:
             program (bytes): compiled program
         """
-
-        def is_ascii_printable(program_bytes):
-            return all(
-                map(
-                    lambda x: x == ord("\n") or (ord(" ") <= x <= ord("~")),
-                    program_bytes,
-                )
-            )
-
         if not program:
             raise error.InvalidProgram("empty program")
 
-        if is_ascii_printable(program):
-            try:
-                encoding.decode_address(program.decode("utf-8"))
-                raise error.InvalidProgram(
-                    "requesting program bytes, get Algorand address"
-                )
-            except error.WrongChecksumError:
-                pass
-            except error.WrongKeyLengthError:
-                pass
-
-            try:
-                base64.b64decode(program.decode("utf-8"))
-                raise error.InvalidProgram("program should not be b64 encoded")
-            except binascii.Error:
-                pass
-
-            raise error.InvalidProgram(
-                "program bytes are all ASCII printable characters, not looking like Teal byte code"
-            )
+        problem = _program_sanity_problem(bytes(program))
+        if problem:
+            raise error.InvalidProgram(problem)
 
     def dictify(self):
         od = OrderedDict()
@@ -2867,9 +3041,46 @@ class LogicSig:
             od["pqsig"] = self.pqsig.dictify()
         return od
 
+    def _cache_key(self):
+        """
+        Fields that determine the encoding and the address, for validating
+        caches. Comparing keys is cheap because unchanged fields are the same
+        objects, which compare by identity.
+        """
+        return (
+            self.logic,
+            tuple(self.args) if self.args else None,
+            self.sig,
+            self.msig._cache_key() if self.msig else None,
+            self.lmsig._cache_key() if self.lmsig else None,
+            self.pqsig._cache_key() if self.pqsig else None,
+        )
+
+    def _encode(self):
+        """
+        Return the canonical msgpack encoding of this LogicSig.
+
+        The encoding is cached, so a LogicSig shared by many transactions
+        encodes its program only once. The cache is revalidated on every call,
+        so it stays correct when the LogicSig is signed or its args change.
+
+        Returns:
+            bytes: canonical msgpack encoding
+        """
+        key = self._cache_key()
+        cached = self._encoded_cache
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        enc = encoding._canonical_msgpack(self.dictify())
+        self._encoded_cache = (key, enc)
+        return enc
+
     @staticmethod
-    def undictify(d):
-        lsig = LogicSig(d["l"], d.get("arg", None))
+    def undictify(d, trusted=False):
+        if trusted:
+            lsig = LogicSig._trusted(d["l"], d.get("arg", None))
+        else:
+            lsig = LogicSig(d["l"], d.get("arg", None))
         if "sig" in d:
             lsig.sig = base64.b64encode(d["sig"]).decode()
         elif "msig" in d:
@@ -3145,6 +3356,8 @@ class LogicSigAccount:
         """
         self.lsig = LogicSig(program, args)
         self.sigkey: Optional[bytes] = None
+        # (cache key, address) of the last address derivation
+        self._address_cache: Optional[Tuple[tuple, str]] = None
 
     def dictify(self):
         od = OrderedDict()
@@ -3154,12 +3367,14 @@ class LogicSigAccount:
         return od
 
     @staticmethod
-    def undictify(d):
-        lsig = LogicSig.undictify(d["lsig"])
-        lsigAccount = LogicSigAccount(lsig.logic, lsig.args)
+    def undictify(d, trusted=False):
+        lsig = LogicSig.undictify(d["lsig"], trusted)
+        # The LogicSig was just decoded (and checked, unless trusted), so
+        # don't construct and check another one.
+        lsigAccount = LogicSigAccount.__new__(LogicSigAccount)
         lsigAccount.lsig = lsig
-        if "sigkey" in d:
-            lsigAccount.sigkey = d["sigkey"]
+        lsigAccount.sigkey = d["sigkey"] if "sigkey" in d else None
+        lsigAccount._address_cache = None
         return lsigAccount
 
     def is_delegated(self) -> bool:
@@ -3211,7 +3426,20 @@ class LogicSigAccount:
 
         If the LogicSig is not delegated to another account, this will return an
         escrow address that is the hash of the LogicSig's program code.
+
+        The address is cached until the program, its args, its signature or
+        `sigkey` change.
         """
+        key = (self.lsig._cache_key(), self.sigkey)
+        cached = self._address_cache
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        addr = self._derive_address()
+        self._address_cache = (key, addr)
+        return addr
+
+    def _derive_address(self) -> str:
+        """Uncached implementation of `address`."""
         if self.sig_count() > 1:
             raise error.LogicSigOverspecifiedSignature
 
@@ -3429,11 +3657,27 @@ class LogicSigTransaction:
 
         return od
 
+    def _encode(self):
+        """
+        Return the canonical msgpack encoding of this transaction, splicing
+        in the LogicSig's cached encoding rather than re-encoding it.
+
+        Returns:
+            bytes: canonical msgpack encoding, identical to encoding `dictify`
+        """
+        fields = []
+        if self.lsig:
+            fields.append(("lsig", self.lsig._encode()))
+        if self.auth_addr:
+            fields.append(("sgnr", _pack_address(self.auth_addr)))
+        fields.append(("txn", encoding._canonical_msgpack(self.transaction)))
+        return encoding._encode_map(fields)
+
     @staticmethod
-    def undictify(d):
+    def undictify(d, trusted=False):
         lsig = None
         if "lsig" in d:
-            lsig = LogicSig.undictify(d["lsig"])
+            lsig = LogicSig.undictify(d["lsig"], trusted)
         auth_addr = None
         if "sgnr" in d:
             auth_addr = encoding.encode_address(d["sgnr"])
@@ -3652,7 +3896,7 @@ GenericSignedTransaction = Union[
 ]
 
 
-def write_to_file(txns, path, overwrite=True):
+def write_to_file(txns, path, overwrite=True, compact=False):
     """
     Write signed or unsigned transactions to a file.
 
@@ -3662,10 +3906,24 @@ def write_to_file(txns, path, overwrite=True):
         path (str): file to write to
         overwrite (bool): whether or not to overwrite what's already in the
             file; if False, transactions will be appended to the file
+        compact (bool, optional): store each distinct post-quantum public key
+            once, with the signatures that carry it referring to it by index.
+            Only retrieve_from_file reads this form, and it restores the full
+            keys, so re-encoding what it returns gives the canonical bytes.
 
     Returns:
         bool: true if the transactions have been written to the file
     """
+    records = []
+    for txn in txns:
+        if isinstance(txn, Transaction):
+            records.append({"txn": txn.dictify()})
+        else:
+            records.append(txn.dictify())
+    if compact:
+        pq_keys = _compact_pq_public_keys(records)
+        if pq_keys:
+            records.insert(0, {"pqkeys": pq_keys})
 
     f = None
     if overwrite:
@@ -3673,46 +3931,98 @@ def write_to_file(txns, path, overwrite=True):
     else:
         f = open(path, "ab")
 
-    for txn in txns:
-        if isinstance(txn, Transaction):
-            enc = msgpack.packb({"txn": txn.dictify()}, use_bin_type=True)
-            f.write(enc)
-        else:
-            enc = msgpack.packb(txn.dictify(), use_bin_type=True)
-            f.write(enc)
+    for record in records:
+        enc = msgpack.packb(record, use_bin_type=True)
+        f.write(enc)
     f.close()
     return True
 
 
-def retrieve_from_file(path):
+def _pq_sig_dicts(record):
+    """Return the post-quantum signature maps in a file record."""
+    pqsigs = []
+    if "pqsig" in record:
+        pqsigs.append(record["pqsig"])
+    if "lsig" in record and "pqsig" in record["lsig"]:
+        pqsigs.append(record["lsig"]["pqsig"])
+    return pqsigs
+
+
+def _compact_pq_public_keys(records):
+    """
+    Replace each post-quantum public key in the records by its index in the
+    returned key table, in place.
+    """
+    pq_keys = []
+    indexes = {}
+    for record in records:
+        for pqsig in _pq_sig_dicts(record):
+            pk = pqsig["pk"]
+            if pk not in indexes:
+                indexes[pk] = len(pq_keys)
+                pq_keys.append(pk)
+            pqsig["pk"] = indexes[pk]
+    return pq_keys
+
+
+def retrieve_from_file(path, trusted=False):
     """
     Retrieve signed or unsigned transactions from a file.
 
+    Files written with `write_to_file(..., compact=True)` are expanded back to
+    full post-quantum public keys.
+
     Args:
         path (str): file to read from
+        trusted (bool, optional): skip the heuristic program check on
+            decoded LogicSigs; only for files from a trusted source
 
     Returns:
         Transaction[], SignedTransaction[], or MultisigTransaction[]:\
             can be a mix of the three
+
+    Raises:
+        ValueError: if a compact file's pqkeys table is malformed, or is
+            missing a key that a signature refers to
     """
 
-    f = open(path, "rb")
     txns = []
-    unp = msgpack.Unpacker(f, raw=False)
-    for txn in unp:
-        if "msig" in txn:
-            txns.append(MultisigTransaction.undictify(txn))
-        elif "sig" in txn:
-            txns.append(SignedTransaction.undictify(txn))
-        elif "lsig" in txn:
-            txns.append(LogicSigTransaction.undictify(txn))
-        elif "pqsig" in txn:
-            txns.append(PQSignedTransaction.undictify(txn))
-        elif "type" in txn:
-            txns.append(Transaction.undictify(txn))
-        elif "txn" in txn:
-            txns.append(Transaction.undictify(txn["txn"]))
-    f.close()
+    # public keys of the current compact section; see write_to_file
+    pq_keys = []
+    with open(path, "rb") as f:
+        unp = msgpack.Unpacker(f, raw=False)
+        for txn in unp:
+            if "pqkeys" in txn:
+                if not isinstance(txn["pqkeys"], list) or not all(
+                    isinstance(pk, bytes) for pk in txn["pqkeys"]
+                ):
+                    raise ValueError(
+                        "malformed pqkeys table in {}".format(path)
+                    )
+                pq_keys = [intern_pq_public_key(pk) for pk in txn["pqkeys"]]
+                continue
+            for pqsig in _pq_sig_dicts(txn):
+                if isinstance(pqsig["pk"], int):
+                    if not 0 <= pqsig["pk"] < len(pq_keys):
+                        raise ValueError(
+                            "compact public key {} is not in the pqkeys table "
+                            "of {}, which has {} keys".format(
+                                pqsig["pk"], path, len(pq_keys)
+                            )
+                        )
+                    pqsig["pk"] = pq_keys[pqsig["pk"]]
+            if "msig" in txn:
+                txns.append(MultisigTransaction.undictify(txn))
+            elif "sig" in txn:
+                txns.append(SignedTransaction.undictify(txn))
+            elif "lsig" in txn:
+                txns.append(LogicSigTransaction.undictify(txn, trusted))
+            elif "pqsig" in txn:
+                txns.append(PQSignedTransaction.undictify(txn))
+            elif "type" in txn:
+                txns.append(Transaction.undictify(txn))
+            elif "txn" in txn:
+                txns.append(Transaction.undictify(txn["txn"]))
     return txns
 
 
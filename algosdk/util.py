@@ -2,9 +2,13 @@ from . import constants
 from . import encoding
 import decimal
 import base64
+import functools
 from nacl.signing import SigningKey, VerifyKey
 from nacl.exceptions import BadSignatureError
-from typing import Dict, Any
+from typing import Dict, Any, Iterable, List
+
+# Maximum number of decoded public keys that verify_bytes keeps.
+KEY_CACHE_SIZE = 256
 
 
 def microalgos_to_algos(microalgos):
@@ -39,16 +43,16 @@ def sign_bytes(to_sign, private_key):
 
     Args:
         to_sign (bytes): bytes to sign
+        private_key (str): private key of the signing account
 
     Returns:
         str: base64 signature
+
+    Note:
+        The key is decoded on every call and not kept. To sign many
+        messages with one key, hold it in a BytesSigner.
     """
-    to_sign = constants.bytes_prefix + to_sign
-    private_key = base64.b64decode(private_key)
-    signing_key = SigningKey(private_key[: constants.key_len_bytes])
-    signed = signing_key.sign(to_sign)
-    signature = base64.b64encode(signed.signature).decode()
-    return signature
+    return BytesSigner(private_key).sign(to_sign)
 
 
 def verify_bytes(message, signature, public_key):
@@ -63,14 +67,121 @@ def verify_bytes(message, signature, public_key):
 
     Returns:
         bool: whether or not the signature is valid
+
+    Note:
+        Decoded public keys are cached (up to KEY_CACHE_SIZE of them). To verify
+        many messages at once, use BytesVerifier.
     """
-    verify_key = VerifyKey(encoding.decode_address(public_key))
-    prefixed_message = constants.bytes_prefix + message
-    try:
-        verify_key.verify(prefixed_message, base64.b64decode(signature))
-        return True
-    except (BadSignatureError, ValueError, TypeError):
-        return False
+    return _bytes_verifier(public_key).verify(message, signature)
+
+
+class BytesSigner:
+    """
+    Signs arbitrary bytes after prepending "MX" for domain separation, with
+    the private key decoded once.
+
+    Args:
+        private_key (str): private key of the signing account
+
+    Attributes:
+        address (str): address of the signing account
+    """
+
+    def __init__(self, private_key: str) -> None:
+        key = base64.b64decode(private_key)
+        self._signing_key = SigningKey(key[: constants.key_len_bytes])
+        self.address = encoding.encode_address(
+            self._signing_key.verify_key.encode()
+        )
+
+    def sign(self, to_sign: bytes) -> str:
+        """
+        Sign bytes; see `sign_bytes`.
+
+        Args:
+            to_sign (bytes): bytes to sign
+
+        Returns:
+            str: base64 signature
+        """
+        signed = self._signing_key.sign(constants.bytes_prefix + to_sign)
+        return base64.b64encode(signed.signature).decode()
+
+    def sign_many(self, messages: Iterable[bytes]) -> List[str]:
+        """
+        Sign many messages.
+
+        Args:
+            messages (bytes[]): bytes to sign
+
+        Returns:
+            str[]: base64 signatures, in the order given
+        """
+        return [self.sign(m) for m in messages]
+
+
+class BytesVerifier:
+    """
+    Verifies signatures of messages that were prepended with "MX" for domain
+    separation, with the public key decoded once.
+
+    Args:
+        public_key (str): base32 address
+    """
+
+    def __init__(self, public_key: str) -> None:
+        self.address = public_key
+        self._verify_key = VerifyKey(encoding.decode_address(public_key))
+
+    def verify(self, message: bytes, signature: str) -> bool:
+        """
+        Verify the signature of a message; see `verify_bytes`.
+
+        Args:
+            message (bytes): message that was signed, without prefix
+            signature (str): base64 signature
+
+        Returns:
+            bool: whether or not the signature is valid
+        """
+        try:
+            self._verify_key.verify(
+                constants.bytes_prefix + message, base64.b64decode(signature)
+            )
+            return True
+        except (BadSignatureError, ValueError, TypeError):
+            return False
+
+    def verify_many(
+        self, messages: Iterable[bytes], signatures: Iterable[str]
+    ) -> List[bool]:
+        """
+        Verify the signatures of many messages.
+
+        Args:
+            messages (bytes[]): messages that were signed, without prefix
+            signatures (str[]): base64 signature of each message
+
+        Returns:
+            bool[]: whether or not each signature is valid, in order
+
+        Raises:
+            ValueError: if there are not as many signatures as messages
+        """
+        messages = list(messages)
+        signatures = list(signatures)
+        if len(messages) != len(signatures):
+            raise ValueError(
+                "got {} messages but {} signatures".format(
+                    len(messages), len(signatures)
+                )
+            )
+        return [self.verify(m, s) for m, s in zip(messages, signatures)]
+
+
+@functools.lru_cache(maxsize=KEY_CACHE_SIZE)
+def _bytes_verifier(public_key: str) -> BytesVerifier:
+    return BytesVerifier(public_key)
 
 
 def build_headers_from(
@@ -1,6 +1,7 @@
 from . import algod
+from . import async_algod
 from . import indexer
 
-__all__ = ["algod", "indexer"]
+__all__ = ["algod", "async_algod", "indexer"]
 
 name = "v2client"
@@ -79,24 +79,9 @@ class AlgodClient:
             dict loaded from json response body when response_format == "json"
             otherwise returns the response body as bytes
         """
-        header = {"User-Agent": "py-algorand-sdk"}
-
-        if self.headers:
-            header.update(self.headers)
-
-        if headers:
-            header.update(headers)
-
-        if requrl not in constants.no_auth:
-            header.update({constants.algod_auth_header: self.algod_token})
-
-        if requrl not in constants.unversioned_paths:
-            requrl = api_version_path_prefix + requrl
-        if params:
-            requrl = requrl + "?" + parse.urlencode(params)
-
+        url, header = self._request_target(requrl, params, headers)
         req = Request(
-            self.algod_address + requrl,
+            url,
             headers=header,
             method=method,
             data=data,
@@ -129,6 +114,37 @@ class AlgodClient:
         else:
             return resp.read()
 
+    def _request_target(
+        self,
+        requrl: str,
+        params: Optional[ParamsType] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> Tuple[str, Dict[str, str]]:
+        """
+        Return the full URL and the headers for a request.
+
+        Args:
+            requrl (str): url for the request
+            params (ParamsType, optional): parameters for the request
+            headers (dict, optional): additional header for request
+        """
+        header = {"User-Agent": "py-algorand-sdk"}
+
+        if self.headers:
+            header.update(self.headers)
+
+        if headers:
+            header.update(headers)
+
+        if requrl not in constants.no_auth:
+            header.update({constants.algod_auth_header: self.algod_token})
+
+        if requrl not in constants.unversioned_paths:
+            requrl = api_version_path_prefix + requrl
+        if params:
+            requrl = requrl + "?" + parse.urlencode(params)
+        return self.algod_address + requrl, header
+
     @classmethod
     def _assert_json_response(
         cls, params: Mapping[str, Any], endpoint: str = ""
@@ -396,8 +412,8 @@ class AlgodClient:
         assert not isinstance(
             txn, transaction.Transaction
         ), "Attempt to send UNSUPPORTED type of transaction {}".format(txn)
-        return self.send_raw_transaction(
-            encoding.msgpack_encode(txn), **kwargs
+        return self._send_encoded_transactions(
+            encoding._canonical_msgpack(txn), **kwargs
         )
 
     def send_raw_transaction(
@@ -413,9 +429,17 @@ class AlgodClient:
         Returns:
             str: transaction ID
         """
+        return self._send_encoded_transactions(base64.b64decode(txn), **kwargs)
+
+    def _send_encoded_transactions(
+        self, txn_bytes: bytes, **kwargs: Any
+    ) -> str:
+        """
+        Broadcast signed transactions, given their concatenated canonical
+        msgpack encodings.
+        """
         self._assert_json_response(kwargs, "send_raw_transaction")
 
-        txn_bytes = base64.b64decode(txn)
         req = "/transactions"
         headers = util.build_headers_from(
             kwargs.get("headers", False),
@@ -494,10 +518,8 @@ class AlgodClient:
             assert not isinstance(
                 txn, transaction.Transaction
             ), "Attempt to send UNSIGNED transaction {}".format(txn)
-            serialized.append(base64.b64decode(encoding.msgpack_encode(txn)))
-        return self.send_raw_transaction(
-            base64.b64encode(b"".join(serialized)), **kwargs
-        )
+            serialized.append(encoding._canonical_msgpack(txn))
+        return self._send_encoded_transactions(b"".join(serialized), **kwargs)
 
     def suggested_params(self, **kwargs: Any) -> "transaction.SuggestedParams":
         """Return suggested transaction parameters."""
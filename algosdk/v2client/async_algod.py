@@ -0,0 +1,373 @@
+import asyncio
+import base64
+import json
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Final,
+    Iterable,
+    Optional,
+    Tuple,
+    Union,
+    cast,
+)
+import urllib.error
+from urllib.request import Request, urlopen
+
+from algosdk import encoding, error, transaction, util
+from algosdk.v2client import algod, models
+from algosdk.v2client.algod import AlgodResponseType, ParamsType
+
+# An HTTP transport: sends (method, url, headers, body, timeout) and returns
+# the response's status code and body. Plug in any asyncio HTTP library.
+AsyncTransport = Callable[
+    [str, str, Dict[str, str], Optional[bytes], Optional[int]],
+    Awaitable[Tuple[int, bytes]],
+]
+
+
+async def urllib_transport(
+    method: str,
+    url: str,
+    headers: Dict[str, str],
+    data: Optional[bytes],
+    timeout: Optional[int],
+) -> Tuple[int, bytes]:
+    """
+    The default AsyncTransport: performs the request with the standard
+    library's urllib in a worker thread.
+
+    Concurrency is bounded by the event loop's default executor; for many
+    requests in flight, plug in a natively asynchronous transport instead.
+    """
+    return await asyncio.to_thread(
+        _urllib_request, method, url, headers, data, timeout
+    )
+
+
+def _urllib_request(
+    method: str,
+    url: str,
+    headers: Dict[str, str],
+    data: Optional[bytes],
+    timeout: Optional[int],
+) -> Tuple[int, bytes]:
+    req = Request(url, headers=headers, method=method, data=data)
+    try:
+        with urlopen(req, timeout=timeout) as resp:
+            return resp.status, resp.read()
+    except urllib.error.HTTPError as e:
+        return e.code, e.read()
+
+
+class AsyncAlgodClient:
+    """
+    Asyncio client for algod, covering the endpoints used to submit,
+    simulate and confirm transactions. Requests and responses match
+    AlgodClient's; every method is a coroutine.
+
+    Args:
+        algod_token (str): algod API token
+        algod_address (str): algod address
+        headers (dict, optional): extra header name/value for all requests
+        transport (AsyncTransport, optional): sends the HTTP requests;
+            defaults to `urllib_transport`
+
+    Attributes:
+        algod_token (str)
+        algod_address (str)
+        headers (dict)
+    """
+
+    def __init__(
+        self,
+        algod_token: str,
+        algod_address: str,
+        headers: Optional[Dict[str, str]] = None,
+        transport: Optional[AsyncTransport] = None,
+    ):
+        self.algod_token: Final[str] = algod_token
+        self.algod_address: Final[str] = algod_address
+        self.headers: Final[Optional[Dict[str, str]]] = headers
+        self.transport: AsyncTransport = transport or urllib_transport
+        # builds request URLs and headers exactly as the blocking client does
+        self._target = algod.AlgodClient(algod_token, algod_address, headers)
+
+    async def algod_request(
+        self,
+        method: str,
+        requrl: str,
+        params: Optional[ParamsType] = None,
+        data: Optional[bytes] = None,
+        headers: Optional[Dict[str, str]] = None,
+        response_format: Optional[str] = "json",
+        timeout: Optional[int] = 30,
+    ) -> AlgodResponseType:
+        """
+        Execute a given request.
+
+        Args:
+            method (str): request method
+            requrl (str): url for the request
+            params (ParamsType, optional): parameters for the request
+            data (bytes, optional): data in the body of the request
+            headers (dict, optional): additional header for request
+            response_format (str, optional): format of the response
+            timeout (int, optional): request timeout in seconds
+
+        Returns:
+            dict loaded from json response body when response_format == "json"
+            otherwise returns the response body as bytes
+        """
+        url, header = self._target._request_target(requrl, params, headers)
+        status, body = await self.transport(method, url, header, data, timeout)
+        if status >= 400:
+            message: Any = body.decode("utf-8", errors="replace")
+            j: Dict[str, Any] = {}
+            try:
+                j = json.loads(body)
+                message = j["message"]
+            except Exception:
+                pass
+            raise error.AlgodHTTPError(message, status, j.get("data"))
+        if response_format == "json":
+            if status == 200 and not body:
+                # Some algod responses return a 200 OK with an empty body.
+                return {}
+            try:
+                return json.loads(body)
+            except Exception as e:
+                raise error.AlgodResponseError(
+                    "Failed to parse JSON response from algod"
+                ) from e
+        return body
+
+    async def status(self, **kwargs: Any) -> AlgodResponseType:
+        """Return node status."""
+        return await self.algod_request("GET", "/status", **kwargs)
+
+    async def status_after_block(
+        self,
+        block_num: Optional[int] = None,
+        round_num: Optional[int] = None,
+        **kwargs: Any,
+    ) -> AlgodResponseType:
+        """
+        Return node status immediately after blockNum.
+
+        Args:
+            block_num: block number
+            round_num (int, optional): alias for block_num; specify one of
+                these
+        """
+        req = "/status/wait-for-block-after/" + algod._specify_round_string(
+            block_num, round_num
+        )
+        return await self.algod_request("GET", req, **kwargs)
+
+    async def pending_transaction_info(
+        self, transaction_id: str, response_format: str = "json", **kwargs: Any
+    ) -> AlgodResponseType:
+        """
+        Return transaction information for a pending transaction.
+
+        Args:
+            transaction_id (str): transaction ID
+            response_format (str): the format in which the response is returned: either
+                "json" or "msgpack"
+        """
+        req = "/transactions/pending/" + transaction_id
+        query = {"format": response_format}
+        return await self.algod_request(
+            "GET", req, params=query, response_format=response_format, **kwargs
+        )
+
+    async def get_block_txids(
+        self, round_num: int, **kwargs: Any
+    ) -> AlgodResponseType:
+        """
+        Get the top level transaction IDs for the block
+        on the given round.
+
+        Args:
+            round_num (int): The round in which the transaction appears.
+        """
+        req = "/blocks/{}/txids".format(round_num)
+        return await self.algod_request("GET", req, **kwargs)
+
+    async def suggested_params(
+        self, **kwargs: Any
+    ) -> "transaction.SuggestedParams":
+        """Return suggested transaction parameters."""
+        algod.AlgodClient._assert_json_response(kwargs, "suggested_params")
+
+        res = cast(
+            dict, await self.algod_request("GET", "/transactions/params")
+        )
+        return transaction.SuggestedParams(
+            res["fee"],
+            res["last-round"],
+            res["last-round"] + 1000,
+            res["genesis-hash"],
+            res["genesis-id"],
+            False,
+            res["consensus-version"],
+            res["min-fee"],
+        )
+
+    async def send_transaction(
+        self, txn: "transaction.GenericSignedTransaction", **kwargs: Any
+    ) -> str:
+        """
+        Broadcast a signed transaction object to the network.
+
+        Args:
+            txn (SignedTransaction, LogicSigTransaction, or MultisigTransaction): transaction to send
+
+        Returns:
+            str: transaction ID
+        """
+        return await self.send_transactions([txn], **kwargs)
+
+    async def send_transactions(
+        self,
+        txns: "Iterable[transaction.GenericSignedTransaction]",
+        **kwargs: Any,
+    ) -> str:
+        """
+        Broadcast list of a signed transaction objects to the network.
+
+        Args:
+            txns (SignedTransaction[] or MultisigTransaction[]):
+                transactions to send
+
+        Returns:
+            str: first transaction ID
+        """
+        serialized = []
+        for txn in txns:
+            assert not isinstance(
+                txn, transaction.Transaction
+            ), "Attempt to send UNSIGNED transaction {}".format(txn)
+            serialized.append(encoding._canonical_msgpack(txn))
+        return await self._send_encoded_transactions(
+            b"".join(serialized), **kwargs
+        )
+
+    async def send_raw_transaction(
+        self, txn: Union[bytes, str], **kwargs: Any
+    ) -> str:
+        """
+        Broadcast a signed transaction to the network.
+
+        Args:
+            txn (str): transaction to send, encoded in base64
+
+        Returns:
+            str: transaction ID
+        """
+        return await self._send_encoded_transactions(
+            base64.b64decode(txn), **kwargs
+        )
+
+    async def _send_encoded_transactions(
+        self, txn_bytes: bytes, **kwargs: Any
+    ) -> str:
+        """
+        Broadcast signed transactions, given their concatenated canonical
+        msgpack encodings.
+        """
+        algod.AlgodClient._assert_json_response(kwargs, "send_raw_transaction")
+        kwargs["headers"] = util.build_headers_from(
+            kwargs.get("headers", False),
+            {"Content-Type": "application/x-binary"},
+        )
+        resp = await self.algod_request(
+            "POST", "/transactions", data=txn_bytes, **kwargs
+        )
+        return cast(str, cast(dict, resp)["txId"])
+
+    async def simulate_transactions(
+        self, request: models.SimulateRequest, **kwargs: Any
+    ) -> AlgodResponseType:
+        """
+        Simulate transactions being sent to the network.
+
+        Args:
+            request (models.SimulateRequest): Simulation request object
+
+        Returns:
+            Dict[str, Any]: results from simulation of transactions
+        """
+        kwargs["headers"] = util.build_headers_from(
+            kwargs.get("headers", False),
+            {"Content-Type": "application/msgpack"},
+        )
+        return await self.algod_request(
+            "POST",
+            "/transactions/simulate",
+            data=encoding._canonical_msgpack(request),
+            **kwargs,
+        )
+
+
+async def wait_for_confirmation(
+    algod_client: AsyncAlgodClient,
+    txid: str,
+    wait_rounds: int = 0,
+    **kwargs: Any,
+) -> Dict[str, Any]:
+    """
+    Wait until a pending transaction is confirmed by the network; the
+    asynchronous counterpart of `transaction.wait_for_confirmation`.
+
+    Args:
+        algod_client (AsyncAlgodClient): Instance of the async `algod` client
+        txid (str): transaction ID
+        wait_rounds (int, optional): The number of rounds to wait for before
+            exiting with an Exception. If not supplied, this will be 1000.
+    """
+    algod.AlgodClient._assert_json_response(kwargs, "wait_for_confirmation")
+
+    last_round = cast(
+        int, cast(dict, await algod_client.status())["last-round"]
+    )
+    current_round = last_round + 1
+
+    if wait_rounds == 0:
+        wait_rounds = 1000
+
+    while True:
+        # Check that the `wait_rounds` has not passed
+        if current_round > last_round + wait_rounds:
+            raise error.ConfirmationTimeoutError(
+                "Wait for transaction id {} timed out".format(txid)
+            )
+
+        try:
+            tx_info = cast(
+                dict,
+                await algod_client.pending_transaction_info(txid, **kwargs),
+            )
+
+            # The transaction has been rejected
+            if "pool-error" in tx_info and len(tx_info["pool-error"]) != 0:
+                raise error.TransactionRejectedError(
+                    "Transaction rejected: " + tx_info["pool-error"]
+                )
+
+            # The transaction has been confirmed
+            if (
+                "confirmed-round" in tx_info
+                and tx_info["confirmed-round"] != 0
+            ):
+                return tx_info
+        except error.AlgodHTTPError:
+            # pending_transaction_info may 404 behind a load balancer; see
+            # transaction.wait_for_confirmation
+            pass
+
+        await algod_client.status_after_block(current_round)
+        current_round += 1
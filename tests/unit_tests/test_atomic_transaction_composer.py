@@ -0,0 +1,1055 @@
+import asyncio
+import base64
+import json
+import threading
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlparse
+
+import msgpack
+
+from algosdk import abi, account, encoding, error, transaction
+from algosdk.app_access import HoldingRef, ResourceReference
+from algosdk.atomic_transaction_composer import (
+    ABI_RETURN_HASH,
+    AccountTransactionSigner,
+    AsyncAtomicTransactionComposer,
+    AtomicTransactionComposer,
+    AtomicTransactionComposerStatus,
+    BatchAtomicTransactionComposer,
+    LazyABIResult,
+    MethodCallTemplate,
+    SimulationCache,
+    PipelinedSubmitter,
+    TransactionSigner,
+    TransactionWithSigner,
+    simulate_groups,
+)
+from algosdk.v2client import algod, models
+from algosdk.v2client.async_algod import AsyncAlgodClient
+
+GH = base64.b64encode(bytes(32)).decode()
+ADD = abi.Method.from_signature("add(uint64,uint64)uint64")
+
+
+def _sp():
+    return transaction.SuggestedParams(1000, 1, 1000, GH, flat_fee=True)
+
+
+class _FailingSigner(TransactionSigner):
+    def sign_transactions(self, txn_group, indexes):
+        raise ValueError("backend unavailable")
+
+
+class _BlockingSigner(TransactionSigner):
+    def __init__(self, release):
+        super().__init__()
+        self.release = release
+
+    def sign_transactions(self, txn_group, indexes):
+        self.release.wait(5)
+        return []
+
+
+class _SlowSigner(AccountTransactionSigner):
+    def __init__(self, private_key, delay):
+        super().__init__(private_key)
+        self.delay = delay
+
+    def sign_transactions(self, txn_group, indexes):
+        time.sleep(self.delay)
+        return super().sign_transactions(txn_group, indexes)
+
+
+class _FakeAlgod:
+    """
+    An in-memory algod. Submitted transactions are confirmed in the next
+    round, and app calls to `add` log the sum of their arguments. When
+    allowed, simulate reports the unnamed resources set on the fake.
+    """
+
+    def __init__(self, unnamed=None, shared=None):
+        # transaction index -> unnamed resources it accesses
+        self.unnamed = unnamed or {}
+        # unnamed resources the group shares
+        self.shared = shared
+        self.round = 10
+        self.info = {}
+        self.blocks = {}
+        self.requests = []
+        self.lock = threading.Lock()
+        self.new_round = threading.Condition(self.lock)
+
+    def _result(self, stxn):
+        txn = stxn["txn"]
+        info = {"txn": {"txn": {"type": txn["type"]}}}
+        args = txn.get("apaa", [])
+        if args and args[0] == ADD.get_selector():
+            total = sum(int.from_bytes(a, "big") for a in args[1:])
+            info["logs"] = [
+                base64.b64encode(
+                    ABI_RETURN_HASH + total.to_bytes(8, "big")
+                ).decode()
+            ]
+        return info
+
+    def handle(self, method, path, data):
+        with self.lock:
+            return self._handle(method, path, data)
+
+    def _handle(self, method, path, data):
+        self.requests.append((method, path))
+        if path == "/v2/transactions":
+            self.round += 1
+            txids = []
+            unpacker = msgpack.Unpacker(raw=False, strict_map_key=False)
+            unpacker.feed(data)
+            for stxn in unpacker:
+                txid = transaction.Transaction.undictify(
+                    stxn["txn"]
+                ).get_txid()
+                info = self._result(stxn)
+                info["confirmed-round"] = self.round
+                self.info[txid] = info
+                txids.append(txid)
+            self.blocks.setdefault(self.round, []).extend(txids)
+            self.new_round.notify_all()
+            return {"txId": txids[0]}
+        if path == "/v2/transactions/simulate":
+            request = msgpack.unpackb(data, raw=False, strict_map_key=False)
+            unnamed = request.get("allow-unnamed-resources", False)
+            groups = []
+            for group in request["txn-groups"]:
+                results = []
+                for i, stxn in enumerate(group["txns"]):
+                    result = {"txn-result": self._result(stxn)}
+                    if unnamed and i in self.unnamed:
+                        result["unnamed-resources-accessed"] = self.unnamed[i]
+                    results.append(result)
+                groups.append(
+                    {
+                        "txn-results": results,
+                        # `add` calls use a quarter fee more in inner calls
+                        "group-usage": sum(
+                            1250001 if "apaa" in stxn["txn"] else 1000000
+                            for stxn in group["txns"]
+                        ),
+                    }
+                )
+                if unnamed and self.shared:
+                    groups[-1]["unnamed-resources-accessed"] = self.shared
+            return {
+                "version": 2,
+                "last-round": self.round,
+                "txn-groups": groups,
+            }
+        if path.startswith("/v2/status/wait-for-block-after/"):
+            # like algod, wait a little for the next block; an empty block
+            # is made if none comes
+            after = int(path.rsplit("/", 1)[1])
+            if self.round <= after:
+                self.new_round.wait(0.01)
+            self.round = max(self.round, after + 1)
+            return {"last-round": self.round}
+        if path == "/v2/status":
+            return {"last-round": self.round}
+        if path == "/v2/transactions/params":
+            return {
+                "fee": 0,
+                "last-round": self.round,
+                "genesis-hash": GH,
+                "genesis-id": "",
+                "consensus-version": "",
+                "min-fee": 1000,
+            }
+        if path.startswith("/v2/transactions/pending/"):
+            return self.info[path.rsplit("/", 1)[1]]
+        if path.startswith("/v2/blocks/"):
+            rnd = int(path.split("/")[3])
+            return {"blockTxids": self.blocks.get(rnd, [])}
+        raise AssertionError("unexpected request {} {}".format(method, path))
+
+    async def transport(self, method, url, headers, data, timeout):
+        return (
+            200,
+            json.dumps(self.handle(method, urlparse(url).path, data)).encode(),
+        )
+
+    def client(self):
+        client = algod.AlgodClient("", "http://algod")
+
+        def algod_request(method, requrl, params=None, data=None, **kwargs):
+            return json.loads(
+                json.dumps(self.handle(method, "/v2" + requrl, data))
+            )
+
+        client.algod_request = algod_request
+        return client
+
+    def async_client(self):
+        return AsyncAlgodClient("", "http://algod", transport=self.transport)
+
+
+def _method_composer(signer, sender, calls, cls=AtomicTransactionComposer):
+    """A composer with one `add` call per pair of arguments."""
+    atc = cls()
+    for a, b in calls:
+        atc.add_method_call(1, ADD, sender, _sp(), signer, method_args=[a, b])
+    return atc
+
+
+def _composer(signers):
+    """A composer with one payment per signer, alternating between them."""
+    atc = AtomicTransactionComposer()
+    for i, signer in enumerate(signers):
+        _, addr = account.generate_account()
+        txn = transaction.PaymentTxn(addr, _sp(), addr, i)
+        atc.add_transaction(TransactionWithSigner(txn, signer))
+    return atc
+
+
+def _encoded(stxns):
+    return [encoding.msgpack_encode(s) for s in stxns]
+
+
+class TestMethodCallTemplate(unittest.TestCase):
+    def setUp(self):
+        sk, self.sender = account.generate_account()
+        self.signer = AccountTransactionSigner(sk)
+        # 17 ABI arguments, so the last three are packed into a tuple
+        self.method = abi.Method.from_signature(
+            "big(uint64,account,application,asset,pay,string{})void".format(
+                ",uint8" * 12
+            )
+        )
+
+    def _args(self, i):
+        payment = transaction.PaymentTxn(self.sender, _sp(), self.sender, i)
+        return [
+            i,
+            account.generate_account()[1],
+            101,
+            200 + i,
+            TransactionWithSigner(payment, self.signer),
+            "call {}".format(i),
+        ] + list(range(i, i + 12))
+
+    def test_bind_matches_add_method_call(self):
+        sp = transaction.SuggestedParams(2, 1, 1000, GH, min_fee=1000)
+        kwargs = dict(
+            accounts=[self.sender],
+            foreign_apps=[7],
+            boxes=[(7, b"box"), (101, b"arg app")],
+            note=b"note",
+        )
+        template = MethodCallTemplate(
+            5, self.method, self.sender, sp, self.signer, **kwargs
+        )
+        for i in range(1, 3):
+            args = self._args(i)
+            expected = AtomicTransactionComposer().add_method_call(
+                5, self.method, self.sender, sp, self.signer, args, **kwargs
+            )
+            atc = AtomicTransactionComposer().add_template_call(template, args)
+            self.assertEqual(
+                [t.txn for t in atc.txn_list],
+                [t.txn for t in expected.txn_list],
+            )
+            self.assertEqual(len(atc.txn_list[1].txn.app_args), 16)
+            self.assertEqual(atc.method_dict, {1: self.method})
+        # bound calls do not share reference arrays
+        first, second = (template.bind(self._args(i))[1].txn for i in (3, 4))
+        self.assertEqual(len(first.accounts), 2)
+        self.assertEqual(len(second.accounts), 2)
+        self.assertNotEqual(first.accounts, second.accounts)
+
+        new_sp = transaction.SuggestedParams(1000, 50, 60, GH, flat_fee=True)
+        txn = template.bind(self._args(1), sp=new_sp, note=b"other")[1].txn
+        self.assertEqual(
+            (txn.fee, txn.first_valid_round, txn.last_valid_round, txn.note),
+            (1000, 50, 60, b"other"),
+        )
+
+    def test_errors(self):
+        with self.assertRaises(error.AtomicTransactionComposerError):
+            MethodCallTemplate(0, self.method, self.sender, _sp(), self.signer)
+        template = MethodCallTemplate(
+            5, self.method, self.sender, _sp(), self.signer
+        )
+        with self.assertRaises(error.AtomicTransactionComposerError):
+            template.bind(self._args(1)[:-1])
+        args = self._args(1)
+        args[4] = args[4].txn
+        with self.assertRaises(error.AtomicTransactionComposerError):
+            template.bind(args)
+
+
+class TestCloneWithParams(unittest.TestCase):
+    def setUp(self):
+        sk, self.sender = account.generate_account()
+        self.signer = AccountTransactionSigner(sk)
+        self.calls = [(1, 2), (3, 4), (5, 6)]
+
+    def test_new_rounds(self):
+        fake = _FakeAlgod()
+        atc = _method_composer(self.signer, self.sender, self.calls)
+        atc.execute(fake.client(), 5)
+        tx_ids = atc.tx_ids[:]
+
+        sp = transaction.SuggestedParams(1000, 100, 1100, GH, flat_fee=True)
+        retry = atc.clone_with_params(sp)
+        self.assertEqual(
+            retry.get_status(), AtomicTransactionComposerStatus.BUILT
+        )
+        # the same as rebuilding the group under the new params
+        reference = AtomicTransactionComposer()
+        for a, b in self.calls:
+            reference.add_method_call(
+                1, ADD, self.sender, sp, self.signer, method_args=[a, b]
+            )
+        reference.build_group()
+        self.assertEqual(retry.tx_ids, reference.tx_ids)
+        for old, new in zip(atc.txn_list, retry.txn_list):
+            self.assertIs(new.txn.app_args, old.txn.app_args)
+            self.assertIs(new.signer, old.signer)
+        self.assertEqual(atc.tx_ids, tx_ids)
+        self.assertEqual(atc.txn_list[0].txn.first_valid_round, 1)
+
+        result = retry.execute(fake.client(), 5)
+        self.assertEqual(
+            [r.return_value for r in result.abi_results], [3, 7, 11]
+        )
+
+    def test_signatures_reused_when_unchanged(self):
+        atc = _method_composer(self.signer, self.sender, self.calls)
+        stxns = atc.gather_signatures()
+        same = atc.clone_with_params(_sp())
+        self.assertEqual(
+            same.get_status(), AtomicTransactionComposerStatus.SIGNED
+        )
+        self.assertEqual(same.tx_ids, atc.tx_ids)
+        self.assertEqual(
+            [id(s) for s in same.signed_txns], [id(s) for s in stxns]
+        )
+
+        sp = transaction.SuggestedParams(2, 1, 1000, GH, min_fee=1000)
+        txn = atc.clone_with_params(sp, update_fees=True).txn_list[0].txn
+        self.assertEqual(txn.fee, max(2 * txn.estimate_size(), 1000))
+        self.assertEqual(atc.txn_list[0].txn.fee, 1000)
+
+
+class TestGatherSignatures(unittest.TestCase):
+    def setUp(self):
+        self.signers = [
+            AccountTransactionSigner(account.generate_account()[0])
+            for _ in range(3)
+        ]
+
+    def test_concurrent_signing_matches_sequential(self):
+        atc = _composer(self.signers + self.signers)
+        reference = atc.clone()
+        with ThreadPoolExecutor(3) as executor:
+            got = atc.gather_signatures(executor=executor)
+            # signatures are cached once SIGNED
+            self.assertIs(atc.gather_signatures(executor=executor), got)
+        self.assertEqual(
+            _encoded(got), _encoded(reference.gather_signatures())
+        )
+        self.assertEqual(
+            atc.get_status(), AtomicTransactionComposerStatus.SIGNED
+        )
+
+    def test_errors_are_aggregated(self):
+        atc = _composer(
+            [
+                self.signers[0],
+                _FailingSigner(),
+                self.signers[1],
+                _FailingSigner(),
+            ]
+        )
+        with ThreadPoolExecutor(4) as executor:
+            with self.assertRaises(
+                error.AtomicTransactionComposerSigningError
+            ) as cm:
+                atc.gather_signatures(executor=executor)
+        self.assertEqual(
+            [indexes for indexes, _ in cm.exception.errors], [[1], [3]]
+        )
+        self.assertEqual(
+            atc.get_status(), AtomicTransactionComposerStatus.BUILT
+        )
+
+    def test_timeout(self):
+        release = threading.Event()
+        atc = _composer([self.signers[0], _BlockingSigner(release)])
+        try:
+            with self.assertRaises(
+                error.AtomicTransactionComposerSigningError
+            ) as cm:
+                atc.gather_signatures(timeout=0.05)
+        finally:
+            release.set()
+        [(indexes, e)] = cm.exception.errors
+        self.assertEqual(indexes, [1])
+        self.assertIsInstance(e, TimeoutError)
+
+    def test_timeout_runs_from_each_signer_start(self):
+        sk = account.generate_account()[0]
+        # with one worker the second signer starts after 0.2s, and each
+        # finishes within its own timeout
+        atc = _composer([_SlowSigner(sk, 0.2), _SlowSigner(sk, 0.2)])
+        with ThreadPoolExecutor(1) as executor:
+            got = atc.gather_signatures(executor=executor, timeout=0.35)
+        self.assertEqual(len(got), 2)
+
+        # a signer never given a worker fails once the running one times out
+        release = threading.Event()
+        atc = _composer([_BlockingSigner(release), self.signers[0]])
+        with ThreadPoolExecutor(1) as executor:
+            try:
+                with self.assertRaises(
+                    error.AtomicTransactionComposerSigningError
+                ) as cm:
+                    atc.gather_signatures(executor=executor, timeout=0.05)
+            finally:
+                release.set()
+        self.assertEqual(
+            [indexes for indexes, _ in cm.exception.errors], [[0], [1]]
+        )
+        for _, e in cm.exception.errors:
+            self.assertIsInstance(e, TimeoutError)
+
+    def test_async_matches_sequential(self):
+        atc = _composer(self.signers + self.signers)
+        reference = atc.clone()
+        got = asyncio.run(atc.gather_signatures_async())
+        self.assertEqual(
+            _encoded(got), _encoded(reference.gather_signatures())
+        )
+        self.assertEqual(
+            atc.get_status(), AtomicTransactionComposerStatus.SIGNED
+        )
+
+        atc = _composer([self.signers[0], _FailingSigner()])
+        with self.assertRaises(error.AtomicTransactionComposerSigningError):
+            asyncio.run(atc.gather_signatures_async(timeout=5))
+
+
+class TestPlanFees(unittest.TestCase):
+    def setUp(self):
+        sk, self.sender = account.generate_account()
+        self.signer = AccountTransactionSigner(sk)
+
+    def _simulations(self, fake):
+        return [p for _, p in fake.requests if p.endswith("/simulate")]
+
+    def test_fee_is_set_from_group_usage(self):
+        fake = _FakeAlgod()
+        cache = SimulationCache()
+        atc = _method_composer(self.signer, self.sender, [(1, 2), (3, 4)])
+        # 2 * 1.250001 minimum fees, rounded up, less the other call's fee
+        self.assertEqual(atc.plan_fees(fake.client(), 1000, cache=cache), 1501)
+        self.assertEqual(atc.txn_list[0].txn.fee, 1501)
+        self.assertEqual(atc.txn_list[1].txn.fee, 1000)
+        self.assertEqual(
+            atc.get_status(), AtomicTransactionComposerStatus.BUILDING
+        )
+        self.assertEqual(len(self._simulations(fake)), 1)
+        self.assertEqual(
+            [
+                r.return_value
+                for r in atc.execute(fake.client(), 5).abi_results
+            ],
+            [3, 7],
+        )
+
+        # same methods and argument shapes: served from the cache
+        other = _method_composer(self.signer, self.sender, [(5, 6), (7, 8)])
+        self.assertEqual(
+            other.plan_fees(fake.client(), 2000, fee_index=1, cache=cache),
+            4001,
+        )
+        self.assertEqual(len(self._simulations(fake)), 1)
+
+        # another group shape is simulated
+        single = _method_composer(self.signer, self.sender, [(5, 6)])
+        self.assertEqual(
+            single.plan_fees(fake.client(), 1000, cache=cache), 1251
+        )
+        self.assertEqual(len(self._simulations(fake)), 2)
+
+    def test_caching_is_opt_in_and_per_network(self):
+        fake = _FakeAlgod()
+        for _ in range(2):
+            atc = _method_composer(self.signer, self.sender, [(1, 2)])
+            atc.plan_fees(fake.client(), 1000)
+        self.assertEqual(len(self._simulations(fake)), 2)
+
+        cache = SimulationCache()
+        atc = _method_composer(self.signer, self.sender, [(1, 2)])
+        atc.plan_fees(fake.client(), 1000, cache=cache)
+        other = _method_composer(self.signer, self.sender, [(1, 2)])
+        other.txn_list[0].txn.genesis_hash = base64.b64encode(
+            bytes([1]) * 32
+        ).decode()
+        other.plan_fees(fake.client(), 1000, cache=cache)
+        self.assertEqual(len(self._simulations(fake)), 4)
+
+    def test_min_fee_is_fetched_with_simulations(self):
+        fake = _FakeAlgod()
+        cache = SimulationCache()
+        for _ in range(2):
+            atc = _method_composer(self.signer, self.sender, [(1, 2)])
+            self.assertEqual(atc.plan_fees(fake.client(), cache=cache), 1251)
+        params = [p for _, p in fake.requests if p.endswith("/params")]
+        self.assertEqual(len(params), 1)
+        self.assertEqual(len(self._simulations(fake)), 1)
+
+    def test_async_composer(self):
+        fake = _FakeAlgod()
+        atc = _method_composer(
+            self.signer,
+            self.sender,
+            [(1, 2), (3, 4)],
+            cls=AsyncAtomicTransactionComposer,
+        )
+        fee = asyncio.run(
+            atc.plan_fees(fake.async_client(), cache=SimulationCache())
+        )
+        self.assertEqual(fee, 1501)
+        self.assertEqual(atc.txn_list[0].txn.fee, 1501)
+        self.assertEqual(
+            atc.get_status(), AtomicTransactionComposerStatus.BUILDING
+        )
+        result = asyncio.run(atc.execute(fake.async_client(), 5))
+        self.assertEqual([r.return_value for r in result.abi_results], [3, 7])
+
+    def test_expiry_and_errors(self):
+        fake = _FakeAlgod()
+        cache = SimulationCache(ttl=0)
+        for _ in range(2):
+            atc = _method_composer(self.signer, self.sender, [(1, 2)])
+            atc.plan_fees(fake.client(), 1000, cache=cache)
+        self.assertEqual(len(self._simulations(fake)), 2)
+
+        with self.assertRaises(error.AtomicTransactionComposerError):
+            atc.plan_fees(fake.client(), 1000, max_fee=1000, cache=cache)
+        with self.assertRaises(error.AtomicTransactionComposerError):
+            atc.plan_fees(fake.client(), 1000, fee_index=1, cache=cache)
+        atc.build_group()
+        with self.assertRaises(error.AtomicTransactionComposerError):
+            atc.plan_fees(fake.client(), 1000, cache=cache)
+
+
+class TestPopulateResources(unittest.TestCase):
+    def setUp(self):
+        sk, self.sender = account.generate_account()
+        self.signer = AccountTransactionSigner(sk)
+        self.addrs = [account.generate_account()[1] for _ in range(5)]
+
+    def _fake(self):
+        a, b, c, d, e = self.addrs
+        return _FakeAlgod(
+            unnamed={
+                0: {
+                    "accounts": [a, d, e],
+                    "boxes": [
+                        {"app": 1, "name": base64.b64encode(b"k").decode()}
+                    ],
+                    "asset-holdings": [{"account": b, "asset": 7}],
+                }
+            },
+            shared={
+                "app-locals": [{"account": c, "app": 9}],
+                "extra-box-refs": 1,
+                "apps": [5],
+            },
+        )
+
+    def test_references_are_appended(self):
+        a, b, c, d, e = self.addrs
+        fake = self._fake()
+        atc = _method_composer(self.signer, self.sender, [(1, 2), (3, 4)])
+        self.assertIs(atc.populate_resources(fake.client()), atc)
+        first, second = (t.txn for t in atc.txn_list)
+        self.assertEqual(first.accounts, [a, d, e, b])
+        self.assertEqual(first.foreign_assets, [7])
+        self.assertEqual(first.foreign_apps, [5])
+        self.assertEqual(
+            [(r.app_index, r.name) for r in first.boxes],
+            [(0, b"k"), (0, b"")],
+        )
+        # no room for another account in the first call
+        self.assertEqual(second.accounts, [c])
+        self.assertEqual(second.foreign_apps, [9])
+        self.assertIsNone(second.boxes)
+        result = atc.execute(fake.client(), 5)
+        self.assertEqual([r.return_value for r in result.abi_results], [3, 7])
+
+    def test_access_list_and_cache(self):
+        a = self.addrs[0]
+        fake = _FakeAlgod(
+            unnamed={0: {"asset-holdings": [{"account": a, "asset": 7}]}}
+        )
+        cache = SimulationCache()
+        for _ in range(2):
+            atc = AtomicTransactionComposer()
+            txn = transaction.ApplicationCallTxn(
+                self.sender, _sp(), 1, 0, accounts=[a], use_access=True
+            )
+            atc.add_transaction(TransactionWithSigner(txn, self.signer))
+            atc.populate_resources(fake.client(), cache=cache)
+            self.assertEqual(
+                txn.resources,
+                [
+                    ResourceReference(address=a),
+                    ResourceReference(asset_id=7),
+                    ResourceReference(
+                        holding_reference=HoldingRef(
+                            asset_index=2, addr_index=1
+                        )
+                    ),
+                ],
+            )
+        simulations = [p for _, p in fake.requests if p.endswith("/simulate")]
+        self.assertEqual(len(simulations), 1)
+
+    def test_async_composer(self):
+        a, b, c, d, e = self.addrs
+        atc = _method_composer(
+            self.signer,
+            self.sender,
+            [(1, 2), (3, 4)],
+            cls=AsyncAtomicTransactionComposer,
+        )
+        fake = self._fake()
+        self.assertIs(
+            asyncio.run(atc.populate_resources(fake.async_client())), atc
+        )
+        first, second = (t.txn for t in atc.txn_list)
+        self.assertEqual(first.accounts, [a, d, e, b])
+        self.assertEqual(second.accounts, [c])
+        result = asyncio.run(atc.execute(fake.async_client(), 5))
+        self.assertEqual([r.return_value for r in result.abi_results], [3, 7])
+
+    def test_errors(self):
+        payment = _composer([self.signer])
+        with self.assertRaises(error.AtomicTransactionComposerError):
+            payment.populate_resources(
+                _FakeAlgod(unnamed={0: {"accounts": self.addrs[:1]}}).client()
+            )
+        atc = _method_composer(self.signer, self.sender, [(1, 2)])
+        with self.assertRaises(error.AtomicTransactionComposerError):
+            atc.populate_resources(
+                _FakeAlgod(unnamed={0: {"accounts": self.addrs}}).client()
+            )
+
+
+class TestPipelinedSubmitter(unittest.TestCase):
+    def setUp(self):
+        sk, self.sender = account.generate_account()
+        self.signer = AccountTransactionSigner(sk)
+
+    def test_groups_resolve_from_block_txids(self):
+        fake = _FakeAlgod()
+        composers = [
+            _method_composer(self.signer, self.sender, [(i, i), (i, 1)])
+            for i in range(6)
+        ]
+        payments = _composer([self.signer]).gather_signatures()
+        with PipelinedSubmitter(fake.client(), max_in_flight=2) as submitter:
+            futures = submitter.submit_all(composers + [payments])
+        for i, (atc, future) in enumerate(zip(composers, futures)):
+            result = future.result(5)
+            self.assertEqual(
+                [r.return_value for r in result.abi_results], [2 * i, i + 1]
+            )
+            self.assertEqual(result.tx_ids, atc.tx_ids)
+            self.assertEqual(
+                atc.get_status(), AtomicTransactionComposerStatus.COMMITTED
+            )
+        self.assertEqual(futures[-1].result(5).abi_results, [])
+        # pending info is only fetched for method call results
+        pending = [p for _, p in fake.requests if "/pending/" in p]
+        self.assertEqual(len(pending), 12)
+
+    def test_failures(self):
+        client = _FakeAlgod().client()
+        stxns = _composer([self.signer]).gather_signatures()
+
+        def send_transactions(txns, **kwargs):
+            if txns is stxns:
+                raise error.AlgodHTTPError("rejected", 400)
+            # accepted, but never confirmed
+            return ""
+
+        client.send_transactions = send_transactions
+        with PipelinedSubmitter(client, wait_rounds=3) as submitter:
+            with self.assertRaises(error.AlgodHTTPError):
+                submitter.submit(stxns)
+            lost = submitter.submit(_composer([self.signer]))
+        with self.assertRaises(error.ConfirmationTimeoutError):
+            lost.result(5)
+
+    def test_duplicate_group_shares_its_future(self):
+        fake = _FakeAlgod()
+        client = fake.client()
+        get_block_txids = client.get_block_txids
+        submitted = threading.Event()
+
+        def held_get_block_txids(rnd, **kwargs):
+            # keep the groups in flight until the duplicates are submitted
+            submitted.wait(5)
+            return get_block_txids(rnd, **kwargs)
+
+        client.get_block_txids = held_get_block_txids
+        stxns = _composer([self.signer]).gather_signatures()
+        atc = _method_composer(self.signer, self.sender, [(1, 2)])
+        with PipelinedSubmitter(client, max_in_flight=4) as submitter:
+            first = submitter.submit(stxns)
+            again = submitter.submit(list(stxns))
+            call = submitter.submit(atc)
+            call_again = submitter.submit(atc)
+            submitted.set()
+        self.assertIs(again, first)
+        self.assertIs(call_again, call)
+        self.assertEqual(first.result(5).tx_ids, [stxns[0].get_txid()])
+        self.assertEqual(
+            [r.return_value for r in call.result(5).abi_results], [3]
+        )
+        sends = [p for _, p in fake.requests if p == "/v2/transactions"]
+        self.assertEqual(len(sends), 2)
+        # every slot of the window is free again
+        for _ in range(4):
+            self.assertTrue(submitter._window.acquire(blocking=False))
+
+    def test_read_errors_are_retried(self):
+        client = _FakeAlgod().client()
+        get_block_txids = client.get_block_txids
+        failures = []
+
+        def flaky_get_block_txids(rnd, **kwargs):
+            if len(failures) < 3:
+                failures.append(rnd)
+                raise error.AlgodHTTPError("unavailable", 503)
+            return get_block_txids(rnd, **kwargs)
+
+        client.get_block_txids = flaky_get_block_txids
+        submitter = PipelinedSubmitter(client)
+        submitter.RETRY_DELAY = 0.01
+        with submitter:
+            future = submitter.submit(
+                _method_composer(self.signer, self.sender, [(1, 2)])
+            )
+        self.assertEqual(len(failures), 3)
+        self.assertEqual(
+            [r.return_value for r in future.result(5).abi_results], [3]
+        )
+
+    def test_result_errors_fail_their_group(self):
+        client = _FakeAlgod().client()
+        composers = [
+            _method_composer(self.signer, self.sender, [(i, i)])
+            for i in range(2)
+        ]
+
+        def broken_tx_infos(client, *args, **kwargs):
+            raise error.AlgodHTTPError("unavailable", 503)
+
+        composers[0]._method_tx_infos = broken_tx_infos
+        with PipelinedSubmitter(client) as submitter:
+            futures = submitter.submit_all(composers)
+        with self.assertRaises(error.AlgodHTTPError):
+            futures[0].result(5)
+        self.assertEqual(
+            [r.return_value for r in futures[1].result(5).abi_results], [2]
+        )
+
+
+class TestSimulateGroups(unittest.TestCase):
+    def setUp(self):
+        sk, self.sender = account.generate_account()
+        self.signer = AccountTransactionSigner(sk)
+
+    def _composers(self):
+        return [
+            _method_composer(self.signer, self.sender, [(i, 1), (i, 2)])
+            for i in range(5)
+        ]
+
+    def test_results_map_back_to_composers(self):
+        request = models.SimulateRequest(txn_groups=[], allow_more_logs=True)
+        executor = ThreadPoolExecutor(2)
+        for kwargs, requests in [
+            ({}, 1),
+            ({"chunk_size": 2}, 3),
+            ({"chunk_size": 2, "executor": executor}, 3),
+        ]:
+            fake = _FakeAlgod()
+            composers = self._composers()
+            got = simulate_groups(
+                fake.client(), composers, request=request, **kwargs
+            )
+            self.assertEqual(len(fake.requests), requests)
+            self.assertEqual(
+                [[r.return_value for r in g.abi_results] for g in got],
+                [[i + 1, i + 2] for i in range(5)],
+            )
+            self.assertEqual(
+                [g.tx_ids for g in got], [atc.tx_ids for atc in composers]
+            )
+        executor.shutdown()
+        self.assertEqual(request.txn_groups, [])
+
+        composers = self._composers()
+        expected = composers[3].clone().simulate(_FakeAlgod().client())
+        got = simulate_groups(_FakeAlgod().client(), composers)[3]
+        self.assertEqual(
+            got.abi_results[1].tx_info, expected.abi_results[1].tx_info
+        )
+
+    def test_committed_composer_is_rejected(self):
+        atc = self._composers()[0]
+        atc.execute(_FakeAlgod().client(), 5)
+        with self.assertRaises(error.AtomicTransactionComposerError):
+            simulate_groups(_FakeAlgod().client(), [atc])
+
+
+class TestExecute(unittest.TestCase):
+    def setUp(self):
+        sk, self.sender = account.generate_account()
+        self.signer = AccountTransactionSigner(sk)
+        self.calls = [(1, 2), (3, 4), (5, 6)]
+
+    def _pending(self, fake):
+        return [p for _, p in fake.requests if "/pending/" in p]
+
+    def test_confirmed_info_is_reused(self):
+        fake = _FakeAlgod()
+        atc = _method_composer(self.signer, self.sender, self.calls)
+        result = atc.execute(fake.client(), 5)
+        self.assertEqual(
+            [r.return_value for r in result.abi_results], [3, 7, 11]
+        )
+        # one request while confirming, then one per later method call
+        self.assertEqual(
+            self._pending(fake),
+            ["/v2/transactions/pending/" + t for t in atc.tx_ids],
+        )
+
+        fake = _FakeAlgod()
+        atc = _method_composer(self.signer, self.sender, self.calls)
+        with ThreadPoolExecutor(2) as executor:
+            result = atc.execute(fake.client(), 5, executor=executor)
+        self.assertEqual(
+            [r.return_value for r in result.abi_results], [3, 7, 11]
+        )
+        self.assertEqual(len(self._pending(fake)), 3)
+
+    def test_lazy_results(self):
+        atc = _method_composer(self.signer, self.sender, self.calls)
+        result = atc.execute(_FakeAlgod().client(), 5, lazy=True)
+        first, second, third = result.abi_results
+        self.assertIsInstance(first, LazyABIResult)
+        self.assertIsNone(first._decoded)
+        self.assertEqual(second.return_value, 7)
+        self.assertEqual(second.raw_value, (7).to_bytes(8, "big"))
+        self.assertIsNone(second.decode_error)
+        self.assertIsNone(first._decoded)
+        self.assertEqual(third.tx_id, atc.tx_ids[2])
+
+        atc = _method_composer(
+            self.signer,
+            self.sender,
+            self.calls,
+            cls=AsyncAtomicTransactionComposer,
+        )
+        result = asyncio.run(
+            atc.execute(_FakeAlgod().async_client(), 5, lazy=True)
+        )
+        self.assertEqual(
+            [r.return_value for r in result.abi_results], [3, 7, 11]
+        )
+
+
+class _CountingSigner(AccountTransactionSigner):
+    def __init__(self, private_key, signs_across_groups=True):
+        super().__init__(private_key)
+        self.signs_across_groups = signs_across_groups
+        self.calls = 0
+
+    def sign_transactions(self, txn_group, indexes):
+        self.calls += 1
+        if not self.signs_across_groups:
+            # a signer that checks its txn_group is a single group
+            group = txn_group[0].group
+            assert all(txn.group == group for txn in txn_group)
+            assert len(txn_group) == len({txn.get_txid() for txn in txn_group})
+        return super().sign_transactions(txn_group, indexes)
+
+
+class TestBatchAtomicTransactionComposer(unittest.TestCase):
+    def setUp(self):
+        sk, self.sender = account.generate_account()
+        self.signers = [
+            _CountingSigner(sk),
+            _CountingSigner(sk, signs_across_groups=False),
+        ]
+        self.deposit = abi.Method.from_signature("deposit(pay,uint64)uint64")
+
+    def _payment(self, amount):
+        return transaction.PaymentTxn(self.sender, _sp(), self.sender, amount)
+
+    def _batch(self):
+        batch = BatchAtomicTransactionComposer()
+        for i in range(20):
+            batch.add_transaction(
+                TransactionWithSigner(self._payment(i), self.signers[i % 2])
+            )
+        # the call and its payment argument do not fit in the second group
+        for i in range(11):
+            batch.add_transaction(
+                TransactionWithSigner(self._payment(i), self.signers[0])
+            )
+        pay = TransactionWithSigner(self._payment(100), self.signers[1])
+        batch.add_method_call(
+            1, self.deposit, self.sender, _sp(), self.signers[0], [pay, 1]
+        )
+        batch.new_group()
+        batch.new_group()
+        batch.add_transaction(
+            TransactionWithSigner(self._payment(0), self.signers[1])
+        )
+        return batch
+
+    def test_grouping_and_batched_signing(self):
+        batch = self._batch()
+        self.assertEqual(batch.get_tx_count(), 34)
+        self.assertEqual(
+            [atc.get_tx_count() for atc in batch.groups], [16, 15, 2, 1]
+        )
+        self.assertEqual(batch.groups[2].method_dict, {1: self.deposit})
+
+        signed = batch.gather_signatures()
+        # the second signer does not sign across groups, so it is called
+        # once for each of the four groups it signs in
+        self.assertEqual([s.calls for s in self.signers], [1, 4])
+        self.assertEqual(
+            batch.get_statuses(), [AtomicTransactionComposerStatus.SIGNED] * 4
+        )
+        for atc, stxns in zip(batch.groups, signed):
+            reference = atc.clone()
+            self.assertEqual(
+                _encoded(stxns), _encoded(reference.gather_signatures())
+            )
+            self.assertEqual(
+                stxns[0].transaction.group, atc.txn_list[0].txn.group
+            )
+        # signed groups are not signed again
+        batch.gather_signatures()
+        self.assertEqual([s.calls for s in self.signers], [1, 4])
+
+        with self.assertRaises(error.AtomicTransactionComposerError):
+            batch.add_transaction(
+                TransactionWithSigner(self._payment(0), self.signers[0])
+            )
+        with self.assertRaises(error.AtomicTransactionComposerError):
+            BatchAtomicTransactionComposer(17)
+
+    def test_execute_reports_each_group(self):
+        client = _FakeAlgod().client()
+        send = client.send_transactions
+        rejected = []
+
+        def send_transactions(txns, **kwargs):
+            if not rejected:
+                rejected.append(txns)
+                raise error.AlgodHTTPError("rejected", 400)
+            return send(txns, **kwargs)
+
+        client.send_transactions = send_transactions
+        batch = self._batch()
+        outcomes = batch.execute(client, max_in_flight=2)
+        self.assertIsInstance(outcomes[0], error.AlgodHTTPError)
+        self.assertEqual(outcomes[2].tx_ids, batch.groups[2].tx_ids)
+        self.assertEqual(
+            batch.get_statuses(),
+            [AtomicTransactionComposerStatus.SIGNED]
+            + [AtomicTransactionComposerStatus.COMMITTED] * 3,
+        )
+
+        # executing again retries the failed group only
+        [retried] = batch.execute(client)
+        self.assertEqual(retried.tx_ids, batch.groups[0].tx_ids)
+        self.assertEqual(
+            batch.get_statuses(),
+            [AtomicTransactionComposerStatus.COMMITTED] * 4,
+        )
+
+
+class TestAsyncAtomicTransactionComposer(unittest.TestCase):
+    def setUp(self):
+        sk, self.sender = account.generate_account()
+        self.signer = AccountTransactionSigner(sk)
+        self.calls = [(1, 2), (3, 4), (5, 6)]
+
+    def test_execute_matches_blocking_composer(self):
+        fake = _FakeAlgod()
+        expected = _method_composer(
+            self.signer, self.sender, self.calls
+        ).execute(fake.client(), 5)
+        atc = _method_composer(
+            self.signer,
+            self.sender,
+            self.calls,
+            cls=AsyncAtomicTransactionComposer,
+        )
+        got = asyncio.run(atc.execute(_FakeAlgod().async_client(), 5))
+        self.assertEqual([r.return_value for r in got.abi_results], [3, 7, 11])
+        self.assertEqual(
+            [r.return_value for r in got.abi_results],
+            [r.return_value for r in expected.abi_results],
+        )
+        self.assertEqual(got.tx_ids, expected.tx_ids)
+        self.assertEqual(got.confirmed_round, expected.confirmed_round)
+        self.assertEqual(
+            atc.get_status(), AtomicTransactionComposerStatus.COMMITTED
+        )
+        with self.assertRaises(error.AtomicTransactionComposerError):
+            asyncio.run(atc.submit(_FakeAlgod().async_client()))
+
+    def test_simulate_and_clone(self):
+        atc = _method_composer(
+            self.signer,
+            self.sender,
+            self.calls,
+            cls=AsyncAtomicTransactionComposer,
+        )
+        result = asyncio.run(atc.simulate(_FakeAlgod().async_client()))
+        self.assertEqual(
+            [r.return_value for r in result.abi_results], [3, 7, 11]
+        )
+        self.assertIsInstance(atc.clone(), AsyncAtomicTransactionComposer)
+
+    def test_send_raw_transaction_takes_base64(self):
+        fake = _FakeAlgod()
+        stxns = _composer([self.signer]).gather_signatures()
+        txid = asyncio.run(
+            fake.async_client().send_raw_transaction(
+                encoding.msgpack_encode(stxns[0])
+            )
+        )
+        self.assertEqual(txid, stxns[0].get_txid())
+
+    def test_http_errors(self):
+        async def transport(method, url, headers, data, timeout):
+            return 400, b'{"message": "overspend", "data": {"x": 1}}'
+
+        client = AsyncAlgodClient("", "http://algod", transport=transport)
+        with self.assertRaises(error.AlgodHTTPError) as cm:
+            asyncio.run(client.status())
+        self.assertEqual(str(cm.exception), "overspend")
+        self.assertEqual(cm.exception.code, 400)
+        self.assertEqual(cm.exception.data, {"x": 1})
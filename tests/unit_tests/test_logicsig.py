@@ -71,6 +71,36 @@ class TestLogicSig(unittest.TestCase):
         verified = lsig.verify(public_key)
         self.assertFalse(verified)
 
+    def test_trusted_decode_skips_program_check(self):
+        # an ASCII-printable "program" fails the heuristic on a normal decode
+        ascii_program = b"int 1"
+        lsig = transaction.LogicSig._trusted(ascii_program)
+        encoded = encoding.msgpack_encode(lsig)
+        with self.assertRaises(error.InvalidProgram):
+            encoding.msgpack_decode(encoded)
+        decoded = encoding.msgpack_decode(encoded, trusted=True)
+        self.assertEqual(decoded, lsig)
+
+        la = transaction.LogicSigAccount(sampleProgram, sampleArgs)
+        la.lsig.logic = ascii_program
+        encoded = encoding.msgpack_encode(la)
+        with self.assertRaises(error.InvalidProgram):
+            encoding.msgpack_decode(encoded)
+        self.assertEqual(encoding.msgpack_decode(encoded, trusted=True), la)
+
+    def test_program_check_verdict_is_cached(self):
+        transaction._program_sanity_problem.cache_clear()
+        messages = []
+        for _ in range(2):
+            transaction.LogicSig(sampleProgram)
+            with self.assertRaises(error.InvalidProgram) as cm:
+                transaction.LogicSig(b"int 1")
+            messages.append(str(cm.exception))
+        # a cached rejection raises the same error as a fresh check
+        self.assertEqual(messages[0], messages[1])
+        info = transaction._program_sanity_problem.cache_info()
+        self.assertEqual((info.hits, info.misses), (2, 2))
+
     def test_signature(self):
         private_key, address = account.generate_account()
         public_key = encoding.decode_address(address)
@@ -550,6 +580,51 @@ class TestLogicSigTransaction(unittest.TestCase):
         expected = "g6Rsc2lng6NhcmeSxAEBxAICA6FsxAUBIAEBIqVsbXNpZ4Omc3Vic2lnk4KicGvEIBt+wLBL6mG3lpCX5sv0B+EIpwU1HQvJir6xIgmoq4F4oXPEQIwzZcSx0RNw8j9w13dGn+HZR3m/TY1kgXZJNe94TMx2V2zA4O/pwUb6YHba+s5V7przG3aOvDK07BosjD3AZwaConBrxCAJYzIJU3OJ8HVnEXc5kcfQPhtzyMT1K/av8BqiXPnCcaFzxEBPVtR92cCxahX1iGTp50PVMQkf969ssoHfNA0VOiNupdkXc9n/l2WO9+pj8Ddozf4ovorGgnrzca3ZhKc46uUNgaJwa8Qg5/D4TQaBHfnzHI2HixFV9GcdUaGFwgCQhmf0SVhwaKGjdGhyAqF2AaRzZ25yxCCNkrSJkAFzoE36Q1mjZmpq/OosQqBd2cH3PuulR4A36aN0eG6Ko2FtdM0TiKNmZWXOAANPqKJmds4ADtbco2dlbq10ZXN0bmV0LXYzMS4womdoxCAmCyAJoJOohot5WHIvpeVG7eftF+TYXEx4r7BFJpDt0qJsds4ADtrEpG5vdGXECLRReTn8+tJxo3JjdsQgtMYiaKTDNVD1im3UuMojnJ8dELNBqn4aNuPOYfv8+Yqjc25kxCC0xiJopMM1UPWKbdS4yiOcnx0Qs0Gqfho2485h+/z5iqR0eXBlo3BheQ=="
         self._test_sign_txn(lsigAccount, sender, expected)
 
+    def test_signer_shares_cached_lsig_encoding(self):
+        # every envelope built by the signer matches the dictify path, and
+        # the LogicSig is encoded once for the whole batch
+        from algosdk.atomic_transaction_composer import (
+            LogicSigTransactionSigner,
+        )
+
+        lsigAccount = transaction.LogicSigAccount(sampleProgram, sampleArgs)
+        sp = transaction.SuggestedParams(1000, 1, 1000, "", flat_fee=True)
+        sender = lsigAccount.address()
+        txns = [
+            transaction.PaymentTxn(sender, sp, self.otherAddr, i)
+            for i in range(1, 4)
+        ]
+        stxns = LogicSigTransactionSigner(lsigAccount).sign_transactions(
+            txns, [0, 1, 2]
+        )
+        encoded = lsigAccount.lsig._encode()
+        for stxn in stxns:
+            self.assertIs(stxn.lsig._encode(), encoded)
+            self.assertEqual(
+                encoding.msgpack_encode(stxn),
+                encoding.msgpack_encode(stxn.dictify()),
+            )
+
+    def test_cached_encoding_and_address_follow_delegation(self):
+        lsigAccount = transaction.LogicSigAccount(sampleProgram, sampleArgs)
+        escrow = lsigAccount.address()
+        escrow_enc = lsigAccount.lsig._encode()
+        self.assertEqual(escrow, lsigAccount.lsig.address())
+
+        msig = sampleMsig.get_multisig_account()
+        lsigAccount.sign_multisig(msig, sampleAccount1)
+        self.assertEqual(lsigAccount.address(), msig.address())
+        one_sig_enc = lsigAccount.lsig._encode()
+        self.assertNotEqual(one_sig_enc, escrow_enc)
+
+        # appending a member signature mutates the multisig in place
+        lsigAccount.append_to_multisig(sampleAccount2)
+        self.assertNotEqual(lsigAccount.lsig._encode(), one_sig_enc)
+        self.assertEqual(
+            lsigAccount.lsig._encode(),
+            encoding._canonical_msgpack(lsigAccount.lsig.dictify()),
+        )
+
 
 class TestMultisig(unittest.TestCase):
     def test_merge(self):
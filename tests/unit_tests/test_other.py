@@ -2,17 +2,22 @@ import base64
 import random
 import unittest
 
+import msgpack
 import pytest
 from algosdk import (
     account,
+    auction,
     constants,
     encoding,
     error,
     logic,
     mnemonic,
+    transaction,
     util,
     wordlist,
 )
+from algosdk.v2client import algod
+from concurrent.futures import ThreadPoolExecutor
 from nacl.signing import SigningKey
 
 
@@ -104,6 +109,52 @@ class TestMnemonic(unittest.TestCase):
         mn = "abandon abandon abandon"
         self.assertRaises(error.WrongMnemonicLengthError, mnemonic._to_key, mn)
 
+    def test_word_packing(self):
+        rng = random.Random(0)
+        for _ in range(100):
+            key = bytes(rng.getrandbits(8) for _ in range(32))
+            nums = mnemonic._key_to_indexes(key)
+            self.assertEqual(len(nums), constants.mnemonic_len - 1)
+            # bit j of the key is bit j % 11 of word j // 11
+            for j in range(8 * len(key)):
+                self.assertEqual(
+                    (key[j // 8] >> (j % 8)) & 1,
+                    (nums[j // 11] >> (j % 11)) & 1,
+                )
+            self.assertEqual(mnemonic._indexes_to_key(nums), key + b"\x00")
+
+    def test_bulk_conversion(self):
+        keys = [account.generate_account()[0] for _ in range(3)]
+        mns = [mnemonic.from_private_key(k) for k in keys]
+        bad_key = base64.b64encode(bytes(31)).decode()
+        results = mnemonic.from_private_keys(keys + [bad_key])
+        self.assertEqual(results[:3], mns)
+        self.assertIsInstance(results[3], error.WrongKeyBytesLengthError)
+
+        wrong_checksum = " ".join(mns[0].split()[:-1] + ["abandon"])
+        if wrong_checksum == mns[0]:
+            wrong_checksum = " ".join(mns[0].split()[:-1] + ["zoo"])
+        results = mnemonic.to_private_keys(
+            mns + ["abandon abandon", wrong_checksum]
+        )
+        self.assertEqual(results[:3], keys)
+        self.assertIsInstance(results[3], error.WrongMnemonicLengthError)
+        self.assertIsInstance(results[4], error.WrongChecksumError)
+
+        seeds = mnemonic.to_pq_seeds(mns + ["abandon"], b"f1")
+        self.assertEqual(
+            seeds[:3], [mnemonic.to_pq_seed(m, b"f1") for m in mns]
+        )
+        self.assertIsInstance(seeds[3], error.WrongMnemonicLengthError)
+        with self.assertRaises(error.PQSchemeLengthError):
+            mnemonic.to_pq_seeds(mns, b"f")
+
+        # programming errors are raised, not returned as data
+        with self.assertRaises(TypeError):
+            mnemonic.from_private_keys([None])
+        with self.assertRaises(AttributeError):
+            mnemonic.to_private_keys([None])
+
     def test_bytes_wrong_len(self):
         key = bytes([0] * 31)
         self.assertRaises(
@@ -132,7 +183,156 @@ class TestAddress(unittest.TestCase):
         self.assertEqual(pk, account.address_from_private_key(sk))
 
 
+class TestVanityAccounts(unittest.TestCase):
+    def _check(self, acct, prefix, suffix):
+        self.assertTrue(acct.address.startswith(prefix))
+        self.assertTrue(acct.address.endswith(suffix))
+        self.assertEqual(
+            acct.address, account.address_from_private_key(acct.private_key)
+        )
+        self.assertEqual(
+            mnemonic.to_private_key(acct.mnemonic), acct.private_key
+        )
+
+    def test_matcher_agrees_with_encode_address(self):
+        for _ in range(200):
+            pk = SigningKey.generate().verify_key.encode()
+            addr = encoding.encode_address(pk)
+            for n in range(1, 10):
+                self.assertTrue(
+                    account._vanity_matcher(addr[:n], addr[-n:])(pk)
+                )
+            other = "B" if addr[0] == "A" else "A"
+            self.assertFalse(account._vanity_matcher(other, "")(pk))
+
+    def test_generates_matches_in_process(self):
+        stats = []
+        found = list(
+            account.generate_vanity_accounts(
+                "A",
+                "A",
+                count=2,
+                processes=1,
+                batch_size=64,
+                progress=stats.append,
+            )
+        )
+        self.assertEqual(len(found), 2)
+        for acct in found:
+            self._check(acct, "A", "A")
+        self.assertEqual(stats[-1].expected_attempts, 32 * 8)
+        self.assertEqual(stats[-1].attempts, 64 * len(stats))
+        self.assertGreater(stats[-1].rate, 0)
+
+    def test_generates_matches_in_process_pool(self):
+        found = list(
+            account.generate_vanity_accounts(
+                "B", count=3, processes=2, batch_size=64
+            )
+        )
+        self.assertEqual(len(found), 3)
+        for acct in found:
+            self._check(acct, "B", "")
+
+    def test_rejects_impossible_patterns(self):
+        for prefix, suffix in (("0", ""), ("", "B"), ("", "a")):
+            with self.assertRaises(ValueError):
+                account.vanity_expected_attempts(prefix, suffix)
+
+
+class TestAuction(unittest.TestCase):
+    def _bids(self, bidder, n):
+        _, auction_key = account.generate_account()
+        return [
+            auction.Bid(bidder, 10 + i, 260, i, auction_key, 4)
+            for i in range(n)
+        ]
+
+    def test_sign_and_verify_bids(self):
+        sk, addr = account.generate_account()
+        bids = self._bids(addr, 5)
+        expected = [bid.sign(sk) for bid in bids]
+        self.assertEqual(auction.sign_bids(bids, sk), expected)
+        with ThreadPoolExecutor(2) as executor:
+            self.assertEqual(
+                auction.sign_bids(bids, sk, executor, chunk_size=2),
+                expected,
+            )
+            self.assertEqual(
+                auction.verify_bids(expected, executor, chunk_size=2),
+                [True] * 5,
+            )
+        self.assertTrue(expected[0].verify())
+
+    def test_verify_rejects_bad_signatures(self):
+        sk, addr = account.generate_account()
+        other_sk, _ = account.generate_account()
+        bids = self._bids(addr, 3)
+        signed = auction.sign_bids(bids[:1], sk)
+        signed += auction.sign_bids(bids[1:2], other_sk)
+        signed.append(auction.SignedBid(bids[2], "AAAA"))
+        self.assertEqual(auction.verify_bids(signed), [True, False, False])
+        self.assertFalse(signed[1].verify())
+
+
 class TestMsgpack(unittest.TestCase):
+    def test_signed_envelopes_match_dictify(self):
+        sk, addr = account.generate_account()
+        _, other = account.generate_account()
+        gh = base64.b64encode(bytes(32)).decode()
+        sp = transaction.SuggestedParams(1000, 1, 100, gh, flat_fee=True)
+        txn = transaction.PaymentTxn(addr, sp, other, 5, note=b"n")
+        rekeyed = transaction.PaymentTxn(other, sp, addr, 5)
+        msig = transaction.Multisig(1, 2, [addr, other])
+        mtxn = transaction.MultisigTransaction(
+            transaction.PaymentTxn(msig.address(), sp, addr, 5),
+            msig.get_multisig_account(),
+        )
+        mtxn.multisig.subsigs[0].signature = bytes(64)
+        pqsig = transaction.PQSig(b"f1", 1, b"pk" * 20, b"sig" * 20)
+        envelopes = [
+            transaction.SignedTransaction(txn, None),
+            transaction.SignedTransaction(
+                txn, base64.b64encode(bytes(64)).decode()
+            ),
+            transaction.SignedTransaction(
+                rekeyed, base64.b64encode(bytes(64)).decode(), addr
+            ),
+            mtxn,
+            transaction.MultisigTransaction(
+                rekeyed, msig.get_multisig_account()
+            ),
+            transaction.PQSignedTransaction(txn, pqsig),
+            transaction.PQSignedTransaction(rekeyed, pqsig, addr),
+        ]
+        for stxn in envelopes:
+            expected = msgpack.packb(
+                encoding._sort_dict(stxn.dictify()), use_bin_type=True
+            )
+            self.assertEqual(encoding._canonical_msgpack(stxn), expected)
+        for stxn in envelopes[1:]:
+            self.assertEqual(
+                encoding.msgpack_decode(encoding.msgpack_encode(stxn)), stxn
+            )
+
+        # submission sends the same bytes, concatenated
+        sent = []
+        client = algod.AlgodClient("", "http://localhost")
+        client.algod_request = lambda method, req, data=None, **kw: (
+            sent.append(data) or {"txId": "id"}
+        )
+        client.send_transactions(envelopes)
+        self.assertEqual(
+            sent[0],
+            b"".join(
+                base64.b64decode(encoding.msgpack_encode(s)) for s in envelopes
+            ),
+        )
+        client.send_transaction(envelopes[1])
+        self.assertEqual(
+            sent[1], base64.b64decode(encoding.msgpack_encode(envelopes[1]))
+        )
+
     def test_bid(self):
         bid = (
             "gqFigqNiaWSGo2FpZAGjYXVjxCCokNFWl9DCqHrP9trjPICAMGOaRoX/OR+M6tHWh"
@@ -558,6 +758,36 @@ class TestSignBytes(unittest.TestCase):
         # Check that wrong number of bytes returns false in verify function.
         self.assertFalse(util.verify_bytes(bytes(), signature, pk))
 
+    def test_key_holders(self):
+        sk, pk = account.generate_account()
+        messages = [bytes([i]) * 10 for i in range(4)]
+        signer = util.BytesSigner(sk)
+        self.assertEqual(signer.address, pk)
+        signatures = signer.sign_many(messages)
+        self.assertEqual(
+            signatures, [util.sign_bytes(m, sk) for m in messages]
+        )
+        verifier = util.BytesVerifier(pk)
+        self.assertEqual(
+            verifier.verify_many(messages, signatures), [True] * 4
+        )
+        self.assertEqual(
+            verifier.verify_many(messages, signatures[1:] + signatures[:1]),
+            [False] * 4,
+        )
+        with self.assertRaises(ValueError):
+            verifier.verify_many(messages, signatures[1:])
+
+    def test_decoded_public_keys_are_cached(self):
+        sk, pk = account.generate_account()
+        util.verify_bytes(b"a", util.sign_bytes(b"a", sk), pk)
+        self.assertIs(util._bytes_verifier(pk), util._bytes_verifier(pk))
+        self.assertEqual(
+            util._bytes_verifier.cache_info().maxsize, util.KEY_CACHE_SIZE
+        )
+        # private keys are only held by BytesSigner
+        self.assertFalse(hasattr(util, "_bytes_signer"))
+
 
 class TestLogic(unittest.TestCase):
     def test_teal_sign(self):
@@ -582,6 +812,27 @@ class TestLogic(unittest.TestCase):
         res = verify_key.verify(msg, sig1)
         self.assertIsNotNone(res)
 
+    def test_memoized_addresses(self):
+        program = base64.b64decode("ASABASI=")
+        addr = "6Z3C3LDVWGMX23BMSYMANACQOSINPFIRF77H7N3AWJZYV6OH6GWTJKVMXY"
+        self.assertEqual(logic.address(program), addr)
+        self.assertEqual(logic.address(bytearray(program)), addr)
+        other = b"\x01\x20\x01\x03\x22"
+        self.assertEqual(
+            logic.program_addresses([program, other, program]),
+            [addr, logic.address(other), addr],
+        )
+
+        app_addrs = logic.get_application_addresses([1, 2, 1])
+        self.assertEqual(app_addrs[0], app_addrs[2])
+        self.assertNotEqual(app_addrs[0], app_addrs[1])
+        expected = encoding.encode_address(
+            encoding.checksum(constants.APPID_PREFIX + (1).to_bytes(8, "big"))
+        )
+        self.assertEqual(app_addrs[0], expected)
+        with self.assertRaises(AssertionError):
+            logic.get_application_addresses([1, "2"])
+
 
 class TestEncoding(unittest.TestCase):
     """
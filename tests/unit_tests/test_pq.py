@@ -2,15 +2,21 @@ import base64
 import copy
 import json
 import os
+import tempfile
 import unittest
 
 import msgpack
 
 from algosdk import constants, encoding, error, mnemonic, transaction
-from algosdk.ed25519_check import is_ed25519_point
+from algosdk.ed25519_check import are_ed25519_points, is_ed25519_point
 from algosdk.atomic_transaction_composer import LogicSigTransactionSigner
-from algosdk.signer import Falcon1024AlgorandSigner
-from algosdk.transaction import LogicSigAccount, PQSig
+from algosdk.signer import Falcon1024AlgorandSigner, PQKeyCache
+from algosdk.transaction import (
+    LogicSigAccount,
+    PQSig,
+    retrieve_from_file,
+    write_to_file,
+)
 
 DATA_DIR = os.path.join(os.path.dirname(__file__), "pq_test_data")
 
@@ -55,6 +61,40 @@ class TestEd25519PointCheck(unittest.TestCase):
         self.assertFalse(is_ed25519_point(b"\x00" * 31))
         self.assertFalse(is_ed25519_point(b"\x00" * 33))
 
+    def test_matches_square_root_formula(self):
+        # reference: the explicit square-root candidate check the predicate
+        # used to compute, with three exponentiations
+        p = 2**255 - 19
+        d = (-121665 * pow(121666, p - 2, p)) % p
+
+        def reference(value):
+            y = (int.from_bytes(value, "little") & ((1 << 255) - 1)) % p
+            u = (y * y - 1) % p
+            v = (d * y * y + 1) % p
+            x = (
+                u * pow(v, 3, p) * pow(u * pow(v, 7, p) % p, (p - 5) // 8, p)
+            ) % p
+            vxx = (v * x * x) % p
+            return vxx == u % p or vxx == (-u) % p
+
+        values = [os.urandom(32) for _ in range(500)]
+        # edge encodings: y = 0, 1, p - 1, p, p + 1 and all ones
+        for y in (0, 1, p - 1, p, p + 1, 2**255 - 1):
+            values.append(y.to_bytes(32, "little"))
+            values.append((y | (1 << 255)).to_bytes(32, "little"))
+        expected = [reference(v) for v in values]
+        self.assertEqual([is_ed25519_point(v) for v in values], expected)
+        self.assertEqual(are_ed25519_points(values), expected)
+        # both outcomes are exercised
+        self.assertIn(True, expected)
+        self.assertIn(False, expected)
+
+    def test_batch_checks_length(self):
+        self.assertEqual(
+            are_ed25519_points([b"\x00" * 31, b"\x01" + b"\x00" * 31]),
+            [False, True],
+        )
+
 
 class TestPQAddressDerivation(unittest.TestCase):
     def test_address_matches_go_algorand_fixture(self):
@@ -129,6 +169,33 @@ class TestPQAddressDerivation(unittest.TestCase):
         self.assertEqual(raw["pqsig"]["slt"], salt)
         self.assertEqual(encoding.msgpack_decode(blob).pqsig.salt, salt)
 
+    def test_derivation_is_cached_by_key_hash(self):
+        scheme = constants.falcon_1024_scheme
+        pubkey = base64.b64decode(_load("pqMnemonic.json")["publicKey"])
+        encoding._pq_address_cache.clear()
+        address, salt = encoding.address_from_pq_key(scheme, pubkey)
+        key = (scheme, encoding.checksum(pubkey))
+        self.assertEqual(encoding._pq_address_cache[key], (address, salt))
+        # a cached key still validates signature salts
+        pqsig = PQSig(scheme, salt, pubkey, b"sig")
+        self.assertEqual(encoding.address_from_pq_sig(pqsig), address)
+        pqsig.salt = (salt + 1) % 256
+        with self.assertRaises(error.InvalidPQSaltError):
+            encoding.address_from_pq_sig(pqsig)
+        # the scheme is part of the key
+        encoding.address_from_pq_key(b"x1", pubkey)
+        self.assertEqual(len(encoding._pq_address_cache), 2)
+
+    def test_cache_is_bounded(self):
+        encoding._pq_address_cache.clear()
+        limit = encoding.PQ_ADDRESS_CACHE_SIZE
+        for i in range(limit + 5):
+            encoding.address_from_pq_key(b"x1", i.to_bytes(4, "big"))
+        self.assertEqual(len(encoding._pq_address_cache), limit)
+        # the oldest entries were evicted first
+        oldest = (b"x1", encoding.checksum((0).to_bytes(4, "big")))
+        self.assertNotIn(oldest, encoding._pq_address_cache)
+
 
 class TestPQMnemonicSeed(unittest.TestCase):
     def test_seed_matches_go_algorand_fixture(self):
@@ -255,6 +322,152 @@ class TestPQAlgorandSigner(unittest.TestCase):
         self.assertEqual(recovered[0], stxn)
         self.assertEqual(encoding.msgpack_encode(recovered[0]), blob)
 
+    def test_compact_file_stores_each_key_once(self):
+        _, stxn, blob, _ = self._run("pqRekeyedPayment.json")
+        other = copy.deepcopy(stxn)
+        other.transaction.note = b"second"
+        delegated = TestPQDelegatedLogicSig()._run("pqDelegatedPayment.json")
+        lstxn = delegated[1]
+        txns = [stxn, other, lstxn, stxn.transaction]
+        with tempfile.TemporaryDirectory() as d:
+            full, compact = os.path.join(d, "full"), os.path.join(d, "compact")
+            write_to_file(txns, full)
+            write_to_file(txns, compact, compact=True)
+            # stxn and other share a key, stored once
+            key_len = len(stxn.pqsig.public_key)
+            self.assertLess(
+                os.path.getsize(compact), os.path.getsize(full) - key_len
+            )
+            # a second compact section appended with its own key table
+            write_to_file([other], compact, overwrite=False, compact=True)
+            recovered = retrieve_from_file(compact)
+        self.assertEqual(recovered, txns + [other])
+        # re-encoding restores the canonical bytes
+        self.assertEqual(encoding.msgpack_encode(recovered[0]), blob)
+        # decoded signatures share one interned key
+        self.assertIs(
+            recovered[0].pqsig.public_key, recovered[1].pqsig.public_key
+        )
+        self.assertIs(
+            recovered[0].pqsig.public_key, recovered[4].pqsig.public_key
+        )
+
+    def test_compact_file_key_table_is_checked(self):
+        _, stxn, _, _ = self._run("pqPayment.json")
+        with tempfile.TemporaryDirectory() as d:
+            path = os.path.join(d, "compact")
+            write_to_file([stxn], path, compact=True)
+            with open(path, "rb") as f:
+                unpacker = msgpack.Unpacker(f, raw=False)
+                _, record = list(unpacker)
+            for records in ([record], [{"pqkeys": []}, record]):
+                with open(path, "wb") as f:
+                    for r in records:
+                        f.write(msgpack.packb(r, use_bin_type=True))
+                with self.assertRaises(ValueError):
+                    retrieve_from_file(path)
+            with open(path, "wb") as f:
+                f.write(msgpack.packb({"pqkeys": 1}, use_bin_type=True))
+            with self.assertRaises(ValueError):
+                retrieve_from_file(path)
+
+    def test_decoded_public_keys_are_interned(self):
+        _, stxn, blob, _ = self._run("pqPayment.json")
+        a = encoding.msgpack_decode(blob)
+        b = encoding.msgpack_decode(blob)
+        self.assertIsNot(a, b)
+        self.assertIs(a.pqsig.public_key, b.pqsig.public_key)
+
+
+class TestPQKeyCache(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.path = os.path.join(tmp.name, "keys.json")
+        self.mn = _load("pqMnemonic.json")["mnemonic"]
+        self.pk = base64.b64decode(
+            _load("pqPayment.json")["signer"]["pqSigner"]["pk"]
+        )
+        self.seeds = []
+
+    def _derive(self, seed):
+        self.seeds.append(seed)
+        return self.pk
+
+    def test_persists_across_instances(self):
+        scheme = constants.falcon_1024_scheme
+        expected = (self.pk,) + encoding.address_from_pq_key(scheme, self.pk)
+        cache = PQKeyCache(self.path)
+        self.assertIsNone(cache.get(self.mn, scheme))
+        self.assertEqual(
+            cache.get_or_derive(self.mn, scheme, self._derive), expected
+        )
+        self.assertEqual(
+            cache.get_or_derive(self.mn, scheme, self._derive), expected
+        )
+        self.assertEqual(self.seeds, [mnemonic.to_pq_seed(self.mn, scheme)])
+
+        # a restarted service reads the entry back without deriving it
+        encoding._pq_address_cache.clear()
+        reloaded = PQKeyCache(self.path)
+        self.assertEqual(reloaded.get(self.mn, scheme), expected)
+        self.assertEqual(len(encoding._pq_address_cache), 1)
+        # and the file does not contain the mnemonic or its seed
+        with open(self.path) as f:
+            contents = f.read()
+        self.assertNotIn(self.mn.split()[0], contents)
+        self.assertNotIn(
+            base64.b64encode(mnemonic.to_pq_seed(self.mn, scheme)).decode(),
+            contents,
+        )
+
+    def test_entries_are_appended_and_checked(self):
+        scheme = constants.falcon_1024_scheme
+        PQKeyCache(self.path).get_or_derive(self.mn, scheme, self._derive)
+        with open(self.path) as f:
+            header, line = f.read().splitlines()
+        entry = json.loads(line)
+
+        # an entry cut short by a crash is dropped
+        with open(self.path, "a") as f:
+            f.write(line[:-10])
+        encoding._pq_address_cache.clear()
+        self.assertIsNotNone(PQKeyCache(self.path).get(self.mn, scheme))
+        with open(self.path) as f:
+            self.assertEqual(f.read().splitlines(), [header, line])
+
+        # a tampered entry is rejected rather than cached
+        other = encoding.encode_address(bytes(32))
+        with open(self.path, "w") as f:
+            f.write(header + "\n")
+            f.write(json.dumps(dict(entry, address=other)) + "\n")
+        encoding._pq_address_cache.clear()
+        with self.assertRaises(ValueError):
+            PQKeyCache(self.path)
+        self.assertNotEqual(
+            encoding.address_from_pq_key(scheme, self.pk)[0], other
+        )
+
+    def test_signer_from_cache(self):
+        cache = PQKeyCache(self.path)
+        with self.assertRaises(KeyError):
+            Falcon1024AlgorandSigner.from_key_cache(
+                cache, self.mn, lambda data: b""
+            )
+        signer = Falcon1024AlgorandSigner.from_key_cache(
+            cache, self.mn, lambda data: b"", derive_public_key=self._derive
+        )
+        ref = Falcon1024AlgorandSigner(self.pk, lambda data: b"")
+        self.assertEqual(signer.public_key, self.pk)
+        self.assertEqual(
+            (signer.address, signer.salt), (ref.address, ref.salt)
+        )
+        signer = Falcon1024AlgorandSigner.from_key_cache(
+            PQKeyCache(self.path), self.mn, lambda data: b""
+        )
+        self.assertEqual(signer.address, ref.address)
+        self.assertEqual(len(self.seeds), 1)
+
 
 class TestPQDelegatedLogicSig(unittest.TestCase):
     def _run(self, fixture_name):
@@ -1,5 +1,8 @@
+import asyncio
 import base64
+import threading
 import unittest
+from concurrent.futures import ThreadPoolExecutor
 
 from nacl.signing import SigningKey
 
@@ -18,6 +21,7 @@ from algosdk.atomic_transaction_composer import (
     sign_transaction_with_signer,
 )
 from algosdk.signer import (
+    _CallbackSigner,
     Ed25519MultisigAlgorandSigner,
     Ed25519AlgorandSigner,
     Falcon1024AlgorandSigner,
@@ -87,6 +91,119 @@ class TestEd25519AlgorandSigner(unittest.TestCase):
         self.assertEqual(signed[0].transaction, txns[0])
         self.assertEqual(signed[1].transaction, txns[2])
 
+    def test_batch_signer_signs_group_in_one_call(self):
+        sk, addr = account.generate_account()
+        pk = encoding.decode_address(addr)
+        txns = [PaymentTxn(addr, _sp(), addr, i) for i in range(3)]
+        raw = _raw(sk)
+        calls = []
+
+        def batch(preimages):
+            calls.append(preimages)
+            return [raw(p) for p in preimages]
+
+        got = Ed25519AlgorandSigner(pk, batch_signer=batch).sign_transactions(
+            txns, [0, 1, 2]
+        )
+        ref = AccountTransactionSigner(sk).sign_transactions(txns, [0, 1, 2])
+        self.assertEqual(calls, [[t.bytes_to_sign() for t in txns]])
+        self.assertEqual(
+            [encoding.msgpack_encode(s) for s in got],
+            [encoding.msgpack_encode(s) for s in ref],
+        )
+
+    def test_async_signing_equivalence(self):
+        sk, addr = account.generate_account()
+        pk = encoding.decode_address(addr)
+        txns = [PaymentTxn(addr, _sp(), addr, i) for i in range(3)]
+        raw = _raw(sk)
+
+        async def sign_one(data):
+            return raw(data)
+
+        async def sign_batch(preimages):
+            return [raw(p) for p in preimages]
+
+        ref = [
+            encoding.msgpack_encode(s)
+            for s in AccountTransactionSigner(sk).sign_transactions(
+                txns, [0, 2]
+            )
+        ]
+        signers = [
+            Ed25519AlgorandSigner(pk, raw),
+            Ed25519AlgorandSigner(pk, async_signer=sign_one),
+            Ed25519AlgorandSigner(pk, async_batch_signer=sign_batch),
+        ]
+        for signer in signers:
+            got = asyncio.run(signer.sign_transactions_async(txns, [0, 2]))
+            self.assertEqual([encoding.msgpack_encode(s) for s in got], ref)
+        # an async-only signer still serves the synchronous interface
+        got = signers[1].sign_transactions(txns, [0, 2])
+        self.assertEqual([encoding.msgpack_encode(s) for s in got], ref)
+
+    def test_chunked_signer_streams_transaction(self):
+        sk, addr = account.generate_account()
+        pk = encoding.decode_address(addr)
+        txn = transaction.ApplicationCallTxn(
+            addr,
+            _sp(),
+            1,
+            transaction.OnComplete.NoOpOC,
+            app_args=[bytes(300)],
+        )
+        raw = _raw(sk)
+        sizes = []
+
+        def chunked(chunks):
+            parts = []
+            for chunk in chunks:
+                self.assertIsInstance(chunk, memoryview)
+                sizes.append(len(chunk))
+                parts.append(bytes(chunk))
+            return raw(b"".join(parts))
+
+        signer = Ed25519AlgorandSigner(
+            pk, chunked_signer=chunked, chunk_size=128
+        )
+        got = signer.sign_transactions([txn], [0])[0]
+        ref = AccountTransactionSigner(sk).sign_transactions([txn], [0])[0]
+        self.assertEqual(
+            encoding.msgpack_encode(got), encoding.msgpack_encode(ref)
+        )
+        self.assertLessEqual(max(sizes), 128)
+        self.assertEqual(sum(sizes), len(txn.bytes_to_sign()))
+        got = asyncio.run(signer.sign_transactions_async([txn], [0]))[0]
+        self.assertEqual(
+            encoding.msgpack_encode(got), encoding.msgpack_encode(ref)
+        )
+        # non-transaction preimages are chunked the same way
+        self.assertEqual(
+            signer.sign_bytes(b"hello"),
+            Ed25519AlgorandSigner(pk, raw).sign_bytes(b"hello"),
+        )
+
+    def test_requires_a_callback(self):
+        _, addr = account.generate_account()
+        with self.assertRaises(ValueError):
+            Ed25519AlgorandSigner(encoding.decode_address(addr))
+
+    def test_incomplete_subclass_cannot_be_created(self):
+        class Incomplete(_CallbackSigner):
+            pass
+
+        with self.assertRaises(TypeError):
+            Incomplete(signer=lambda data: b"")
+
+    def test_batch_signer_count_mismatch_raises(self):
+        _, addr = account.generate_account()
+        txn = PaymentTxn(addr, _sp(), addr, 1000)
+        signer = Ed25519AlgorandSigner(
+            encoding.decode_address(addr), batch_signer=lambda p: []
+        )
+        with self.assertRaises(ValueError):
+            signer.sign_transactions([txn], [0])
+
     def test_transaction_signer_rekeyed_equivalence(self):
         # signer key differs from the txn sender (rekeyed account): the
         # signer's own address must be attached as the auth address
@@ -279,6 +396,185 @@ class TestEd25519MultisigAlgorandSigner(unittest.TestCase):
             encoding.msgpack_encode(got), encoding.msgpack_encode(ref)
         )
 
+    def test_async_equivalence_with_sk_signer(self):
+        sk1, a1 = account.generate_account()
+        sk2, a2 = account.generate_account()
+        msig = Multisig(1, 2, [a1, a2])
+        txns = [PaymentTxn(msig.address(), _sp(), a1, i) for i in range(2)]
+        # MultisigTransactionSigner shares one Multisig across a group, so
+        # sign the reference one transaction at a time
+        ref = [
+            MultisigTransactionSigner(
+                msig.get_multisig_account(), [sk1, sk2]
+            ).sign_transactions(txns, [i])[0]
+            for i in range(2)
+        ]
+        raw2 = _raw(sk2)
+
+        async def sign_batch(preimages):
+            return [raw2(p) for p in preimages]
+
+        signers = [
+            Ed25519AlgorandSigner(encoding.decode_address(a1), _raw(sk1)),
+            Ed25519AlgorandSigner(
+                encoding.decode_address(a2), async_batch_signer=sign_batch
+            ),
+        ]
+        got = asyncio.run(
+            Ed25519MultisigAlgorandSigner(
+                msig.get_multisig_account(), signers
+            ).sign_transactions_async(txns, [0, 1])
+        )
+        self.assertEqual(
+            [encoding.msgpack_encode(s) for s in got],
+            [encoding.msgpack_encode(s) for s in ref],
+        )
+
+    def test_executor_equivalence_and_single_batch_per_member(self):
+        sk1, a1 = account.generate_account()
+        sk2, a2 = account.generate_account()
+        msig = Multisig(1, 2, [a1, a2])
+        txns = [PaymentTxn(msig.address(), _sp(), a1, i) for i in range(3)]
+        calls = []
+
+        def batch_of(sk):
+            raw = _raw(sk)
+
+            def batch(preimages):
+                calls.append(preimages)
+                return [raw(p) for p in preimages]
+
+            return batch
+
+        signers = [
+            Ed25519AlgorandSigner(
+                encoding.decode_address(a), batch_signer=batch_of(sk)
+            )
+            for sk, a in ((sk1, a1), (sk2, a2))
+        ]
+        with ThreadPoolExecutor(2) as executor:
+            got = Ed25519MultisigAlgorandSigner(
+                msig.get_multisig_account(), signers, executor=executor
+            ).sign_transactions(txns, [0, 1, 2])
+        ref = [
+            MultisigTransactionSigner(
+                msig.get_multisig_account(), [sk1, sk2]
+            ).sign_transactions(txns, [i])[0]
+            for i in range(3)
+        ]
+        self.assertEqual(
+            [encoding.msgpack_encode(s) for s in got],
+            [encoding.msgpack_encode(s) for s in ref],
+        )
+        # one batch call per member, each covering the whole request
+        self.assertEqual(len(calls), 2)
+        for preimages in calls:
+            self.assertEqual(preimages, [t.bytes_to_sign() for t in txns])
+
+    def test_stop_at_threshold_skips_slow_member(self):
+        sk1, a1 = account.generate_account()
+        sk2, a2 = account.generate_account()
+        msig = Multisig(1, 1, [a1, a2])
+        txn = PaymentTxn(msig.address(), _sp(), a1, 1000)
+        release = threading.Event()
+        raw2 = _raw(sk2)
+
+        def slow(data):
+            release.wait(5)
+            return raw2(data)
+
+        signers = [
+            Ed25519AlgorandSigner(encoding.decode_address(a1), _raw(sk1)),
+            Ed25519AlgorandSigner(encoding.decode_address(a2), slow),
+        ]
+        ref = MultisigTransactionSigner(
+            msig.get_multisig_account(), [sk1]
+        ).sign_transactions([txn], [0])[0]
+        with ThreadPoolExecutor(2) as executor:
+            signer = Ed25519MultisigAlgorandSigner(
+                msig.get_multisig_account(),
+                signers,
+                executor=executor,
+                stop_at_threshold=True,
+            )
+            got = signer.sign_transactions([txn], [0])[0]
+            self.assertFalse(release.is_set())
+            release.set()
+        self.assertEqual(
+            encoding.msgpack_encode(got), encoding.msgpack_encode(ref)
+        )
+
+        # the asynchronous path cancels the member still in flight
+        async def never(data):
+            await asyncio.Event().wait()
+
+        signers[1] = Ed25519AlgorandSigner(
+            encoding.decode_address(a2), async_signer=never
+        )
+        got = asyncio.run(
+            Ed25519MultisigAlgorandSigner(
+                msig.get_multisig_account(), signers, stop_at_threshold=True
+            ).sign_transactions_async([txn], [0])
+        )[0]
+        self.assertEqual(
+            encoding.msgpack_encode(got), encoding.msgpack_encode(ref)
+        )
+
+    def test_stop_at_threshold_skips_failed_member(self):
+        keys = [account.generate_account() for _ in range(3)]
+        msig = Multisig(1, 2, [a for _, a in keys])
+        txn = PaymentTxn(msig.address(), _sp(), keys[0][1], 1000)
+
+        def failing(data):
+            raise RuntimeError("backend unavailable")
+
+        async def failing_async(data):
+            raise RuntimeError("backend unavailable")
+
+        def sign(failed, executor=None, asynchronous=False):
+            signers = []
+            for i, (sk, a) in enumerate(keys):
+                pk = encoding.decode_address(a)
+                if i not in failed:
+                    signers.append(Ed25519AlgorandSigner(pk, _raw(sk)))
+                elif asynchronous:
+                    signers.append(
+                        Ed25519AlgorandSigner(pk, async_signer=failing_async)
+                    )
+                else:
+                    signers.append(Ed25519AlgorandSigner(pk, failing))
+            signer = Ed25519MultisigAlgorandSigner(
+                msig.get_multisig_account(),
+                signers,
+                executor=executor,
+                stop_at_threshold=True,
+            )
+            if asynchronous:
+                return asyncio.run(signer.sign_transactions_async([txn], [0]))[
+                    0
+                ]
+            return signer.sign_transactions([txn], [0])[0]
+
+        ref = MultisigTransactionSigner(
+            msig.get_multisig_account(), [keys[1][0], keys[2][0]]
+        ).sign_transactions([txn], [0])[0]
+        with ThreadPoolExecutor(3) as executor:
+            for options in (
+                {},
+                {"executor": executor},
+                {"asynchronous": True},
+            ):
+                with self.subTest(**options):
+                    # the two remaining members still reach the threshold
+                    got = sign({0}, **options)
+                    self.assertEqual(
+                        encoding.msgpack_encode(got),
+                        encoding.msgpack_encode(ref),
+                    )
+                    # one remaining member cannot
+                    with self.assertRaises(RuntimeError):
+                        sign({0, 2}, **options)
+
     def test_unknown_member_raises(self):
         _, a1 = account.generate_account()
         _, a2 = account.generate_account()
@@ -39,6 +39,26 @@ class TestPaymentTransaction(unittest.TestCase):
         txn = transaction.PaymentTxn(address, sp, address, 1000, note=b"\x00")
         self.assertEqual(100, txn.fee)
 
+    def test_preimage_chunks(self):
+        address = "7ZUECA7HFLZTXENRV24SHLU4AVPUTMTTDUFUBNBD64C73F3UHRTHAIOF6Q"
+        gh = "JgsgCaCTqIaLeVhyL6XlRu3n7Rfk2FxMeK+wRSaQ7dI="
+        sp = transaction.SuggestedParams(0, 1, 100, gh)
+        txn = transaction.PaymentTxn(address, sp, address, 1000, note=b"x")
+        expected = constants.txid_prefix + base64.b64decode(
+            encoding.msgpack_encode(txn)
+        )
+        self.assertEqual(txn.bytes_to_sign(), expected)
+        whole = list(txn.preimage_chunks())
+        self.assertEqual(len(whole), 2)
+        self.assertEqual(b"".join(whole), expected)
+        chunks = list(txn.preimage_chunks(16))
+        self.assertTrue(all(isinstance(c, memoryview) for c in chunks))
+        self.assertTrue(all(len(c) <= 16 for c in chunks))
+        self.assertEqual(b"".join(chunks), expected)
+        # raised by the call itself, not on the first chunk
+        with self.assertRaises(ValueError):
+            txn.preimage_chunks(0)
+
     def test_note_wrong_type(self):
         address = "7ZUECA7HFLZTXENRV24SHLU4AVPUTMTTDUFUBNBD64C73F3UHRTHAIOF6Q"
         gh = "JgsgCaCTqIaLeVhyL6XlRu3n7Rfk2FxMeK+wRSaQ7dI="